@@ -0,0 +1,118 @@
+"""Script to benchmark ChunkingPipe engines.
+
+This script chunks synthetic long cables with the legacy row-by-row engine
+and the offset-based engine, checks that both produce identical output and
+reports the time taken by each.
+
+Functions:
+    build_cables: Builds a DataFrame of synthetic long cables.
+    benchmark: Measures the best run time of each engine.
+    main: Main function to run the benchmark and print the report.
+"""
+
+import argparse
+import random
+import time
+from typing import Dict
+
+import pandas as pd
+
+from thinking_dataset.pipeworks.pipes.chunking_pipe import ChunkingPipe
+
+__version__ = "0.0.1"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+WORDS = ("embassy cable minister talks agreement delegation report "
+         "security trade sanctions ambassador confidential").split()
+
+
+def build_cables(rows: int, length: int, seed: int = 0) -> pd.DataFrame:
+    """Builds a DataFrame of synthetic long cables.
+
+    Args:
+        rows (int): Number of cables.
+        length (int): Approximate number of characters per cable.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: Cables with an id and a cable column.
+    """
+    rng = random.Random(seed)
+    cables = []
+    for _ in range(rows):
+        words = []
+        size = 0
+        while size < length:
+            word = rng.choice(WORDS)
+            words.append(word + ("\n" if rng.random() < 0.05 else " "))
+            size += len(words[-1])
+        cables.append("".join(words))
+    return pd.DataFrame({"id": range(1, rows + 1), "cable": cables})
+
+
+def benchmark(df: pd.DataFrame, max_chunk_size: int, min_chunk_size: int,
+              repeat: int) -> Dict[str, float]:
+    """Measures the best run time of each engine.
+
+    Args:
+        df (pd.DataFrame): Cables to chunk.
+        max_chunk_size (int): Maximum size of each chunk.
+        min_chunk_size (int): Minimum size of each chunk.
+        repeat (int): Runs per engine, the best run is kept.
+
+    Returns:
+        Dict[str, float]: Best time in seconds per engine.
+
+    Raises:
+        AssertionError: If the engines produce different output.
+    """
+    results = {}
+    outputs = {}
+    for engine in ["legacy", "offsets"]:
+        pipe = ChunkingPipe({
+            "columns": ["cable"],
+            "max_chunk_size": max_chunk_size,
+            "min_chunk_size": min_chunk_size,
+            "engine": engine,
+        })
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            outputs[engine] = pipe.flow(df)
+            best = min(best, time.perf_counter() - start)
+        results[engine] = best
+    pd.testing.assert_frame_equal(outputs["legacy"], outputs["offsets"])
+    return results
+
+
+def main() -> None:
+    """Main function to run the benchmark and print the report."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark ChunkingPipe engines.")
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--lengths",
+                        type=int,
+                        nargs="+",
+                        default=[10_000, 100_000, 1_000_000],
+                        help="Cable lengths in characters.")
+    parser.add_argument("--max-chunk-size", type=int, default=2000)
+    parser.add_argument("--min-chunk-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'length':>10} {'rows':>6} {'legacy (s)':>12} "
+          f"{'offsets (s)':>12} {'speedup':>8}")
+    for length in args.lengths:
+        rows = max(1, args.rows * 10_000 // length)
+        df = build_cables(rows, length)
+        results = benchmark(df, args.max_chunk_size, args.min_chunk_size,
+                            args.repeat)
+        speedup = results["legacy"] / results["offsets"]
+        print(f"{length:>10} {rows:>6} {results['legacy']:>12.3f} "
+              f"{results['offsets']:>12.3f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Script to benchmark TextUtils regex backends.
+
+This script runs every TextUtils pattern against adversarial documents on
+each installed regex backend ('re', 'regex', 're2') and reports the
+worst-case latency per backend and pattern.
+
+Functions:
+    build_documents: Builds adversarial documents of a given size.
+    build_steps: Builds the TextUtils steps to benchmark.
+    benchmark: Measures worst-case latency per backend and step.
+    main: Main function to run the benchmark and print the report.
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+from thinking_dataset.utils.regex_backend import ENGINES, RegexBackend
+from thinking_dataset.utils.text_utils import TextUtils
+
+__version__ = "0.0.1"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+
+def build_documents(size: int) -> Dict[str, str]:
+    """Builds adversarial documents of roughly the given size.
+
+    Args:
+        size (int): Approximate number of characters per document.
+
+    Returns:
+        Dict[str, str]: Documents keyed by a short description.
+    """
+    return {
+        "spaced letters": "a " * (size // 2) + "bc",
+        "no subject line": "x" * size,
+        "dotted signoff": ". " * (size // 2) + "x",
+        "dashes": "-" * size,
+        "digits": "a1" * (size // 2),
+        "parentheses": "(ab)" * (size // 4),
+    }
+
+
+def build_steps() -> Dict[str, Callable[[str], str]]:
+    """Builds the TextUtils steps to benchmark.
+
+    Returns:
+        Dict[str, Callable[[str], str]]: Steps keyed by pattern name.
+    """
+    terms = {"usa": "united states of america", "un": "united nations"}
+    contractions = {"don't": "do not", "it's": "it is"}
+    return {
+        "remove_header": TextUtils.remove_header,
+        "remove_signoff": TextUtils.remove_signoff,
+        "remove_separators": TextUtils.remove_separators,
+        "remove_period_patterns": TextUtils.remove_period_patterns,
+        "normalize_numbers": TextUtils.normalize_numbers,
+        "normalize_spaced_characters": TextUtils.normalize_spaced_characters,
+        "remove_tiny_parentheses_content":
+        TextUtils.remove_tiny_parentheses_content,
+        "expand_terms": lambda text: TextUtils.expand_terms(text, terms),
+        "expand_contractions":
+        lambda text: TextUtils.expand_contractions(text, contractions),
+        "remove_whitespace": TextUtils.remove_whitespace,
+    }
+
+
+def benchmark(backends: List[str], size: int,
+              repeat: int) -> Dict[str, Dict[str, float]]:
+    """Measures the worst-case latency per backend and step.
+
+    Args:
+        backends (List[str]): Backends to benchmark.
+        size (int): Approximate document size in characters.
+        repeat (int): Runs per document, the best run is kept.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Worst latency in seconds per backend
+            and step, over all adversarial documents.
+    """
+    documents = build_documents(size)
+    steps = build_steps()
+    results = {}
+    for backend in backends:
+        RegexBackend.reset()
+        RegexBackend.configure(backend=backend)
+        results[backend] = {}
+        for name, step in steps.items():
+            worst = 0.0
+            for text in documents.values():
+                best = float("inf")
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    step(text)
+                    best = min(best, time.perf_counter() - start)
+                worst = max(worst, best)
+            results[backend][name] = worst
+    RegexBackend.reset()
+    return results
+
+
+def main() -> None:
+    """Main function to run the benchmark and print the report."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark TextUtils regex backends.")
+    parser.add_argument("--size",
+                        type=int,
+                        default=200_000,
+                        help="Adversarial document size in characters.")
+    parser.add_argument("--repeat",
+                        type=int,
+                        default=3,
+                        help="Runs per document (best is kept).")
+    args = parser.parse_args()
+
+    backends = [
+        engine for engine in ENGINES if RegexBackend.available(engine)
+    ]
+    results = benchmark(backends, args.size, args.repeat)
+
+    steps = list(build_steps())
+    width = max(len(step) for step in steps)
+    print(f"Worst-case latency (ms) for {args.size} character documents")
+    print(f"{'pattern':<{width}} " +
+          " ".join(f"{backend:>10}" for backend in backends))
+    for step in steps:
+        row = " ".join(f"{results[backend][step] * 1000:>10.2f}"
+                       for backend in backends)
+        print(f"{step:<{width}} {row}")
+    totals = " ".join(f"{sum(results[backend].values()) * 1000:>10.2f}"
+                      for backend in backends)
+    print(f"{'total':<{width}} {totals}")
+
+
+if __name__ == "__main__":
+    main()
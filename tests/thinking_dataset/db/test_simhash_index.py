@@ -0,0 +1,113 @@
+"""
+@file tests/thinking_dataset/db/test_simhash_index.py
+@description Unit tests for the banded SimHash output index.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import random
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from thinking_dataset.db.simhash_index import SimHashIndex
+from thinking_dataset.utils.hash_utils import HashUtils
+
+TEXT = ("<thinking>The cable describes a tense negotiation between the two "
+        "delegations on the fisheries agreement.</thinking>")
+
+
+@pytest.fixture
+def session():
+    """
+    An in-memory SQLite session.
+    """
+    with Session(create_engine("sqlite://")) as session:
+        yield session
+
+
+def test_finds_near_duplicate_within_distance(session):
+    """
+    Indexed outputs are found by bit-flipped hashes up to the distance.
+    """
+    index = SimHashIndex(session, "cables_simhash", bands=8, distance=5)
+    simhash = HashUtils.simhash(TEXT)
+    index.add("thinking", 1, simhash)
+    session.commit()
+
+    assert index.find("thinking", simhash ^ 0b10101) == "1"
+    assert index.find("thinking", simhash ^ 0b111111) is None
+    assert index.find("reasoning", simhash) is None
+    assert index.find("thinking", simhash, exclude=1) is None
+
+
+def test_add_replaces_previous_entry(session):
+    """
+    Regenerating a row replaces its indexed hash.
+    """
+    index = SimHashIndex(session, "cables_simhash")
+    index.add("thinking", 1, HashUtils.simhash(TEXT))
+    index.add("thinking", 1, (1 << 64) - 1)
+
+    assert index.find("thinking", HashUtils.simhash(TEXT)) is None
+    assert index.find("thinking", (1 << 64) - 1) == "1"
+
+
+def test_multi_probe_finds_every_distance(session):
+    """
+    Fewer bands than the distance still find every hash within it, and
+    nothing beyond it.
+    """
+    index = SimHashIndex(session, "cables_simhash")
+    simhash = HashUtils.simhash(TEXT)
+    index.add("thinking", 1, simhash)
+    rng = random.Random(7)
+
+    assert index.bands == 3 and index.flips == 1
+    for distance in range(6):
+        for _ in range(20):
+            bits = rng.sample(range(64), distance)
+            flipped = simhash ^ sum(1 << bit for bit in bits)
+            assert index.find("thinking", flipped) == "1"
+    assert index.find("thinking", simhash ^ 0b111111) is None
+
+
+@pytest.mark.parametrize("bands, distance", [(2, 5), (4, 15)])
+def test_wide_probes_stay_within_variable_limit(session, bands, distance):
+    """
+    Probe sets near MAX_PROBES are split into statements below the
+    variable limit of older SQLite builds.
+    """
+    index = SimHashIndex(session, "cables_simhash", bands, distance)
+    simhash = HashUtils.simhash(TEXT)
+    index.add("thinking", 1, simhash)
+    variables = []
+    event.listen(session.bind, "before_cursor_execute",
+                 lambda *args: variables.append(len(args[3])))
+    flipped = simhash ^ sum(1 << bit * (64 // distance)
+                            for bit in range(distance))
+
+    assert index.find("thinking", flipped, exclude=2) == "1"
+    assert len(variables) > 1 and max(variables) <= 999
+    assert index.find("thinking", flipped ^ (1 << 63)) is None
+
+
+def test_invalid_bands_are_rejected(session):
+    """
+    Single bands, probe explosions and changed layouts are rejected.
+    """
+    with pytest.raises(ValueError):
+        SimHashIndex(session, "cables_simhash", bands=1, distance=0)
+    with pytest.raises(ValueError):
+        SimHashIndex(session, "cables_simhash", bands=2, distance=20)
+
+    SimHashIndex(session, "cables_simhash", bands=8, distance=5)
+    with pytest.raises(ValueError, match="built with 8 bands"):
+        SimHashIndex(session, "cables_simhash", bands=3, distance=5)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,93 @@
+"""
+@file tests/thinking_dataset/io/test_read_plan.py
+@description Unit tests for read plans and projected file reads.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import pandas as pd
+import pytest
+from thinking_dataset.io.read_plan import ReadPlan
+from thinking_dataset.pipeworks.pipes import (
+    AddIdPipe,
+    DropColumnsPipe,
+    RemapColumnsPipe,
+    SubsetPipe,
+)
+from thinking_dataset.utils.command_utils import CommandUtils
+
+
+def make_pipes(rows):
+    return [
+        SubsetPipe({
+            "rows": rows,
+            "columns": ["all"]
+        }),
+        AddIdPipe({}),
+        DropColumnsPipe({"columns": ["file_name"]}),
+        RemapColumnsPipe({
+            "column_mapping": {
+                "pdf_content": "cable"
+            },
+            "column_order": ["id", "cable"]
+        }),
+    ]
+
+
+@pytest.fixture
+def source():
+    return pd.DataFrame({
+        "file_name": [f"file-{i}.pdf" for i in range(100)],
+        "pdf_content": [f"text {i} " * (i % 7 + 1) for i in range(100)],
+        "pages": list(range(100)),
+    })
+
+
+def test_plan_composes_ranges_and_stops_at_positional_columns():
+    plan = ReadPlan(["a", "b", "c"])
+    assert plan.limit(10, 50)
+    assert plan.limit(5, 100)
+    assert plan.rows == (15, 50)
+
+    plan.add("id", positional=True)
+    assert not plan.limit(0, 5)
+    plan.drop(["b"])
+    plan.rename({"c": "d"})
+    assert plan.columns == ["id", "a", "d"]
+    assert plan.source_columns() == ["a", "c"]
+    assert plan.projected
+
+
+@pytest.mark.parametrize("dataset_type", ["parquet", "csv"])
+@pytest.mark.parametrize("rows", [[0, 30], [25, 60], [90, 200], ["all"]])
+def test_pushdown_matches_full_read(tmp_path, source, dataset_type, rows):
+    path = tmp_path / f"data.{dataset_type}"
+    if dataset_type == "parquet":
+        source.to_parquet(path, index=False, row_group_size=16)
+    else:
+        source.to_csv(path, index=False)
+
+    expected = CommandUtils.read_data(path, dataset_type)
+    for pipe in make_pipes(rows):
+        expected = pipe.flow(expected)
+
+    pipes = make_pipes(rows)
+    plan = ReadPlan(CommandUtils.read_schema(path, dataset_type))
+    assert all(pipe.pushdown(plan) for pipe in pipes)
+    assert plan.source_columns() == ["pdf_content"]
+
+    df = CommandUtils.read_data(path,
+                                dataset_type,
+                                columns=plan.source_columns(),
+                                rows=plan.rows)
+    for pipe in pipes:
+        df = pipe.flow(df)
+
+    pd.testing.assert_frame_equal(df, expected)
+
+
+if __name__ == "__main__":
+    pytest.main()
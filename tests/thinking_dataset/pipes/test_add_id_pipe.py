@@ -0,0 +1,60 @@
+"""
+@file tests/thinking_dataset/pipes/test_add_id_pipe.py
+@description Unit tests for AddIdPipe integer and hash identifiers.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import pandas as pd
+import pytest
+from thinking_dataset.io.read_plan import ReadPlan
+from thinking_dataset.pipeworks.pipes import AddIdPipe
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "text": ["alpha", "beta", "alpha", "gamma"],
+        "source": ["a", "b", "a", "c"],
+    })
+
+
+def test_int_ids_without_prefix_are_int64(df):
+    result = AddIdPipe({"start_id": 5}).flow(df.copy())
+    assert result["id"].dtype == "int64"
+    assert result["id"].tolist() == [5, 6, 7, 8]
+
+    prefixed = AddIdPipe({"prefix": "row-"}).flow(df.copy())
+    assert prefixed["id"].tolist() == ["row-1", "row-2", "row-3", "row-4"]
+
+
+def test_hash_ids_are_stable_content_hashes(df):
+    pipe = AddIdPipe({"id_type": "hash", "columns": ["text"]})
+    ids = pipe.flow(df.copy())["id"]
+    shuffled = pipe.flow(df.iloc[::-1].reset_index(drop=True))["id"]
+
+    assert ids.dtype == "int64"
+    assert ids[0] == ids[2] and ids.nunique() == 3
+    assert sorted(ids) == sorted(shuffled)
+
+
+def test_prefixed_hash_ids_are_hex(df):
+    ids = AddIdPipe({"id_type": "hash", "prefix": "doc-"}).flow(df.copy())
+    assert ids["id"].str.fullmatch(r"doc-[0-9a-f]{16}").all()
+
+
+def test_hash_pushdown_keeps_hashed_columns():
+    plan = ReadPlan(["text", "source", "extra"])
+    plan.limit(0, 10)
+    AddIdPipe({"id_type": "hash", "columns": ["source"]}).pushdown(plan)
+    plan.drop(["source", "extra"])
+
+    assert plan.limit(0, 5)
+    assert plan.source_columns() == ["text", "source"]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,98 @@
+"""
+@file tests/thinking_dataset/pipes/test_chunking_pipe.py
+@description Unit tests for the ChunkingPipe engines.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from thinking_dataset.pipeworks.pipes import ChunkingPipe
+from thinking_dataset.sources.input_source import InputSource
+from thinking_dataset.utils.chunk_index import ChunkIndex
+
+
+@pytest.mark.parametrize("text", [
+    "", "   ", "short", "word " * 40, "  lead and trail   " * 9,
+    "x" * 57, "a " + "y" * 30 + " \n\t " * 5, " " * 10 + "z" * 25
+])
+@pytest.mark.parametrize("sizes", [(0, 0), (10, 0), (10, 4), (16, 20)])
+def test_offsets_match_chunk_text(text, sizes):
+    """
+    Chunk offsets reproduce _chunk_text, including whitespace stripping.
+    """
+    max_size, min_size = sizes
+    offsets = ChunkingPipe._chunk_offsets(text, max_size, min_size)
+    chunks = [text[start:end] for start, end in offsets]
+    assert chunks == ChunkingPipe._chunk_text(text, max_size, min_size)
+
+
+def test_engines_produce_identical_frames():
+    """
+    Both engines chunk a DataFrame into the same rows and values.
+    """
+    df = pd.DataFrame({
+        "id": [1, 2, 3],
+        "cable": ["alpha beta gamma " * 20, "tiny", "delta " * 50],
+        "source": ["a", "b", "c"],
+    })
+    config = {"columns": ["cable"], "max_chunk_size": 50, "min_chunk_size": 10}
+    legacy = ChunkingPipe({**config, "engine": "legacy"}).flow(df)
+    offsets = ChunkingPipe(config).flow(df)
+    pd.testing.assert_frame_equal(legacy, offsets)
+    assert offsets["id"].tolist().count(2) == 1
+
+
+def test_index_output_expands_to_chunk_rows():
+    """
+    The chunk index keeps rows intact and expands to the rows output.
+    """
+    df = pd.DataFrame({
+        "id": [7, 8, 9],
+        "cable": ["alpha beta gamma " * 20, "", "delta " * 50],
+    })
+    config = {"columns": ["cable"], "max_chunk_size": 50, "min_chunk_size": 10}
+    rows = ChunkingPipe(config).flow(df)
+
+    pipe = ChunkingPipe({**config, "output": "index"})
+    assert pipe.flow(df) is df
+    index = pipe.side_tables()[ChunkIndex.SUFFIX]
+    assert index.columns.tolist() == ChunkIndex.COLUMNS
+    assert str(index["start"].dtype) == "int32"
+    pd.testing.assert_frame_equal(ChunkIndex.expand(df, index, "cable"), rows)
+
+
+def test_input_source_samples_chunks_from_index():
+    """
+    Sampled chunks are sliced from parent texts stored in the database.
+    """
+    df = pd.DataFrame({"id": [1, 2], "cable": ["one two three", "four"]})
+    index = pd.DataFrame({
+        "parent_id": [1, 1, 2],
+        "chunk_no": [0, 1, 0],
+        "start": [0, 4, 0],
+        "end": [3, 13, 4]
+    })
+    engine = create_engine("sqlite://")
+    df.to_sql("cables", engine, index=False)
+    index.to_sql(ChunkIndex.table_name("cables"), engine, index=False)
+
+    source = InputSource.from_config({
+        "table": "cables",
+        "column": "cable",
+        "label": "seed",
+        "amount": 3,
+        "chunks": True
+    })
+    with Session(engine) as session:
+        chunks = source.fetch_source(session)
+    assert sorted(source.get_samples(chunks)) == ["four", "one", "two three"]
+
+
+if __name__ == "__main__":
+    pytest.main()
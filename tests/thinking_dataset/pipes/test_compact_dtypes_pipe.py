@@ -0,0 +1,72 @@
+"""
+@file tests/thinking_dataset/pipes/test_compact_dtypes_pipe.py
+@description Unit tests for the CompactDtypesPipe.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from thinking_dataset.pipeworks.pipes import (
+    CompactDtypesPipe,
+    HandleMissingValuesPipe,
+)
+from thinking_dataset.utils.command_utils import CommandUtils
+from thinking_dataset.utils.hash_utils import HashUtils
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "id": np.arange(1, 201, dtype=np.int64),
+        "file_name": [f"file-{i % 4}.pdf" for i in range(200)],
+        "text": [f"document {i} " * 20 for i in range(200)],
+        "mixed": [i if i % 2 else str(i) for i in range(200)],
+        "seed": [None if i % 10 == 0 else "seed" for i in range(200)],
+    })
+
+
+def test_compacts_columns_without_changing_values(df):
+    result = CompactDtypesPipe().flow(df.copy())
+
+    assert result["id"].dtype == "int16"
+    assert isinstance(result["file_name"].dtype, pd.CategoricalDtype)
+    assert isinstance(result["text"].dtype, pd.StringDtype)
+    assert result["mixed"].dtype == object
+    assert result.memory_usage(deep=True).sum() < \
+        df.memory_usage(deep=True).sum()
+    np.testing.assert_array_equal(HashUtils.fingerprint(result),
+                                  HashUtils.fingerprint(df))
+
+
+def test_parquet_round_trip(tmp_path, df):
+    path = tmp_path / "compact.parquet"
+    result = CompactDtypesPipe({"columns": ["id", "file_name", "text"]})
+    result = result.flow(df.drop(columns=["mixed"]))
+    CommandUtils.to(result, path, "parquet")
+
+    restored = CommandUtils.read_data(path, "parquet")
+    assert restored["id"].dtype == result["id"].dtype
+    assert isinstance(restored["file_name"].dtype, pd.CategoricalDtype)
+    assert isinstance(restored["text"].dtype, pd.StringDtype)
+    pd.testing.assert_frame_equal(restored, result, check_dtype=False)
+
+
+def test_missing_values_fill_categorical(df):
+    result = CompactDtypesPipe({"columns": ["seed"]}).flow(df)
+    filled = HandleMissingValuesPipe({
+        "columns": ["seed"],
+        "strategy": "fill",
+        "fill_value": "none"
+    }).flow(result)
+
+    assert filled["seed"].isna().sum() == 0
+    assert (filled["seed"] == "none").sum() == 20
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,142 @@
+"""
+@file tests/thinking_dataset/pipes/test_feature_store_pipe.py
+@description Unit tests for FeatureStorePipe and its feature consumers.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from thinking_dataset.pipeworks.pipes import (AddIdPipe, FeatureStorePipe,
+                                              FilterBySizePipe)
+from thinking_dataset.pipeworks.pipes.pipe import Pipe
+from thinking_dataset.sources.input_source import InputSource
+from thinking_dataset.utils.feature_store import FeatureStore
+from thinking_dataset.utils.hash_utils import HashUtils
+
+
+@pytest.fixture
+def cables():
+    texts = [
+        "short", "ünïcode text", None,
+        "This record is a partial extract of the original cable. The full "
+        "text of the original cable is not available. Body",
+        "short", "a" * 120, "x" * 40
+    ]
+    return with_hash_ids(pd.DataFrame({"text": texts}))
+
+
+def with_hash_ids(df):
+    return AddIdPipe({"id_type": "hash", "columns": ["text"]}).flow(df)
+
+
+@pytest.fixture
+def stored(cables, tmp_path, monkeypatch):
+    pipe = FeatureStorePipe({"columns": ["text"]})
+    pipe.flow(cables)
+    output_file = str(tmp_path / "process" / "cables.parquet")
+    (tmp_path / "process").mkdir()
+    pipe.side_tables()["features"].to_parquet(
+        FeatureStore.file_path(output_file))
+    monkeypatch.setattr(Pipe, "output_file", output_file)
+    return str(tmp_path / "raw.parquet"), pipe.features
+
+
+def test_features_match_direct_computation(cables, stored):
+    features = stored[1]
+    texts = cables["text"].fillna("")
+
+    assert features["id"].tolist() == cables["id"].tolist()
+    assert features["char_length"].tolist() == texts.str.len().tolist()
+    assert features["byte_length"].tolist() == [
+        len(text.encode("utf-8")) for text in texts
+    ]
+    assert (features["token_estimate"] == texts.str.len() / 4).all()
+    assert features["is_partial"].tolist() == [
+        False, False, False, True, False, False, False
+    ]
+    assert features["non_ascii_ratio"].iat[1] == pytest.approx(2 / 12)
+    assert (features["content_hash"].to_numpy().view(np.uint64) ==
+            HashUtils.fingerprint(cables[["text"]])).all()
+
+
+@pytest.mark.parametrize("metric", ["chars", "bytes", "tokens"])
+def test_filter_by_size_reads_stored_sizes(cables, stored, metric):
+    config = {
+        "column_name": "text",
+        "min_size": 2,
+        "max_size": 60,
+        "metric": metric
+    }
+    expected = FilterBySizePipe(config).flow(cables.copy())
+
+    pipe = FilterBySizePipe({**config, "use_features": True})
+    assert pipe.prepare(stored[0], "parquet") == stored[0]
+    assert pipe.features is not None
+    pd.testing.assert_frame_equal(pipe.flow(cables.copy()), expected)
+
+
+def test_changed_texts_are_measured(cables, stored, caplog):
+    """
+    Changed texts get new hash ids, miss the stored sizes and are measured.
+    """
+    changed = cables.drop(columns="id")
+    changed.loc[0, "text"] = "x" * 80
+    changed.loc[5, "text"] = "ab"
+    changed = with_hash_ids(changed)
+    config = {"column_name": "text", "min_size": 3, "max_size": 60}
+    expected = FilterBySizePipe(config).flow(changed.copy())
+
+    pipe = FilterBySizePipe({**config, "use_features": True})
+    pipe.prepare(stored[0], "parquet")
+    result = pipe.flow(changed.copy())
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert result.index.tolist() == [1, 4, 6]
+    assert "Stored sizes used for 5 of 7 rows" in caplog.text
+
+
+def test_missing_features_fall_back(cables, tmp_path, monkeypatch):
+    monkeypatch.setattr(Pipe, "output_file",
+                        str(tmp_path / "other.parquet"))
+    config = {"column_name": "text", "min_size": 3, "use_features": True}
+    pipe = FilterBySizePipe(config)
+    pipe.prepare(str(tmp_path / "raw.parquet"), "parquet")
+
+    assert pipe.features is None
+    assert len(pipe.flow(cables.copy())) == 6
+
+
+def test_input_source_length_bounds(cables):
+    engine = create_engine("sqlite://")
+    cables.to_sql("cables", engine, index=False)
+    source = InputSource.from_config({
+        "table": "cables",
+        "column": "text",
+        "label": "seed",
+        "min_length": 10,
+        "max_length": 100
+    })
+    with Session(engine) as session:
+        texts = source.fetch_source(session)
+
+    assert sorted(texts["text"].str.len()) == [12, 40]
+
+    with pytest.raises(ValueError):
+        InputSource.from_config({
+            "table": "cables",
+            "column": "text",
+            "label": "seed",
+            "min_length": 10,
+            "sampling": "sql"
+        })
+
+
+if __name__ == "__main__":
+    pytest.main()
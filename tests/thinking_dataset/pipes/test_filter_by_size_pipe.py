@@ -0,0 +1,71 @@
+"""
+@file tests/thinking_dataset/pipes/test_filter_by_size_pipe.py
+@description Unit tests for the FilterBySizePipe size metrics.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import pandas as pd
+import pytest
+from thinking_dataset.pipeworks.pipes import FilterBySizePipe
+
+
+@pytest.fixture
+def df():
+    """
+    Rows of 4 characters, 8 UTF-8 bytes, 12 characters and a missing row.
+    """
+    return pd.DataFrame({
+        "id": [1, 2, 3, 4],
+        "cable": ["abcd", "éééé", "x" * 12, None],
+    })
+
+
+@pytest.mark.parametrize("metric, min_size, max_size, expected", [
+    ("chars", 4, 10, [1, 2]),
+    ("bytes", 5, 10, [2]),
+    ("tokens", 2, 0, [3]),
+    ("chars", 0, 4, [1, 2, 4]),
+])
+def test_metrics(df, metric, min_size, max_size, expected):
+    """
+    Each metric filters on its own size, missing values have size 0.
+    """
+    pipe = FilterBySizePipe({
+        "column_name": "cable",
+        "min_size": min_size,
+        "max_size": max_size,
+        "metric": metric,
+        "memory_stats": "off"
+    })
+    assert pipe.flow(df)["id"].tolist() == expected
+
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]"])
+def test_batched_flow_matches_flow(df, dtype):
+    """
+    Filtering batches gives the same rows as one flow, for any storage.
+    """
+    df = df.astype({"cable": dtype})
+    pipe = FilterBySizePipe({
+        "column_name": "cable",
+        "min_size": 5,
+        "metric": "bytes"
+    })
+    batched = pd.concat([pipe.flow(df.iloc[:2]), pipe.flow(df.iloc[2:])])
+    pd.testing.assert_frame_equal(batched, pipe.flow(df))
+
+
+def test_invalid_metric():
+    """
+    Unknown metrics are rejected.
+    """
+    with pytest.raises(ValueError):
+        FilterBySizePipe({"column_name": "cable", "metric": "words"})
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,51 @@
+"""
+@file tests/thinking_dataset/pipes/test_handle_missing_values_pipe.py
+@description Unit tests for HandleMissingValuesPipe text record removal.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import pandas as pd
+import pytest
+from thinking_dataset.pipeworks.pipes import HandleMissingValuesPipe
+from thinking_dataset.utils.text_utils import TextUtils
+
+PARTIAL = ("THIS RECORD IS A PARTIAL EXTRACT OF THE ORIGINAL CABLE. "
+           "THE FULL TEXT OF THE ORIGINAL CABLE IS NOT AVAILABLE. Body")
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "id": [1, 2, 3, 4, 5, 6],
+        "cable": ["full text", "", " \n\t ", PARTIAL, None, "mentions "
+                  "this record is a partial extract of the original cable."],
+    })
+
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]", "category"])
+def test_removes_empty_and_partial_records(df, dtype):
+    df["cable"] = df["cable"].astype(dtype)
+    result = HandleMissingValuesPipe({
+        "columns": ["auto"],
+        "remove_partials": True,
+        "allow_empty": False
+    }).flow(df)
+
+    assert result["id"].tolist() == [1, 6]
+
+
+def test_partial_pattern_matches_text_utils(df):
+    assert TextUtils.remove_partial_extract_intro(PARTIAL) == "Body"
+
+
+def test_defaults_keep_text_records(df):
+    result = HandleMissingValuesPipe({"columns": ["cable"]}).flow(df)
+    assert result["id"].tolist() == [1, 2, 3, 4, 6]
+
+
+if __name__ == "__main__":
+    pytest.main()
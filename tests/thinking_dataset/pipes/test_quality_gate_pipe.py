@@ -0,0 +1,66 @@
+"""
+@file tests/thinking_dataset/pipes/test_quality_gate_pipe.py
+@description Unit tests for the QualityGatePipe.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import pandas as pd
+import pytest
+from thinking_dataset.pipeworks.pipes import QualityGatePipe
+
+PARTIAL = ("This record is a partial extract of the original cable. "
+           "The full text of the original cable is not available. text")
+
+
+@pytest.fixture
+def df():
+    """
+    Rows failing one signal each, plus a clean and a missing row.
+    """
+    return pd.DataFrame({
+        "id": [1, 2, 3, 4, 5, 6],
+        "cable": [
+            "plain words in a normal cable", "ééééé ab", "1234 5678 90",
+            "same\nsame\nsame\nsame", None, PARTIAL
+        ],
+    })
+
+
+def test_rejects_rows_outside_thresholds(df):
+    """
+    Each configured signal rejects its row; missing text passes through.
+    """
+    pipe = QualityGatePipe({
+        "column_name": "cable",
+        "max_non_ascii_ratio": 0.3,
+        "max_digit_ratio": 0.5,
+        "max_repeated_line_ratio": 0.5,
+        "min_mean_word_length": 2.0,
+        "drop_partials": True,
+    })
+    result = pipe.flow(df)
+    assert result["id"].tolist() == [1, 5]
+
+
+def test_no_thresholds_keeps_all_rows(df):
+    """
+    Without thresholds the pipe is a pass-through.
+    """
+    result = QualityGatePipe({"column_name": "cable"}).flow(df)
+    assert len(result) == len(df)
+
+
+def test_invalid_threshold_raises():
+    """
+    Non-numeric thresholds are rejected at construction.
+    """
+    with pytest.raises(ValueError):
+        QualityGatePipe({"column_name": "cable", "max_digit_ratio": "high"})
+
+
+if __name__ == "__main__":
+    pytest.main()
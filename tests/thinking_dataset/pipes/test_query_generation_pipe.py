@@ -0,0 +1,280 @@
+"""
+@file tests/thinking_dataset/pipes/test_query_generation_pipe.py
+@description Unit tests for QueryGenerationPipe source sampling.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import re
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from thinking_dataset.db.template_registry import TemplateRegistry
+from thinking_dataset.decorators import with_db_session
+from thinking_dataset.pipeworks.pipes import QueryGenerationPipe
+from thinking_dataset.pipeworks.pipes.pipe import Pipe
+from thinking_dataset.sources.input_source import InputSource
+from thinking_dataset.sources.query_reference import (QueryReferences,
+                                                      QueryRenderer)
+from thinking_dataset.templates.compiled_template import CompiledTemplate
+
+
+def test_sources_are_fetched_once_per_run():
+    engine = create_engine("sqlite://")
+    pd.DataFrame({
+        "cable": [f"cable {i}" for i in range(20)]
+    }).to_sql("cables", engine, index=False)
+    selects = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda *args: selects.append(args[2])
+                 if "FROM cables" in args[2] else None)
+
+    sources = [
+        InputSource.from_config({
+            "table": "cables",
+            "column": "cable",
+            "label": label,
+            "amount": 2
+        }) for label in ["seed", "topic"]
+    ]
+    pipe = QueryGenerationPipe({})
+    with Session(engine) as session:
+        queries = pipe._generate_queries("{{ seed }}|{{ topic }}", 50,
+                                         sources, session)
+
+    assert len(queries) == 50
+    assert len(selects) == 1
+    assert (queries["seed"].str.count("- cable") == 4).all()
+
+
+def test_seeded_batches_are_repeatable():
+    engine = create_engine("sqlite://")
+    pd.DataFrame({
+        "cable": [f"cable {i} " + "body " * i for i in range(30)]
+    }).to_sql("cables", engine, index=False)
+    source = InputSource.from_config({
+        "table": "cables",
+        "column": "cable",
+        "label": "seed",
+        "amount": 3,
+        "length": 14,
+        "offset": 2,
+        "ellipsis": "..."
+    })
+    pipe = QueryGenerationPipe({"seed": 11})
+    with Session(engine) as session:
+        first = pipe._generate_queries("Q:{{ seed }}", 200, [source], session)
+        second = pipe._generate_queries("Q:{{ seed }}", 200, [source],
+                                        session)
+        data = source.fetch_source(session)
+
+    pd.testing.assert_frame_equal(first, second)
+    source.amount = len(data)
+    expected = set(source.get_samples(data, source.ellipsis))
+    for seed, query in zip(first["seed"], first["query"]):
+        samples = [line[2:] for line in query[3:-1].split("\n")]
+        assert len(set(samples)) == 3 and set(samples) <= expected
+        assert query.strip() == "Q:\n" + seed
+
+
+def test_lazy_references_render_eager_queries():
+    engine = create_engine("sqlite://")
+    pd.DataFrame({
+        "cable": [f"cable {i} " + "body " * i for i in range(40)],
+        "topic": [f"topic {i}" for i in range(40)]
+    }).to_sql("cables", engine, index=False)
+    sources = [
+        InputSource.from_config({
+            "table": "cables",
+            "column": "cable",
+            "label": "seed",
+            "amount": 3,
+            "length": 20,
+            "ellipsis": "..."
+        }),
+        InputSource.from_config({
+            "table": "cables",
+            "column": "topic",
+            "label": "topic",
+            "amount": 1
+        })
+    ]
+    template = "{{ seed }} on {{ topic }}"
+    pipe = QueryGenerationPipe({"seed": 5, "materialize": "lazy"})
+    with Session(engine) as session:
+        eager = pipe._generate_queries(template, 100, sources, session)
+        lazy = pipe._generate_references(template, 100, sources, session,
+                                         "cables")
+        again = pipe._generate_references(template, 100, sources, session,
+                                          "cables")
+        renderer = QueryRenderer(session,
+                                 TemplateRegistry(session, "cables_templates"))
+        rendered = renderer.render(lazy["query"].tolist())
+
+    assert QueryReferences.is_reference(lazy["query"])
+    assert lazy["query"].str.len().max() < 60
+    assert rendered == eager["query"].tolist()
+    assert again["query"].tolist() == lazy["query"].tolist()
+    assert pd.read_sql("SELECT * FROM cables_templates", engine).shape[0] == 1
+
+
+@pytest.mark.parametrize("template", [
+    "{{ seed }}", "a {{seed}} b {{  topic\n}} c {{ seed }}",
+    "{{ seeds }} {{ seed }} {{ other }} {seed}", "no placeholders"
+])
+def test_compiled_template_matches_label_substitution(template):
+    values = {"seed": "- one\n", "seeds": "- two\n", "topic": "- three\n"}
+    expected = template
+    for label, value in values.items():
+        expected = re.sub(r'{{\s*' + re.escape(label) + r'\s*}}',
+                          lambda match, value=value: value, expected)
+
+    compiled = CompiledTemplate(template, list(values))
+    assert compiled.render(values) == expected
+    assert compiled.render_batch([values, values]) == [expected] * 2
+
+
+def test_compiled_template_inserts_values_literally():
+    compiled = CompiledTemplate("{{ seed }}", ["seed"])
+    assert compiled.render({"seed": r"C:\new\1"}) == r"C:\new\1"
+
+
+def test_slots_last_moves_variable_blocks_after_static_ones():
+    template = ("[SYSTEM]\nRole\n\n<!-- @data -->\n<seed>{{ seed }}</seed>"
+                "\n\n\n[DIRECTIVE]\nWrite\n\n<topic>{{topic}}</topic>\n\n"
+                "<output>\n{{ other }}\n</output>\n")
+    reordered = CompiledTemplate.slots_last(template, ["seed", "topic"])
+
+    assert reordered == ("[SYSTEM]\nRole\n\n[DIRECTIVE]\nWrite\n\n"
+                         "<output>\n{{ other }}\n</output>\n\n"
+                         "<!-- @data -->\n<seed>{{ seed }}</seed>\n\n"
+                         "<topic>{{topic}}</topic>\n")
+    compiled = CompiledTemplate(reordered, ["seed", "topic"])
+    first = compiled.render({"seed": "a", "topic": "b"})
+    second = compiled.render({"seed": "c", "topic": "d"})
+    assert first[:first.index("a</seed>")] == \
+        second[:second.index("c</seed>")]
+    assert CompiledTemplate.slots_last(template, []) == template
+
+
+def test_update_writes_only_changed_columns():
+    engine = create_engine("sqlite://")
+    pd.DataFrame({
+        "id": [1, 2, 3],
+        "query": ["old"] * 3,
+        "thinking": ["a", "b", "c"]
+    }).to_sql("cables", engine, index=False)
+    df = pd.DataFrame({
+        "id": [2, 3, 4],
+        "query": ["q2", "q3", "q4"],
+        "seed": ["s2", None, "s4"],
+        "thinking": ["x", "y", "z"]
+    })
+
+    pipe = QueryGenerationPipe({})
+    with Session(engine) as session:
+        pipe._write_to_db(df, session, "cables", "update",
+                          ["id", "query", "seed"])
+
+    result = pd.read_sql("SELECT * FROM cables ORDER BY id", engine)
+    assert result["query"].tolist() == ["old", "q2", "q3", "q4"]
+    assert result["thinking"].tolist() == ["a", "b", "c", None]
+    assert result["seed"].tolist() == [None, "s2", None, "s4"]
+    assert "cables_update" not in pd.read_sql(
+        "SELECT name FROM sqlite_temp_master", engine)["name"].tolist()
+
+
+@pytest.fixture
+def chunked_pipe(monkeypatch, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'chunks.db'}")
+    pd.DataFrame({
+        "cable": [f"cable {i}" for i in range(30)]
+    }).to_sql("source", engine, index=False)
+    template = tmp_path / "template.md"
+    template.write_text("Q: {{ seed }}")
+
+    class ChunkDatabase:
+
+        @contextmanager
+        def get_session(self):
+            with Session(engine) as session:
+                yield session
+
+    monkeypatch.setattr(with_db_session, "Database", ChunkDatabase)
+    monkeypatch.setattr(Pipe, "pipeline_config", {"batch_size": 25})
+    pipe = QueryGenerationPipe({
+        "template": str(template),
+        "seed": 3,
+        "chunk_size": 10,
+        "flush": True,
+        "input": [{
+            "source": {
+                "table": "source",
+                "column": "cable",
+                "label": "seed",
+                "amount": 2
+            }
+        }],
+        "output": [{
+            "source": {
+                "table": "cables",
+                "column": "query"
+            }
+        }]
+    })
+    return pipe, engine
+
+
+def test_chunked_generation_writes_every_block(chunked_pipe):
+    pipe, engine = chunked_pipe
+    df = pipe.flow(pd.DataFrame())
+
+    stored = pd.read_sql("SELECT * FROM cables ORDER BY id", engine)
+    assert stored["id"].tolist() == list(range(1, 26))
+    assert df["id"].tolist() == list(range(1, 26))
+    assert stored["query"].str.count("- cable").eq(2).all()
+    with Session(engine) as session:
+        rendered = QueryRenderer(session).render(df["query"].tolist())
+    assert rendered == stored["query"].tolist()
+
+
+def test_chunked_generation_releases_written_blocks(chunked_pipe):
+    """
+    Written blocks keep only ids and references, not their query texts.
+    """
+    pipe, engine = chunked_pipe
+    df = pipe.flow(pd.DataFrame())
+
+    assert df.columns.tolist() == ["id", "query"]
+    assert QueryReferences.is_reference(df["query"])
+    assert df["query"].tolist() == QueryReferences.encode_stored(
+        "cables", "query", range(1, 26)).tolist()
+
+
+def test_chunked_generation_keeps_completed_blocks(chunked_pipe):
+    pipe, engine = chunked_pipe
+    generate = pipe._generate_queries
+
+    def failing(template, batch_size, sources, session, rng, cache,
+                first_id):
+        if first_id > 20:
+            raise RuntimeError("generation failed")
+        return generate(template, batch_size, sources, session, rng, cache,
+                        first_id)
+
+    pipe._generate_queries = failing
+    with pytest.raises(RuntimeError):
+        pipe.flow(pd.DataFrame())
+
+    stored = pd.read_sql("SELECT id FROM cables ORDER BY id", engine)
+    assert stored["id"].tolist() == list(range(1, 21))
+
+
+if __name__ == "__main__":
+    pytest.main()
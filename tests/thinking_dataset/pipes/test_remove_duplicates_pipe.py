@@ -0,0 +1,238 @@
+"""
+@file tests/thinking_dataset/pipes/test_remove_duplicates_pipe.py
+@description Unit tests for exact and near-duplicate removal.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from thinking_dataset.pipeworks.pipelines.pipeline import Pipeline
+from thinking_dataset.pipeworks.pipes import RemoveDuplicatesPipe, SubsetPipe
+from thinking_dataset.pipeworks.pipes.pipe import Pipe
+from thinking_dataset.utils.hash_utils import HashUtils
+
+BASE = ("The ambassador met the minister on tuesday to discuss trade "
+        "and security arrangements for the coming year. ") * 8
+
+
+@pytest.fixture
+def df():
+    """
+    An exact copy, two near copies, an unrelated row and two empty rows.
+    """
+    return pd.DataFrame({
+        "id": [1, 2, 3, 4, 5, 6, 7],
+        "cable": [
+            BASE, BASE, "HEADER\n" + BASE,
+            BASE.upper() + " extra", "farm policy report " * 10, "", ""
+        ],
+    })
+
+
+def test_exact_mode_ignores_id_on_auto(df):
+    """
+    Auto columns skip the id, so exact copies are removed.
+    """
+    result = RemoveDuplicatesPipe({"columns": ["auto"]}).flow(df)
+    assert result["id"].tolist() == [1, 3, 4, 5, 6]
+
+
+def test_near_mode_keeps_first_of_each_cluster(df):
+    """
+    Near copies collapse onto the first row; empty rows are left alone.
+    """
+    pipe = RemoveDuplicatesPipe({"columns": ["cable"], "mode": "near"})
+    result = pipe.flow(df)
+    assert result["id"].tolist() == [1, 5, 6, 7]
+
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_fingerprint_mode_matches_exact(df, bits):
+    """
+    Fingerprint dedup keeps the same rows as exact dedup.
+    """
+    pipe = RemoveDuplicatesPipe({
+        "columns": ["auto"],
+        "mode": "fingerprint",
+        "hash_bits": bits
+    })
+    assert pipe.flow(df)["id"].tolist() == [1, 3, 4, 5, 6]
+
+
+def test_fingerprint_collisions_are_kept():
+    """
+    With verification, rows sharing a fingerprint but not values stay.
+    """
+    df = pd.DataFrame({"cable": ["x", "y", "x", None]})
+    pipe = RemoveDuplicatesPipe({
+        "columns": ["cable"],
+        "mode": "fingerprint",
+        "verify_collisions": True
+    })
+    with mock.patch.object(HashUtils,
+                           "fingerprint",
+                           return_value=np.zeros(4, dtype=np.uint64)):
+        result = pipe.flow(df)
+    assert result["cable"].tolist() == ["x", "y", None]
+
+
+def test_index_drops_rows_from_earlier_runs(tmp_path):
+    """
+    Rows are only remembered once the pipe is closed after a run.
+    """
+    config = {
+        "columns": ["cable"],
+        "index_path": str(tmp_path / "dedup-index.db")
+    }
+    first = pd.DataFrame({"cable": ["a", "b"]})
+    second = pd.DataFrame({"cable": ["b", "c", "c"]})
+
+    pipe = RemoveDuplicatesPipe(config)
+    assert len(pipe.flow(first)) == 2
+    assert len(pipe.flow(second)) == 2
+    pipe.index.rollback()
+
+    pipe.flow(first)
+    pipe.close()
+    pipe = RemoveDuplicatesPipe(config)
+    assert pipe.flow(second)["cable"].tolist() == ["c"]
+    assert len(pipe.index) == 2
+
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_external_mode_prepares_deduplicated_file(df, tmp_path, bits):
+    """
+    External mode streams the file through spill partitions and keeps
+    first occurrences in their original order.
+    """
+    input_file = tmp_path / "input.parquet"
+    df.to_parquet(input_file, index=False)
+    spill_dir = tmp_path / "spill"
+    pipe = RemoveDuplicatesPipe({
+        "columns": ["auto"],
+        "mode": "external",
+        "hash_bits": bits,
+        "partitions": 3,
+        "batch_size": 2,
+        "spill_dir": str(spill_dir)
+    })
+
+    prepared = pipe.prepare(str(input_file), "parquet")
+    result = pipe.flow(pd.read_parquet(prepared))
+    assert result["id"].tolist() == [1, 3, 4, 5, 6]
+
+    pipe.close()
+    assert list(spill_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize("texts", [["a", "b", "c", "d"], ["a", "b"]])
+def test_external_mode_reruns_over_seen_batches(tmp_path, texts):
+    """
+    Batches fully dropped by the dedup index keep the input schema.
+    """
+    config = {
+        "columns": ["cable"],
+        "mode": "external",
+        "batch_size": 2,
+        "index_path": str(tmp_path / "dedup-index.db")
+    }
+    first, second = tmp_path / "first.parquet", tmp_path / "second.parquet"
+    pd.DataFrame({"cable": ["a", "b"]}).to_parquet(first, index=False)
+    pd.DataFrame({"cable": texts}).to_parquet(second, index=False)
+
+    pipe = RemoveDuplicatesPipe(config)
+    pipe.prepare(str(first), "parquet")
+    pipe.close()
+
+    pipe = RemoveDuplicatesPipe(config)
+    prepared = pd.read_parquet(pipe.prepare(str(second), "parquet"))
+    assert prepared["cable"].tolist() == texts[2:]
+    assert str(prepared["cable"].dtype) == "object"
+    pipe.close()
+
+
+def test_failed_run_aborts_pipes(df, monkeypatch, tmp_path):
+    """
+    A failing pipe removes the spill file and discards staged fingerprints
+    of the dedup index.
+    """
+
+    class FailingPipe(Pipe):
+
+        def flow(self, df, **args):
+            raise RuntimeError("flow failed")
+
+    df.to_parquet(tmp_path / "input.parquet", index=False)
+    spill_dir = tmp_path / "spill"
+    dedup = RemoveDuplicatesPipe({
+        "columns": ["cable"],
+        "mode": "external",
+        "spill_dir": str(spill_dir),
+        "index_path": str(tmp_path / "dedup-index.db")
+    })
+    pipes = [dedup, FailingPipe({})]
+    pipeline = Pipeline.__new__(Pipeline)
+    pipeline.name = "failing"
+    pipeline.in_path = pipeline.out_path = str(tmp_path)
+    pipeline.config = SimpleNamespace(dataset_type="parquet")
+    monkeypatch.setattr(Pipeline, "pipelines", [("failing", pipes, {})])
+    monkeypatch.setattr(Pipe, "output_file", "")
+
+    with pytest.raises(RuntimeError):
+        pipeline._process_file("input.parquet", pipes)
+
+    assert dedup.spill_file is None
+    assert list(spill_dir.iterdir()) == []
+    assert not len(dedup.index._pending)
+    assert len(dedup.index) == 0
+
+
+def test_external_mode_must_lead_the_pipeline():
+    """
+    External dedup runs before any flow(), so it may not follow a pipe that
+    selects rows in flow().
+    """
+    external = RemoveDuplicatesPipe({"columns": ["cable"], "mode": "external"})
+    subset = SubsetPipe({"rows": [0, 3]})
+    sample = SubsetPipe({"mode": "reservoir", "size": 3})
+
+    with pytest.raises(ValueError, match="must come before SubsetPipe"):
+        Pipeline._validate_prepare_order([subset, external])
+    Pipeline._validate_prepare_order([sample, external, subset])
+
+
+def test_signatures_estimate_jaccard():
+    """
+    Similar documents share most signature slots, different ones few.
+    """
+    signatures = HashUtils.minhash_batches(
+        [BASE, BASE + " addendum", "farm policy report " * 10],
+        num_perm=128,
+        batch_size=2)
+    assert (signatures[0] == signatures[1]).mean() > 0.8
+    assert (signatures[0] == signatures[2]).mean() < 0.2
+    assert HashUtils.optimal_bands(64, 0.8) == 8
+
+
+def test_invalid_near_config():
+    """
+    Unknown modes and non-divisor band counts are rejected.
+    """
+    with pytest.raises(ValueError):
+        RemoveDuplicatesPipe({"columns": ["cable"], "mode": "fuzzy"})
+    with pytest.raises(ValueError):
+        RemoveDuplicatesPipe({"columns": ["cable"], "bands": 5})
+    with pytest.raises(ValueError):
+        RemoveDuplicatesPipe({"columns": ["cable"], "hash_bits": 32})
+
+
+if __name__ == "__main__":
+    pytest.main()
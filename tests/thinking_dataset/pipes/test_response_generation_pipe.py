@@ -0,0 +1,67 @@
+"""
+@file tests/thinking_dataset/pipes/test_response_generation_pipe.py
+@description Unit tests for ResponseGenerationPipe server timings.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import asyncio
+
+import pytest
+from thinking_dataset.pipeworks.pipes import ResponseGenerationPipe
+from thinking_dataset.providers.provider import Provider
+
+
+class TimedProvider:
+
+    async def process_request_timed_async(self, prompt):
+        return "response", {
+            "prompt_eval_count": 10,
+            "prompt_eval_duration": 2_000_000_000,
+            "eval_count": 5,
+            "eval_duration": 1_000_000_000,
+            "load_duration": 0,
+            "total_duration": 3_000_000_000
+        }
+
+
+def test_server_timings_are_summed():
+    pipe = ResponseGenerationPipe({})
+    provider = TimedProvider()
+    for _ in range(3):
+        response = asyncio.run(
+            pipe.generate_response("x" * 400, provider, None, None))
+        assert response == "response"
+
+    assert pipe.timing_stats["requests"] == 3
+    assert pipe.timing_stats["prompt_chars"] == 1200
+    assert pipe.timing_stats["prompt_eval_count"] == 30
+    assert pipe.timing_stats["prompt_eval_duration"] == 6_000_000_000
+    assert pipe.timing_stats["eval_count"] == 15
+    pipe._log_timing_stats("thinking")
+
+
+class UntimedProvider(Provider):
+
+    def __init__(self):
+        self.config = {}
+
+    async def process_request_async(self, prompt):
+        return "untimed"
+
+
+def test_providers_without_timings_still_respond():
+    pipe = ResponseGenerationPipe({})
+    response = asyncio.run(
+        pipe.generate_response("x" * 40, UntimedProvider(), None, None))
+
+    assert response == "untimed"
+    assert pipe.timing_stats["requests"] == 1
+    assert pipe.timing_stats["prompt_eval_duration"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
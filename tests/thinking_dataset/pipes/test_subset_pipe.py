@@ -0,0 +1,105 @@
+"""
+@file tests/thinking_dataset/pipes/test_subset_pipe.py
+@description Unit tests for the SubsetPipe sampling modes.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from thinking_dataset.pipeworks.pipes import SubsetPipe
+from thinking_dataset.utils.command_utils import CommandUtils
+from thinking_dataset.utils.stream_sampler import StreamSampler
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "id": np.arange(1000),
+        "text": ["x" * (10 if i % 4 else 1000) for i in range(1000)],
+    })
+
+
+def batches(df, size):
+    return (df.iloc[start:start + size] for start in range(0, len(df), size))
+
+
+def test_reservoir_sample_is_seeded_and_batch_independent(df):
+    sampler = StreamSampler(50, seed=7)
+    sample = sampler.sample(batches(df, 1000))
+
+    assert len(sample) == 50
+    assert sample.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(sample, sampler.sample(batches(df, 33)))
+    assert not sample.equals(StreamSampler(50, seed=8).sample([df]))
+
+
+@pytest.mark.parametrize("allocation, expected", [("proportional", [10, 30]),
+                                                  ("equal", [20, 20])])
+def test_stratified_allocation(df, allocation, expected):
+    sampler = StreamSampler(40,
+                            column="text",
+                            strata=[100],
+                            allocation=allocation)
+    sample = sampler.sample(batches(df, 64))
+
+    long_rows = int((sample["text"].str.len() > 100).sum())
+    assert [long_rows, len(sample) - long_rows] == expected
+
+
+def test_counted_strata_keep_their_share(df, monkeypatch):
+    """
+    With counted strata, the reservoirs together never exceed the sample.
+    """
+    df = df.assign(text=["x" * (i % 200) for i in range(len(df))])
+    sampler = StreamSampler(40, column="text", strata=list(range(1, 200)))
+    merge, sizes = StreamSampler._merge, {}
+
+    def tracked(reservoir, rows, limit):
+        rows = merge(reservoir, rows, limit)
+        sizes[rows["text"].str.len().iat[0]] = len(rows)
+        assert sum(sizes.values()) <= 40
+        return rows
+
+    expected = sampler.sample(batches(df, 64))
+    monkeypatch.setattr(StreamSampler, "_merge", staticmethod(tracked))
+    sample = sampler.sample(batches(df, 64), sampler.count(batches(df, 64)))
+
+    pd.testing.assert_frame_equal(sample, expected)
+    assert len(sample) == 40
+
+
+@pytest.mark.parametrize("mode", ["reservoir", "stratified"])
+def test_prepare_samples_file_like_flow(tmp_path, df, mode):
+    path = str(tmp_path / "data.parquet")
+    df.to_parquet(path, index=False)
+    config = {
+        "mode": mode,
+        "size": 25,
+        "seed": 3,
+        "batch_size": 100,
+        "stratify_column": "text"
+    }
+
+    expected = SubsetPipe(config).flow(df.copy())
+
+    pipe = SubsetPipe(config)
+    sample_file = pipe.prepare(path, "parquet")
+    result = pipe.flow(CommandUtils.read_data(sample_file, "parquet"))
+    pipe.close()
+
+    assert result["id"].tolist() == expected["id"].tolist()
+    assert pipe.spill_file is None
+
+
+def test_sampling_rejects_row_range():
+    with pytest.raises(ValueError):
+        SubsetPipe({"mode": "reservoir", "size": 5, "rows": [0, 10]})
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,83 @@
+"""
+@file tests/thinking_dataset/sources/test_sql_sampler.py
+@description Unit tests for database-side input source sampling.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from thinking_dataset.sources.input_source import InputSource
+from thinking_dataset.utils.chunk_index import ChunkIndex
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    texts = pd.DataFrame({
+        "id": range(1, 41),
+        "cable": [f"cable {i} " + "body " * (i % 6) for i in range(40)],
+    })
+    texts.to_sql("cables", engine, index=False)
+    # Leave rowid gaps so that draws must be retried
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM cables WHERE id % 3 = 0")
+    texts.assign(start=2, end=12).rename(columns={
+        "id": "parent_id"
+    }).drop(columns="cable").assign(chunk_no=0).to_sql(
+        ChunkIndex.table_name("cables"), engine, index=False)
+    return engine
+
+
+@pytest.mark.parametrize("chunks", [False, True])
+@pytest.mark.parametrize("truncation", [{}, {
+    "length": 9,
+    "offset": 2
+}, {
+    "length": 12,
+    "offset": 3,
+    "ellipsis": "..."
+}, {
+    "length": 20,
+    "offset": 18,
+    "ellipsis": "~"
+}])
+def test_sql_samples_match_memory_samples(engine, chunks, truncation):
+    config = {
+        "table": "cables",
+        "column": "cable",
+        "amount": 4,
+        "chunks": chunks,
+        **truncation
+    }
+    source = InputSource.from_config({**config, "sampling": "sql"})
+    with Session(engine) as session:
+        samples = source.sample_sql(session, 25)
+        data = source.fetch_source(session)
+    source.amount = len(data)
+    expected = set(source.get_samples(data, source.ellipsis))
+
+    assert len(samples) == 25
+    for query in samples:
+        assert len(query) == 4
+        assert set(query) <= expected
+
+
+def test_sql_sampling_rejects_small_tables(engine):
+    source = InputSource.from_config({
+        "table": "cables",
+        "column": "cable",
+        "amount": 100,
+        "sampling": "sql"
+    })
+    with Session(engine) as session, pytest.raises(ValueError):
+        source.sample_sql(session, 1)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,76 @@
+"""
+@file tests/thinking_dataset/templates/test_template_minifier.py
+@description Unit tests for the TemplateMinifier.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+from pathlib import Path
+
+import pytest
+from thinking_dataset.templates.template_extractor import TemplateExtractor
+from thinking_dataset.templates.template_loader import TemplateLoader
+from thinking_dataset.templates.template_minifier import TemplateMinifier
+
+TEMPLATES = Path(__file__).parents[3] / "assets" / "templates"
+
+TEMPLATE = """[SYSTEM PROMPT]
+Analyst.\x20\x20\x20
+[END]
+
+<!-- @meta -->
+@stage: thinking
+@version: 0.0.3
+
+
+
+<!-- @hint: Use seeds as inspiration -->
+<!-- Generate 19 more scenarios -->
+<inspirations>{{seed}}</inspirations>
+@inputs: 3000-5000 words
+
+<output>
+@scenarios: {
+
+
+  timeframe: "2025-2035"\x20\x20\x20
+}
+</output>
+"""
+
+
+def test_minify_strips_metadata_and_whitespace():
+    minified = TemplateMinifier.minify(TEMPLATE)
+
+    assert minified == ("[SYSTEM PROMPT]\nAnalyst.\n[END]\n\n"
+                        "<!-- Generate 19 more scenarios -->\n"
+                        "<inspirations>{{seed}}</inspirations>\n"
+                        "@inputs: 3000-5000 words\n\n"
+                        "<output>\n@scenarios: {\n\n\n"
+                        "  timeframe: \"2025-2035\"   \n}\n</output>")
+
+
+def test_minify_uses_configured_patterns():
+    minified = TemplateMinifier.minify(TEMPLATE, [r"<!--[\s\S]*?-->"])
+
+    assert "<!--" not in minified
+    assert "@stage: thinking" in minified
+
+
+@pytest.mark.parametrize("path", sorted(map(str, TEMPLATES.glob("*.md"))))
+def test_minified_templates_keep_output_schema(path):
+    template = TemplateLoader.load(path)
+    minified = TemplateLoader.load(path, minify=True)
+
+    assert len(minified) < len(template)
+    assert TemplateExtractor.extract_xml_schema(minified) == \
+        TemplateExtractor.extract_xml_schema(template)
+    assert TemplateExtractor.extract_required_elements(minified) == \
+        TemplateExtractor.extract_required_elements(template)
+
+
+if __name__ == "__main__":
+    pytest.main()
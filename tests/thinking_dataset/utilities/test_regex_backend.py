@@ -0,0 +1,100 @@
+"""
+@file tests/thinking_dataset/utilities/test_regex_backend.py
+@description Unit tests for the pluggable TextUtils regex backend.
+@version 1.0.0
+@license MIT
+@author Kara Rawson
+@see {@link https://github.com/MultiTonic|GitHub Repository}
+@see {@link https://huggingface.co/DataTonic|Hugging Face Organization}
+"""
+
+import pandas as pd
+import pytest
+from thinking_dataset.pipeworks.pipes import NormalizeTextPipe
+from thinking_dataset.utils.regex_backend import (
+    RegexBackend,
+    RegexTimeoutError,
+)
+from thinking_dataset.utils.text_utils import TextUtils
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    """
+    Restore the default backend around each test.
+    """
+    RegexBackend.reset()
+    yield
+    RegexBackend.reset()
+
+
+def test_backends_match_stdlib():
+    """
+    Every installed backend produces the same output as 're'.
+    """
+    text = "header SUBJECT: the u s a -- report 12 (ab) ok. bye"
+    expected = TextUtils.normalize_spaced_characters(
+        TextUtils.remove_separators(TextUtils.remove_header(text)))
+
+    for engine in ["regex", "re2"]:
+        RegexBackend.configure(backend=engine)
+        result = TextUtils.normalize_spaced_characters(
+            TextUtils.remove_separators(TextUtils.remove_header(text)))
+        assert result == expected
+
+
+def test_unsupported_pattern_falls_back_to_re():
+    """
+    Lookaround patterns rejected by RE2 still run on 're'.
+    """
+    RegexBackend.configure(backend="re2")
+    text = TextUtils.expand_terms("the usa and usability", {"usa": "u.s."})
+    assert text == "the  u.s.  and usability"
+
+
+def test_overrides_and_validation():
+    """
+    Per-pattern overrides resolve and unknown engines are rejected.
+    """
+    RegexBackend.configure(backend="re", overrides={"remove_header": "re2"})
+    assert RegexBackend.engine_for("remove_header") == "re2"
+    assert RegexBackend.engine_for("remove_signoff") == "re"
+
+    with pytest.raises(ValueError):
+        RegexBackend.configure(backend="pcre")
+    with pytest.raises(ValueError):
+        RegexBackend.configure(timeout=-1)
+
+
+def test_guard_raises_when_budget_spent():
+    """
+    A spent document budget stops further substitutions.
+    """
+    with RegexBackend.guard(timeout=1e-9):
+        with pytest.raises(RegexTimeoutError):
+            TextUtils.remove_header("subject: a")
+
+    assert TextUtils.remove_header("x subject: a") == "subject: a"
+
+
+def test_normalize_pipe_restores_backend_settings():
+    """
+    Regex settings of a pipe do not outlive its run.
+    """
+    RegexBackend.configure(backend="re", timeout=2.0)
+    pipe = NormalizeTextPipe({
+        "columns": ["text"],
+        "regex": {
+            "backend": "regex",
+            "timeout": 5.0
+        }
+    })
+    df = pipe.flow(pd.DataFrame({"text": ["Subject: A"]}))
+
+    assert df["text"].tolist() == ["subject: a"]
+    assert RegexBackend.backend == "re"
+    assert RegexBackend.timeout == 2.0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,12 +1,15 @@
 # @file thinking_dataset/datasets/operations/load_operation.py
 # @description Implementation of the LoadOperation class.
-# @version 1.0.0
+# @version 1.0.2
 # @license MIT
 
 import os
 import pandas as pd
+from sqlalchemy import Index, MetaData, Table
 from thinking_dataset.utils.log import Log
 from thinking_dataset.io.files import Files
+from thinking_dataset.utils.chunk_index import ChunkIndex
+from thinking_dataset.utils.feature_store import FeatureStore
 from ...db.database import Database
 
 
@@ -45,6 +48,8 @@ class LoadOperation:
                               con=self.database.engine,
                               if_exists='append',
                               index=False)
+                    self._load_chunk_index(file_path, table_name)
+                    self._load_features(file_path, table_name)
                 except FileNotFoundError as e:
                     session.rollback()
                     raise FileNotFoundError(f"{e}")
@@ -59,3 +64,31 @@ class LoadOperation:
             except Exception as e:
                 session.rollback()
                 raise RuntimeError(f"Error committing the session: {e}")
+
+    def _load_chunk_index(self, file_path: str, table_name: str) -> None:
+        """Load the chunk index saved next to a file, if there is one."""
+        index_path = ChunkIndex.file_path(file_path)
+        if not Files.exists(index_path):
+            return
+        Log.info(f"Loading chunk index: {index_path}")
+        pd.read_parquet(index_path).to_sql(ChunkIndex.table_name(table_name),
+                                           con=self.database.engine,
+                                           if_exists='append',
+                                           index=False)
+
+    def _load_features(self, file_path: str, table_name: str) -> None:
+        """Load the features saved next to a file, indexed by id."""
+        features_path = FeatureStore.file_path(file_path)
+        if not Files.exists(features_path):
+            return
+        Log.info(f"Loading features: {features_path}")
+        features_table = FeatureStore.table_name(table_name)
+        pd.read_parquet(features_path).to_sql(features_table,
+                                              con=self.database.engine,
+                                              if_exists='append',
+                                              index=False)
+        table = Table(features_table,
+                      MetaData(),
+                      autoload_with=self.database.engine)
+        Index(f"ix_{features_table}_id", table.c.id,
+              table.c.column).create(self.database.engine, checkfirst=True)
@@ -0,0 +1,277 @@
+"""
+SimHash Index Module.
+
+This module provides the implementation of the SimHashIndex class for
+finding near-duplicate generated outputs through banded SimHash lookups
+stored in the database.
+
+Classes:
+    SimHashIndex: Banded SimHash index over generated output columns.
+"""
+
+__version__ = "0.0.3"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+from itertools import combinations
+from math import comb
+from typing import Any, List, Optional
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Index,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
+    inspect,
+    select,
+    union,
+)
+
+from thinking_dataset.utils.hash_utils import HashUtils
+from thinking_dataset.utils.log import Log
+
+
+class SimHashIndex:
+    """
+    The SimHashIndex class stores a 64-bit SimHash per generated output and
+    finds earlier outputs within a Hamming distance.
+
+    This class:
+    1. Creates a table holding the SimHash and its bands per output row
+    2. Finds candidates sharing any band, up to a few flipped bits, with
+       one indexed query
+    3. Confirms candidates by their exact Hamming distance
+
+    The hash is split into near-equal bands of 64 / bands bits. Two hashes
+    differing in at most distance bits differ in at most
+    ceil((distance + 1) / bands) - 1 bits of some band, so probing each band
+    with every value within that many flipped bits finds all of them. Wide
+    bands keep the share of stored rows matching a probe small: the default
+    3 bands of 21-22 bits with one flip match about 3 * 23 / 2**21 of the
+    rows, where 8 exact 8-bit bands match about 8 / 256. Verification
+    still reads every matching row, so it grows linearly with the table,
+    only at that much smaller rate.
+
+    Attributes:
+        table (Table): Index table
+        bands (int): Number of bands
+        distance (int): Maximum Hamming distance of a near-duplicate
+        flips (int): Bits flipped per band when probing
+        MAX_PROBES (int): Most probe values allowed per band
+        MAX_VARIABLES (int): Most bound values per lookup statement, below
+            the 999 of older SQLite builds
+    """
+
+    MAX_PROBES = 1024
+    MAX_VARIABLES = 900
+
+    def __init__(self,
+                 session: Any,
+                 table_name: str,
+                 bands: int = 3,
+                 distance: int = 5) -> None:
+        """
+        Initialize the index and create its table if missing.
+
+        Args:
+            session (Any): The database session.
+            table_name (str): The name of the index table.
+            bands (int, optional): Number of bands. Defaults to 3.
+            distance (int, optional): Maximum Hamming distance. Defaults
+                to 5.
+
+        Raises:
+            ValueError: If the bands are invalid, need too many probes, or
+                differ from those of the existing table.
+        """
+        self.flips = self.validate(bands, distance)
+        self.session = session
+        self.bands = bands
+        self.distance = distance
+        self.widths = [
+            64 // bands + (band < 64 % bands) for band in range(bands)
+        ]
+        self.offsets = [sum(self.widths[:band]) for band in range(bands)]
+
+        metadata = MetaData()
+        band_columns = [
+            Column(f"band_{band}", BigInteger) for band in range(bands)
+        ]
+        self.table = Table(
+            table_name, metadata, Column("id", String, primary_key=True),
+            Column("column", String, primary_key=True),
+            Column("simhash", BigInteger), *band_columns, *[
+                Index(f"ix_{table_name}_band_{band}", "column",
+                      f"band_{band}") for band in range(bands)
+            ])
+        metadata.create_all(session.bind)
+
+        stored = [
+            column["name"]
+            for column in inspect(session.bind).get_columns(table_name)
+            if column["name"].startswith("band_")
+        ]
+        if len(stored) != bands:
+            raise ValueError(f"SimHash index {table_name} was built with "
+                             f"{len(stored)} bands, not {bands}; drop it "
+                             "to rebuild it with the new bands")
+
+    @classmethod
+    def validate(cls, bands: int, distance: int) -> int:
+        """
+        Check a band layout and get the bits to flip per band.
+
+        Args:
+            bands (int): Number of bands.
+            distance (int): Maximum Hamming distance.
+
+        Returns:
+            int: Bits flipped per band when probing.
+
+        Raises:
+            ValueError: If the layout is invalid or needs too many probes.
+        """
+        if not isinstance(bands, int) or not 2 <= bands <= 64:
+            raise ValueError("SimHash bands must be between 2 and 64")
+        if not isinstance(distance, int) or distance < 0:
+            raise ValueError("SimHash distance must be a non-negative "
+                             "integer")
+        flips = -(-(distance + 1) // bands) - 1
+        width = -(-64 // bands)
+        if sum(comb(width, k) for k in range(flips + 1)) > cls.MAX_PROBES:
+            raise ValueError(f"{bands} SimHash bands need too many probes "
+                             f"for distance {distance}; use more bands")
+        return flips
+
+    def _bands(self, simhash: int) -> dict:
+        """
+        Split a SimHash into its band values.
+
+        Args:
+            simhash (int): Unsigned 64-bit SimHash.
+
+        Returns:
+            dict: Band value per band column.
+        """
+        return {
+            f"band_{band}":
+            (simhash >> offset) & ((1 << width) - 1)
+            for band, (offset, width) in enumerate(
+                zip(self.offsets, self.widths))
+        }
+
+    def _probes(self, value: int, width: int) -> List[int]:
+        """
+        Get the values of a band within the flipped bits.
+
+        Args:
+            value (int): Band value.
+            width (int): Band width in bits.
+
+        Returns:
+            List[int]: Band values to look up.
+        """
+        return [
+            value ^ sum(1 << bit for bit in bits)
+            for flips in range(self.flips + 1)
+            for bits in combinations(range(width), flips)
+        ]
+
+    def find(self,
+             column: str,
+             simhash: int,
+             exclude: Optional[str] = None) -> Optional[str]:
+        """
+        Find an indexed output within the maximum distance.
+
+        Args:
+            column (str): The generated output column.
+            simhash (int): Unsigned 64-bit SimHash of the new output.
+            exclude (Optional[str], optional): Row id to ignore, usually the
+                row being regenerated. Defaults to None.
+
+        Returns:
+            Optional[str]: Id of the closest near-duplicate, if any.
+        """
+        best = None
+        for row_id, candidate in self._candidates(column, simhash, exclude):
+            distance = HashUtils.hamming(simhash, candidate)
+            if distance <= self.distance and (best is None
+                                              or distance < best[1]):
+                best = (row_id, distance)
+        if best is not None:
+            Log.info(f"Near-duplicate -- Column: {column} | "
+                     f"Match: {best[0]} | Distance: {best[1]}")
+            return best[0]
+        return None
+
+    def _candidates(self, column: str, simhash: int,
+                    exclude: Optional[str]) -> List[Any]:
+        """
+        Get the indexed rows sharing a probed band value.
+
+        Probes are split into statements of at most MAX_VARIABLES bound
+        values, so wide probe sets stay within SQLite's variable limit.
+
+        Args:
+            column (str): The generated output column.
+            simhash (int): Unsigned 64-bit SimHash of the new output.
+            exclude (Optional[str]): Row id to ignore.
+
+        Returns:
+            List[Any]: Id and SimHash of every candidate.
+        """
+        table = self.table
+        fixed = 1 if exclude is None else 2
+        step = self.MAX_VARIABLES - fixed
+        # One indexed search per band; SQLite scans the column for an OR
+        statements, searches, used = [], [], 0
+        for (name, value), width in zip(
+                self._bands(simhash).items(), self.widths):
+            probes = self._probes(value, width)
+            for start in range(0, len(probes), step):
+                chunk = probes[start:start + step]
+                if used + len(chunk) + fixed > self.MAX_VARIABLES:
+                    statements.append(searches)
+                    searches, used = [], 0
+                search = select(table.c.id, table.c.simhash).where(
+                    table.c.column == column, table.c[name].in_(chunk))
+                if exclude is not None:
+                    search = search.where(table.c.id != str(exclude))
+                searches.append(search)
+                used += len(chunk) + fixed
+        statements.append(searches)
+
+        candidates = {}
+        for searches in statements:
+            for row_id, candidate in self.session.execute(union(*searches)):
+                candidates[row_id] = candidate
+        return list(candidates.items())
+
+    def add(self, column: str, row_id: Any, simhash: int) -> None:
+        """
+        Index the output of a row, replacing its previous entry.
+
+        The insert joins the session's current transaction, so it is
+        committed together with the output it describes.
+
+        Args:
+            column (str): The generated output column.
+            row_id (Any): The row id.
+            simhash (int): Unsigned 64-bit SimHash of the output.
+        """
+        table = self.table
+        signed = simhash - (1 << 64) if simhash >= 1 << 63 else simhash
+        self.session.execute(
+            delete(table).where(table.c.id == str(row_id),
+                                table.c.column == column))
+        self.session.execute(
+            insert(table).values(id=str(row_id),
+                                 column=column,
+                                 simhash=signed,
+                                 **self._bands(simhash)))
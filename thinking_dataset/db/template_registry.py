@@ -0,0 +1,112 @@
+"""
+Template Registry Module.
+
+This module provides the implementation of the TemplateRegistry class for
+storing query templates and their source configurations once, so that
+generated rows can refer to them by a short id.
+
+Classes:
+    TemplateRegistry: Content-addressed store of query templates.
+"""
+
+__version__ = "0.0.1"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+import hashlib
+import json
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import Column, MetaData, String, Table, Text, insert, select
+
+from thinking_dataset.utils.log import Log
+
+
+class TemplateRegistry:
+    """
+    The TemplateRegistry class stores each query template with the
+    configurations of the sources that fill it.
+
+    This class:
+    1. Creates a table holding one row per template and sources
+    2. Registers a template under an id derived from its content
+    3. Looks registered templates up by id
+
+    Registering the same template and sources again returns the same id, so
+    reruns of a stage do not grow the table.
+
+    Attributes:
+        table (Table): Registry table
+    """
+
+    ID_LENGTH = 16
+
+    def __init__(self, session: Any, table_name: str) -> None:
+        """
+        Initialize the registry and create its table if missing.
+
+        Args:
+            session (Any): The database session.
+            table_name (str): The name of the registry table.
+        """
+        self.session = session
+        metadata = MetaData()
+        self.table = Table(table_name, metadata,
+                           Column("id", String, primary_key=True),
+                           Column("template", Text), Column("sources", Text))
+        metadata.create_all(session.bind)
+        self._cache: Dict[str, Tuple[str, List[dict]]] = {}
+
+    def register(self, template: str, sources: List[dict]) -> str:
+        """
+        Store a template and its source configurations.
+
+        Args:
+            template (str): Template text.
+            sources (List[dict]): Configuration of each source, in order.
+
+        Returns:
+            str: Id of the template.
+        """
+        encoded = json.dumps(sources, sort_keys=True)
+        digest = hashlib.sha256(f"{template}\0{encoded}".encode("utf-8"))
+        template_id = digest.hexdigest()[:self.ID_LENGTH]
+
+        table = self.table
+        exists = self.session.execute(
+            select(table.c.id).where(table.c.id == template_id)).first()
+        if exists is None:
+            self.session.execute(
+                insert(table).values(id=template_id,
+                                     template=template,
+                                     sources=encoded))
+            self.session.commit()
+            Log.info(f"Registered template {template_id} in "
+                     f"'{table.name}' table")
+        self._cache[template_id] = (template, sources)
+        return template_id
+
+    def get(self, template_id: str) -> Tuple[str, List[dict]]:
+        """
+        Look a registered template up.
+
+        Args:
+            template_id (str): Id of the template.
+
+        Returns:
+            Tuple[str, List[dict]]: Template text and source configurations.
+
+        Raises:
+            KeyError: If the template is not registered.
+        """
+        if template_id not in self._cache:
+            table = self.table
+            row = self.session.execute(
+                select(table.c.template, table.c.sources).where(
+                    table.c.id == template_id)).first()
+            if row is None:
+                raise KeyError(f"Template {template_id} is not registered "
+                               f"in '{table.name}' table")
+            self._cache[template_id] = (row.template, json.loads(row.sources))
+        return self._cache[template_id]
@@ -0,0 +1,143 @@
+# @file thinking_dataset/io/read_plan.py
+# @description Column projection and row range pushed down into file reads.
+# @version 1.0.1
+# @license MIT
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+
+@dataclass
+class ReadPlan:
+    """
+    Column projection and row range to push down into a file read.
+
+    Leading pipes describe their effect on the plan in order, starting from
+    the file schema. Each current column maps back to the source column it
+    comes from, or to None for columns a pipe generates. Once planning
+    stops, only the source columns still in use and the rows in range need
+    to be decoded.
+
+    Attributes:
+        schema (List[str]): Columns of the file, in file order
+        columns (List[str]): Columns after the planned pipes
+        sources (Dict[str, Optional[str]]): Source column of each column
+        rows (Optional[Tuple[int, int]]): Row range [start, end) to read
+        positional (bool): Whether a planned pipe depends on row positions
+        pushed (List[str]): Descriptions of what was pushed down
+        required (Set[str]): Source columns a planned pipe reads
+    """
+    schema: List[str]
+    columns: List[str] = field(default_factory=list)
+    sources: Dict[str, Optional[str]] = field(default_factory=dict)
+    rows: Optional[Tuple[int, int]] = None
+    positional: bool = False
+    pushed: List[str] = field(default_factory=list)
+    required: Set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        if not self.columns:
+            self.columns = list(self.schema)
+            self.sources = {column: column for column in self.schema}
+
+    def limit(self, start: int, end: int) -> bool:
+        """
+        Restrict the rows read to a positional range of the current rows.
+
+        Args:
+            start (int): First row, relative to the current range.
+            end (int): End row (exclusive), relative to the current range.
+
+        Returns:
+            bool: False if the range cannot be pushed down.
+        """
+        if self.positional or not all(
+                isinstance(value, int) and value >= 0
+                for value in (start, end)):
+            return False
+        offset, stop = self.rows or (0, None)
+        end = offset + end if stop is None else min(offset + end, stop)
+        self.rows = (offset + start, max(offset + start, end))
+        self.pushed.append(f"rows {list(self.rows)}")
+        return True
+
+    def select(self, columns: List[str]) -> None:
+        """
+        Keep only the given current columns.
+
+        Args:
+            columns (List[str]): Columns to keep.
+        """
+        kept = [column for column in self.columns if column in columns]
+        if kept != self.columns:
+            self.pushed.append(f"columns {kept}")
+        self.columns = kept
+        self.sources = {column: self.sources[column] for column in kept}
+
+    def drop(self, columns: List[str]) -> None:
+        """
+        Remove current columns, ignoring missing ones.
+
+        Args:
+            columns (List[str]): Columns to remove.
+        """
+        self.select(
+            [column for column in self.columns if column not in columns])
+
+    def rename(self, mapping: Dict[str, str]) -> None:
+        """
+        Rename current columns.
+
+        Args:
+            mapping (Dict[str, str]): Old to new column names.
+        """
+        self.columns = [mapping.get(column, column) for column in self.columns]
+        self.sources = {
+            mapping.get(column, column): source
+            for column, source in self.sources.items()
+        }
+
+    def add(self, column: str, positional: bool = False) -> None:
+        """
+        Add a column generated by a pipe.
+
+        Args:
+            column (str): Generated column.
+            positional (bool, optional): Whether its values depend on row
+                positions, which prevents later row ranges. Defaults to
+                False.
+        """
+        self.columns.insert(0, column)
+        self.sources[column] = None
+        self.positional = self.positional or positional
+
+    def require(self, columns: List[str]) -> None:
+        """
+        Mark current columns as read by a pipe, even if later dropped.
+
+        Args:
+            columns (List[str]): Columns the pipe reads.
+        """
+        self.required.update(self.sources[column] for column in columns
+                             if self.sources.get(column) is not None)
+
+    def source_columns(self) -> List[str]:
+        """
+        Get the source columns still in use, in file order.
+
+        Returns:
+            List[str]: Columns to read.
+        """
+        used = set(self.sources.values()) | self.required
+        return [column for column in self.schema if column in used]
+
+    @property
+    def projected(self) -> bool:
+        """
+        Check whether the plan reads less than the whole file.
+
+        Returns:
+            bool: True if columns or rows are pushed down.
+        """
+        return self.rows is not None or \
+            len(self.source_columns()) < len(self.schema)
@@ -17,11 +17,12 @@ import pandas as pd
 
 from thinking_dataset.config import initialize, Config, get_keys
 from thinking_dataset.io.files import Files
+from thinking_dataset.io.read_plan import ReadPlan
 from thinking_dataset.pipeworks.pipes.pipe import Pipe
 from thinking_dataset.utils.command_utils import CommandUtils as utils
 from thinking_dataset.utils.log import Log
 
-__version__ = "0.0.2"
+__version__ = "0.0.5"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
@@ -218,12 +219,69 @@ class Pipeline:
         except Exception as e:
             raise RuntimeError(f"Failed to save data: {str(e)}") from e
 
+    @staticmethod
+    def _validate_prepare_order(pipes: list) -> None:
+        """Check that pipes selecting rows in prepare() lead the pipeline.
+
+        prepare() runs on the stored file before any flow(), so a pass
+        placed after a pipe that filters, slices or reorders rows would see
+        rows that pipe has not processed yet.
+
+        Args:
+            pipes (list): List of pipe instances to execute
+
+        Raises:
+            ValueError: If such a pass follows any other pipe
+        """
+        leading = None
+        for pipe in pipes:
+            if not pipe.prepares_rows():
+                leading = leading or pipe
+            elif leading is not None:
+                raise ValueError(
+                    f"{pipe.__class__.__name__} selects rows before the file "
+                    "is read, so it must come before "
+                    f"{leading.__class__.__name__} in the pipeline")
+
+    def _read_input(self, input_file: str, pipes: list) -> pd.DataFrame:
+        """Read an input file with the pushdown of the leading pipes.
+
+        Args:
+            input_file (str): Path of the file to read
+            pipes (list): List of pipe instances to execute
+
+        Returns:
+            pd.DataFrame: Data read from the file
+        """
+        dataset_type = self.config.dataset_type
+        plan = ReadPlan(utils.read_schema(input_file, dataset_type))
+        for pipe in pipes:
+            if not pipe.pushdown(plan):
+                break
+
+        if not plan.projected:
+            return utils.read_data(input_file, dataset_type)
+        Log.info(f"Read pushdown: {', '.join(plan.pushed)}")
+        return utils.read_data(input_file,
+                               dataset_type,
+                               columns=plan.source_columns(),
+                               rows=plan.rows)
+
     def _process_file(self,
                       file: str,
                       pipes: list,
                       skip_files: bool = False) -> pd.DataFrame:
         """Process a single file through the pipeline.
 
+        Pipes may prepare the input file before it is read; passes that
+        select rows there must lead the pipeline. Leading pipes
+        then push their column and row selections into a read plan, so only
+        the data they keep is decoded from the file. Once the output
+        is saved, their side tables are saved next to it and they are
+        closed, so state they persist is only written for successful runs.
+        When any step fails, every pipe is aborted instead, which removes
+        its temporary files and discards its staged state.
+
         Args:
             file (str): Name of file to process
             pipes (list): List of pipe instances to execute
@@ -245,7 +303,13 @@ class Pipeline:
                 if not Files.exists(input_file):
                     raise FileNotFoundError(f"File not found: {input_file}")
 
-            df = utils.read_data(input_file, self.config.dataset_type)
+            self._validate_prepare_order(pipes)
+            Pipe.set_output_file(Files.get_file_path(self.out_path, file))
+            for pipe in pipes:
+                input_file = pipe.prepare(input_file,
+                                          self.config.dataset_type)
+
+            df = self._read_input(input_file, pipes)
             df = self._process_pipes(df, pipes, skip_files)
 
             if not skip_files:
@@ -253,11 +317,37 @@ class Pipeline:
                 file_name = f"{base_name}{ext}"
                 file_path = Files.get_file_path(self.out_path, file_name)
                 self._save_data(df, file_path)
+                for pipe in pipes:
+                    for suffix, table in pipe.side_tables().items():
+                        side_path = Files.get_file_path(
+                            self.out_path, f"{base_name}-{suffix}{ext}")
+                        self._save_data(table, side_path)
+
+            for pipe in pipes:
+                pipe.close()
 
             return df
         except Exception as e:
+            self._abort_pipes(pipes)
             raise RuntimeError(f"Pipeline processing failed: {str(e)}") from e
 
+    @staticmethod
+    def _abort_pipes(pipes: list) -> None:
+        """Abort every pipe after a failed run.
+
+        Errors while aborting are logged, so they neither stop the other
+        pipes from cleaning up nor hide the original failure.
+
+        Args:
+            pipes (list): List of pipe instances
+        """
+        for pipe in pipes:
+            try:
+                pipe.abort()
+            except Exception as e:
+                Log.warn(f"Failed to abort {pipe.__class__.__name__}: "
+                         f"{str(e)}")
+
     def _open(self, pipes: list, skip_files: bool = False) -> None:
         """Open and process pipeline sequence.
 
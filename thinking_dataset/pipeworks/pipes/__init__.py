@@ -11,13 +11,16 @@ Classes:
     Pipe: Abstract base class for all processing pipes.
     AddIdPipe
     ChunkingPipe
+    CompactDtypesPipe
     DropColumnsPipe
     ExportTablesPipe
+    FeatureStorePipe
     FileExtractorPipe
     FileUploadHfApiPipe
     FilterBySizePipe
     HandleMissingValuesPipe
     NormalizeTextPipe
+    QualityGatePipe
     QueryGenerationPipe
     RemapColumnsPipe
     RemoveDuplicatesPipe
@@ -28,20 +31,23 @@ Classes:
 from .pipe import Pipe
 from .add_id_pipe import AddIdPipe
 from .chunking_pipe import ChunkingPipe
+from .compact_dtypes_pipe import CompactDtypesPipe
 from .drop_columns_pipe import DropColumnsPipe
 from .export_tables_pipe import ExportTablesPipe
+from .feature_store_pipe import FeatureStorePipe
 from .file_extractor_pipe import FileExtractorPipe
 from .file_upload_hf_api_pipe import FileUploadHfApiPipe
 from .filter_by_size_pipe import FilterBySizePipe
 from .handle_missing_values_pipe import HandleMissingValuesPipe
 from .normalize_text_pipe import NormalizeTextPipe
+from .quality_gate_pipe import QualityGatePipe
 from .query_generation_pipe import QueryGenerationPipe
 from .remap_columns_pipe import RemapColumnsPipe
 from .remove_duplicates_pipe import RemoveDuplicatesPipe
 from .response_generation_pipe import ResponseGenerationPipe
 from .subset_pipe import SubsetPipe
 
-__version__ = "0.0.2"
+__version__ = "0.0.4"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
@@ -50,13 +56,16 @@ __all__ = [
     "Pipe",
     "AddIdPipe",
     "ChunkingPipe",
+    "CompactDtypesPipe",
     "DropColumnsPipe",
     "ExportTablesPipe",
+    "FeatureStorePipe",
     "FileExtractorPipe",
     "FileUploadHfApiPipe",
     "FilterBySizePipe",
     "HandleMissingValuesPipe",
     "NormalizeTextPipe",
+    "QualityGatePipe",
     "QueryGenerationPipe",
     "RemapColumnsPipe",
     "RemoveDuplicatesPipe",
@@ -1,7 +1,9 @@
 """Chunking Pipeline Module.
 
 This module provides functionality for splitting input records into chunks
-while avoiding orphan chunks.
+while avoiding orphan chunks, either row by row or from integer chunk
+offsets computed in one pass per document. Chunks can also be written as a
+compact index of offsets into the parent rows instead of copied text.
 
 Functions:
     None
@@ -10,18 +12,23 @@ Classes:
     ChunkingPipe: Handles splitting input records into chunks.
 """
 
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+from thinking_dataset.utils.chunk_index import ChunkIndex
 from thinking_dataset.utils.log import Log
 from .pipe import Pipe
 
-__version__ = "0.0.2"
+__version__ = "0.0.4"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
 
+WHITESPACE = re.compile(r"\s*")
+
 
 class ChunkingPipe(Pipe):
     """Pipe to chunk input records while avoiding orphan chunks.
@@ -31,10 +38,24 @@ class ChunkingPipe(Pipe):
     2. Splits text into chunks based on specified sizes
     3. Maintains data integrity during processing
 
+    The default "offsets" engine walks each document once and records
+    chunks as (row, start, end) integer arrays, then repeats the other
+    columns with a single take instead of appending them cell by cell. Its
+    output is identical to the "legacy" engine, which re-slices the
+    remaining text after every chunk.
+
+    With output "index", rows are returned unchanged and the chunks are
+    kept as a side table of (parent_id, chunk_no, start, end) integers,
+    saved by the pipeline next to the output file as {base}-chunks. Chunk
+    text is then sliced from the parent text only where it is read.
+
     Config:
         columns (List[str]): Columns to chunk
         max_chunk_size (int): Maximum size of each chunk
         min_chunk_size (int): Minimum size of each chunk
+        engine (str): "offsets" (default) or "legacy"
+        output (str): "rows" (default) or "index"
+        id_column (str): Parent id column of the index. Defaults to "id".
     """
 
     def __init__(self, config: Dict[str, Any]) -> None:
@@ -45,9 +66,12 @@ class ChunkingPipe(Pipe):
                 columns (List[str]): Columns to chunk
                 max_chunk_size (int): Maximum size of each chunk
                 min_chunk_size (int): Minimum size of each chunk
+                engine (str): Chunking engine
+                output (str): Chunk output mode
         """
         super().__init__(config)
         self._validate_config(self.config)
+        self.chunk_index = None
 
     def flow(self, df: pd.DataFrame, **args: Any) -> pd.DataFrame:
         """Execute the chunking pipeline.
@@ -69,8 +93,19 @@ class ChunkingPipe(Pipe):
         Log.info(f"Max chunk size: {max_chunk_size}")
         Log.info(f"Min chunk size: {min_chunk_size}")
 
-        chunked_df = self._chunk_dataframe(df, columns, max_chunk_size,
-                                           min_chunk_size)
+        if self.config.get("output", "rows") == "index":
+            self.chunk_index = self._build_chunk_index(
+                df, columns[0], self.config.get("id_column", "id"),
+                max_chunk_size, min_chunk_size)
+            Log.info("Finished ChunkingPipe")
+            return df
+
+        if self.config.get("engine", "offsets") == "legacy":
+            chunked_df = self._chunk_dataframe(df, columns, max_chunk_size,
+                                               min_chunk_size)
+        else:
+            chunked_df = self._chunk_dataframe_offsets(
+                df, columns, max_chunk_size, min_chunk_size)
 
         Log.info("Finished ChunkingPipe")
         return chunked_df
@@ -100,6 +135,25 @@ class ChunkingPipe(Pipe):
         if not isinstance(min_chunk_size, int) or min_chunk_size < 0:
             raise ValueError("min_chunk_size must be a non-negative integer")
 
+        if config.get("engine", "offsets") not in ["offsets", "legacy"]:
+            raise ValueError("engine must be 'offsets' or 'legacy'")
+
+        output = config.get("output", "rows")
+        if output not in ["rows", "index"]:
+            raise ValueError("output must be 'rows' or 'index'")
+        if output == "index" and len(columns) != 1:
+            raise ValueError("Index output requires exactly one column")
+
+    def side_tables(self) -> Dict[str, pd.DataFrame]:
+        """Get the chunk index built by the last flow in index mode.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Chunk index keyed by file suffix
+        """
+        if self.chunk_index is None:
+            return {}
+        return {ChunkIndex.SUFFIX: self.chunk_index}
+
     @staticmethod
     def _chunk_text(text: str, max_chunk_size: int,
                     min_chunk_size: int) -> List[str]:
@@ -130,6 +184,131 @@ class ChunkingPipe(Pipe):
             chunks.append(text)
         return chunks
 
+    @staticmethod
+    def _chunk_offsets(text: str, max_chunk_size: int,
+                       min_chunk_size: int) -> List[Tuple[int, int]]:
+        """Compute chunk boundaries with the semantics of _chunk_text.
+
+        Instead of slicing and stripping the remaining text after every
+        chunk, the remainder is tracked as a (start, end) window: leading
+        whitespace advances start, and trailing whitespace is trimmed from
+        end once, after the first cut.
+
+        Args:
+            text (str): Input text to chunk
+            max_chunk_size (int): Maximum size of each chunk
+            min_chunk_size (int): Minimum size of each chunk
+
+        Returns:
+            List[Tuple[int, int]]: (start, end) offset of each chunk
+        """
+        start, end = 0, len(text)
+        if max_chunk_size <= 0:
+            return [(start, end)]
+
+        offsets = []
+        trimmed = False
+        while end - start > max_chunk_size:
+            cut = start + max_chunk_size
+            last_space = text.rfind(" ", start, cut)
+            if last_space != -1 and last_space - start >= min_chunk_size:
+                cut = last_space
+            offsets.append((start, cut))
+            if not trimmed:
+                end = len(text.rstrip())
+                trimmed = True
+            start = min(WHITESPACE.match(text, cut).end(), max(end, cut))
+
+        if end > start:
+            offsets.append((start, end))
+        return offsets
+
+    @classmethod
+    def _build_chunk_index(cls, df: pd.DataFrame, column: str,
+                           id_column: str, max_chunk_size: int,
+                           min_chunk_size: int) -> pd.DataFrame:
+        """Build the chunk index of one column.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            column (str): Column to chunk
+            id_column (str): Parent id column
+            max_chunk_size (int): Maximum size of each chunk
+            min_chunk_size (int): Minimum size of each chunk
+
+        Returns:
+            pd.DataFrame: Chunk index
+
+        Raises:
+            KeyError: If the id column is missing
+        """
+        if id_column not in df.columns:
+            raise KeyError(f"Missing id column for chunk index: {id_column}")
+
+        offsets = [
+            cls._chunk_offsets(text, max_chunk_size, min_chunk_size)
+            for text in df[column].tolist()
+        ]
+        index = ChunkIndex.build(df[id_column], offsets)
+
+        total_chunks = len(index)
+        avg_chunk_size = int((index["end"] - index["start"]).mean()) \
+            if total_chunks else 0
+        Log.info(f"Average chunk size: {avg_chunk_size} characters.")
+        Log.info(f"Indexed {total_chunks} chunks of {len(df)} rows.")
+        return index
+
+    @classmethod
+    def _chunk_dataframe_offsets(cls, df: pd.DataFrame, columns: List[str],
+                                 max_chunk_size: int,
+                                 min_chunk_size: int) -> pd.DataFrame:
+        """Chunk specified columns from integer chunk offsets.
+
+        Rows are ordered like the legacy engine: by source row, then by
+        chunked column. A chunk of one column leaves the other chunked
+        columns empty.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            columns (List[str]): Columns to chunk
+            max_chunk_size (int): Maximum size of each chunk
+            min_chunk_size (int): Minimum size of each chunk
+
+        Returns:
+            pd.DataFrame: DataFrame with chunked text
+        """
+        rows, owners, chunks = [], [], []
+        for index, col in enumerate(columns):
+            for row, text in enumerate(df[col].tolist()):
+                offsets = cls._chunk_offsets(text, max_chunk_size,
+                                             min_chunk_size)
+                rows.extend([row] * len(offsets))
+                owners.extend([index] * len(offsets))
+                chunks.extend(text[start:end] for start, end in offsets)
+
+        rows = np.asarray(rows, dtype=np.intp)
+        owners = np.asarray(owners, dtype=np.intp)
+        order = np.lexsort((owners, rows))
+        rows, owners = rows[order], owners[order]
+        chunks = np.asarray(chunks, dtype=object)[order]
+
+        chunked_df = df.take(rows).reset_index(drop=True)
+        for index, col in enumerate(columns):
+            values = np.full(len(chunks), None, dtype=object)
+            mask = owners == index
+            values[mask] = chunks[mask]
+            chunked_df[col] = values
+
+        total_chunks = len(chunks)
+        total_chunk_size = sum(len(chunk) for chunk in chunks)
+        avg_chunk_size = (total_chunk_size //
+                          total_chunks if total_chunks else 0)
+        new_chunks = total_chunks - len(df)
+        Log.info(f"Average chunk size: {avg_chunk_size} characters.")
+        Log.info(f"Added {new_chunks} chunks ({total_chunks} total).")
+
+        return chunked_df
+
     @classmethod
     def _chunk_dataframe(cls, df: pd.DataFrame, columns: List[str],
                          max_chunk_size: int,
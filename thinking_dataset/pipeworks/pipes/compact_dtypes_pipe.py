@@ -0,0 +1,181 @@
+"""Compact Dtypes Pipeline Module.
+
+This module provides functionality for shrinking the memory footprint of
+DataFrames by converting each column to the most compact dtype that holds
+its values unchanged.
+
+Functions:
+    None
+
+Classes:
+    CompactDtypesPipe: Handles per-column dtype compaction.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from thinking_dataset.utils.log import Log
+from thinking_dataset.utils.series_utils import SeriesUtils
+from .pipe import Pipe
+
+__version__ = "0.0.2"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+
+class CompactDtypesPipe(Pipe):
+    """Pipe for compacting column dtypes.
+
+    This pipe:
+    1. Downcasts integer columns to the smallest integer type
+    2. Converts low-cardinality string columns to categoricals
+    3. Converts other string columns to Arrow-backed strings
+    4. Reports memory usage per column before and after
+
+    Values are unchanged, so the pipe can run anywhere in a pipeline: the
+    compacted dtypes hash like the originals for deduplication and round
+    trip through parquet, where categoricals are stored dictionary-encoded.
+    Columns mixing strings with other values are left as they are.
+
+    Config:
+        columns (List[str]): Columns to compact, or ["auto"] for all.
+            Defaults to ["auto"].
+        max_unique_ratio (float): Largest ratio of distinct to total values
+            of a categorical column. Defaults to 0.5.
+        integers (bool): Whether to downcast integers. Defaults to True.
+        text (str): "arrow" (default) to convert other string columns to
+            Arrow-backed strings, "keep" to leave them
+        report (bool): Whether to log memory per column. Defaults to True.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize compact dtypes pipe with configuration.
+
+        Args:
+            config (Optional[Dict[str, Any]]): Configuration containing:
+                columns (List[str]): Columns to compact
+                max_unique_ratio (float): Categorical cardinality limit
+                integers (bool): Integer downcasting switch
+                text (str): Text column handling
+                report (bool): Memory report switch
+        """
+        super().__init__(config or {})
+        self._validate_config(self.config)
+
+    def flow(self, df: pd.DataFrame, **args: Any) -> pd.DataFrame:
+        """Execute the dtype compaction pipeline.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            **args: Additional arguments
+
+        Returns:
+            pd.DataFrame: DataFrame with compacted dtypes
+
+        Raises:
+            KeyError: If configured columns are missing
+        """
+        Log.info("Starting CompactDtypesPipe")
+
+        columns = self._get_columns(df)
+        report = self.config.get("report", True)
+        before = df[columns].memory_usage(index=False,
+                                          deep=True) if report else None
+
+        df = df.copy(deep=False)
+        for column in columns:
+            df[column] = self._compact(df[column])
+
+        if report:
+            after = df[columns].memory_usage(index=False, deep=True)
+            self._log_results(df, before, after)
+        Log.info("Finished CompactDtypesPipe")
+        return df
+
+    def _get_columns(self, df: pd.DataFrame) -> List[str]:
+        """Get columns to compact.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+
+        Returns:
+            List[str]: Configured columns, or all of them for ["auto"]
+
+        Raises:
+            KeyError: If configured columns are missing
+        """
+        columns = self.config.get("columns", ["auto"])
+        if "auto" in columns:
+            return list(df.columns)
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise KeyError(f"Columns not found in DataFrame: {missing}")
+        return list(columns)
+
+    def _compact(self, series: pd.Series) -> pd.Series:
+        """Convert a column to its most compact lossless dtype.
+
+        Args:
+            series (pd.Series): Input column
+
+        Returns:
+            pd.Series: Compacted column, or the input if no conversion
+                applies
+        """
+        dtype = series.dtype
+        if pd.api.types.is_integer_dtype(dtype):
+            if not self.config.get("integers", True):
+                return series
+            return pd.to_numeric(series, downcast="integer")
+
+        if isinstance(dtype, pd.CategoricalDtype) or \
+                not SeriesUtils.is_text(series) or not len(series):
+            return series
+
+        ratio = self.config.get("max_unique_ratio", 0.5)
+        if series.nunique() <= ratio * len(series):
+            return series.astype("category")
+        if self.config.get("text", "arrow") == "arrow":
+            return SeriesUtils.as_strings(series)
+        return series
+
+    @classmethod
+    def _validate_config(cls, config: Optional[dict] = None) -> None:
+        """Validate pipe configuration.
+
+        Args:
+            config (Optional[dict]): Configuration to validate
+
+        Raises:
+            ValueError: If configuration is invalid
+        """
+        if not config:
+            return
+
+        ratio = config.get("max_unique_ratio", 0.5)
+        if not isinstance(ratio, (int, float)) or not 0 <= ratio <= 1:
+            raise ValueError("max_unique_ratio must be between 0 and 1")
+        if config.get("text", "arrow") not in ["arrow", "keep"]:
+            raise ValueError("text must be 'arrow' or 'keep'")
+
+    @staticmethod
+    def _log_results(df: pd.DataFrame, before: pd.Series,
+                     after: pd.Series) -> None:
+        """Log memory usage per column before and after compaction.
+
+        Args:
+            df (pd.DataFrame): Compacted DataFrame
+            before (pd.Series): Deep memory usage per column before
+            after (pd.Series): Deep memory usage per column after
+        """
+        for column in before.index:
+            Log.info(f"Column: {column} | Dtype: {df[column].dtype} | "
+                     f"Memory: {before[column]:,} -> {after[column]:,} bytes")
+
+        total_before, total_after = int(before.sum()), int(after.sum())
+        saved = total_before - total_after
+        percentage = saved / total_before * 100 if total_before else 0
+        Log.info(f"Memory: {total_before:,} -> {total_after:,} bytes "
+                 f"(saved {saved:,} bytes, {percentage:.1f}%)")
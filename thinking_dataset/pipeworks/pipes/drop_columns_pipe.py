@@ -14,10 +14,11 @@ from typing import Any, Dict, List
 
 import pandas as pd
 
+from thinking_dataset.io.read_plan import ReadPlan
 from thinking_dataset.utils.log import Log
 from .pipe import Pipe
 
-__version__ = "0.0.2"
+__version__ = "0.0.3"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
@@ -68,6 +69,18 @@ class DropColumnsPipe(Pipe):
 
         return df
 
+    def pushdown(self, plan: ReadPlan) -> bool:
+        """Remove the dropped columns from the read plan.
+
+        Args:
+            plan (ReadPlan): Read plan to update
+
+        Returns:
+            bool: Always True
+        """
+        plan.drop(self.config.get("columns", []))
+        return True
+
     @classmethod
     def _validate_config(cls, config: Dict[str, Any]) -> None:
         """Validate pipe configuration.
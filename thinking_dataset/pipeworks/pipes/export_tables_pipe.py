@@ -1,6 +1,6 @@
 # @file thinking_dataset/pipeworks/pipes/export_tables_pipe.py
 # @description Pipe for exporting tables with consistent shapes.
-# @version 1.2.39
+# @version 1.2.41
 # @license MIT
 
 import pandas as pd
@@ -9,6 +9,8 @@ import thinking_dataset.config as conf
 import thinking_dataset.config.config_keys as keys
 from .pipe import Pipe
 from thinking_dataset.io.files import Files
+from thinking_dataset.utils.chunk_index import ChunkIndex
+from thinking_dataset.utils.feature_store import FeatureStore
 from thinking_dataset.utils.log import Log
 from thinking_dataset.db.database import Database
 
@@ -25,6 +27,7 @@ class ExportTablesPipe(Pipe):
     - Data merging from multiple tables
     - File output in various formats
     - Data sharding for large datasets
+    - Lazy expansion of chunk indexes into chunk rows
     """
 
     def _fetch_all_tables(self, db: Database) -> list:
@@ -62,7 +65,14 @@ class ExportTablesPipe(Pipe):
 
     def _fetch_data_from_database(self, table: str,
                                   db: Database) -> pd.DataFrame:
-        return db.fetch_data(table)
+        df = db.fetch_data(table)
+        chunk_column = self.config.get("chunk_column")
+        index_table = ChunkIndex.table_name(table)
+        if chunk_column and index_table in self._fetch_all_tables(db):
+            Log.info(f"Expanding chunks of {table} from {index_table}")
+            df = ChunkIndex.expand(df, db.fetch_data(index_table),
+                                   chunk_column)
+        return df
 
     def _remap_columns(self, df: pd.DataFrame, schema: list,
                        drop_columns: bool) -> pd.DataFrame:
@@ -113,7 +123,11 @@ class ExportTablesPipe(Pipe):
             raise ValueError("Schema is not set in the configuration.")
 
         if "all" in tables:
-            tables = self._fetch_all_tables(db)
+            tables = [
+                table for table in self._fetch_all_tables(db)
+                if not ChunkIndex.is_index_table(table)
+                and not FeatureStore.is_feature_table(table)
+            ]
 
         Log.info("Starting ExportTablesPipe")
         Log.info(f"Exporting columns: {columns}")
@@ -0,0 +1,124 @@
+"""Feature Store Pipeline Module.
+
+This module provides functionality for computing per-row text features
+once, in vectorized form, and keeping them as a side table next to the
+output file so that later stages read them instead of recomputing them.
+
+Functions:
+    None
+
+Classes:
+    FeatureStorePipe: Handles building per-row feature tables.
+"""
+
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from thinking_dataset.utils.feature_store import FeatureStore
+from thinking_dataset.utils.log import Log
+from .pipe import Pipe
+
+__version__ = "0.0.3"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+
+class FeatureStorePipe(Pipe):
+    """Pipe for building per-row feature tables.
+
+    This pipe:
+    1. Computes char and byte length, token estimate, content hash,
+       non-ASCII ratio and partial extract flag of each text column
+    2. Keeps them as a side table of one row per id and column
+    3. Returns the rows unchanged
+
+    The pipeline saves the table next to the output file as {base}-features,
+    and loading the dataset stores it in an indexed {table}-features table.
+    Later runs of FilterBySizePipe with use_features read the file next to
+    their output and join sizes on the row id. The pipe belongs before
+    ChunkingPipe, after an AddIdPipe with hash ids, so every id names one
+    whole text.
+
+    Config:
+        columns (List[str]): Text columns to describe
+        id_column (str): Row id column. Defaults to "id".
+    """
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        """Initialize feature store pipe with configuration.
+
+        Args:
+            config (Dict[str, Any]): Configuration containing:
+                columns (List[str]): Text columns to describe
+                id_column (str): Row id column
+        """
+        super().__init__(config)
+        self._validate_config(self.config)
+        self.features: Optional[pd.DataFrame] = None
+
+    def flow(self, df: pd.DataFrame, **args: Any) -> pd.DataFrame:
+        """Execute the feature building pipeline.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            **args: Additional arguments
+
+        Returns:
+            pd.DataFrame: Unchanged input DataFrame
+
+        Raises:
+            KeyError: If the id or text columns are missing
+        """
+        Log.info("Starting FeatureStorePipe")
+
+        columns = self.config.get("columns", [])
+        id_column = self.config.get("id_column", "id")
+        if not columns:
+            Log.warn("No columns specified for features. Skipping.")
+            return df
+
+        missing = [
+            column for column in [id_column, *columns]
+            if column not in df.columns
+        ]
+        if missing:
+            raise KeyError(f"Columns not found in DataFrame: {missing}")
+
+        tables = [
+            FeatureStore.build(df, column, id_column) for column in columns
+        ]
+        self.features = pd.concat(tables, ignore_index=True) \
+            if len(tables) > 1 else tables[0]
+        Log.info(f"Built {len(self.features)} feature rows of {columns}")
+
+        Log.info("Finished FeatureStorePipe")
+        return df
+
+    @classmethod
+    def _validate_config(cls, config: Optional[dict] = None) -> None:
+        """Validate pipe configuration.
+
+        Args:
+            config (Optional[dict]): Configuration to validate
+
+        Raises:
+            ValueError: If configuration is invalid
+        """
+        if not config:
+            return
+
+        columns = config.get("columns", [])
+        if not isinstance(columns, list) or not columns:
+            raise ValueError("columns must be a non-empty list")
+
+    def side_tables(self) -> Dict[str, pd.DataFrame]:
+        """Get the features built by the last flow.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Feature table keyed by file suffix
+        """
+        if self.features is None:
+            return {}
+        return {FeatureStore.SUFFIX: self.features}
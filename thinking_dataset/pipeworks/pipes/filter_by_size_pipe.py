@@ -1,7 +1,8 @@
 """Size Filter Pipeline Module.
 
 This module provides functionality for filtering DataFrame entries based on
-content size thresholds.
+content size thresholds, measured in characters, UTF-8 bytes or estimated
+tokens with vectorized length kernels.
 
 Functions:
     None
@@ -14,15 +15,20 @@ from typing import Optional, Tuple
 
 import pandas as pd
 
+from thinking_dataset.utils.feature_store import FeatureStore
 from thinking_dataset.utils.log import Log
+from thinking_dataset.utils.series_utils import SeriesUtils
 from thinking_dataset.utils.text_utils import TextUtils
 from .pipe import Pipe
 
-__version__ = "0.0.2"
+__version__ = "0.0.6"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
 
+METRICS = ["chars", "bytes", "tokens"]
+MEMORY_STATS = ["estimate", "deep", "off"]
+
 
 class FilterBySizePipe(Pipe):
     """Pipe for filtering DataFrame entries by content size.
@@ -34,10 +40,28 @@ class FilterBySizePipe(Pipe):
     4. Tracks memory usage changes
     5. Provides detailed operation logging
 
+    Sizes are computed for the whole column at once. Missing values have
+    size 0. The filter is row-local, so flow() gives the same rows when it
+    is run on consecutive batches of the input.
+
+    With use_features, sizes are read from the features FeatureStorePipe
+    saved next to the pipeline output by an earlier run and joined on the
+    row id. Ids must be the hash ids of AddIdPipe, so a changed text has a
+    new id; rows without stored sizes are measured.
+
     Config:
         column_name (str): Column to check for size
         min_size (int): Minimum content size threshold
         max_size (int): Maximum content size threshold
+        metric (str): "chars" (default), "bytes" (UTF-8) or "tokens"
+            (characters / 4)
+        memory_stats (str): "estimate" (default) adds the measured column
+            sizes to the shallow memory usage, "deep" walks every string,
+            "off" skips memory logging
+        use_features (bool): Whether to read sizes from stored features.
+            Defaults to False.
+        id_column (str): Row id column of stored features. Defaults to
+            "id".
     """
 
     def __init__(self, config: dict) -> None:
@@ -51,6 +75,25 @@ class FilterBySizePipe(Pipe):
         """
         super().__init__(config)
         self._validate_config(self.config)
+        self.features: Optional[pd.DataFrame] = None
+
+    def prepare(self, input_file: str, dataset_type: str) -> str:
+        """Read the stored sizes next to the pipeline output with
+        use_features.
+
+        Args:
+            input_file (str): Path of the file about to be read
+            dataset_type (str): File type, e.g. "parquet" or "csv"
+
+        Returns:
+            str: The input file, unchanged
+        """
+        if self.config.get("use_features", False):
+            config = self._get_config()
+            self.features = FeatureStore.read(
+                self.output_file, dataset_type, config['column_name'],
+                [FeatureStore.METRICS[config['metric']]])
+        return input_file
 
     def flow(self, df: pd.DataFrame, **args) -> pd.DataFrame:
         """Execute the size filtering pipeline.
@@ -65,11 +108,13 @@ class FilterBySizePipe(Pipe):
         Log.info("Starting FilterBySizePipe")
 
         config = self._get_config()
-        initial_stats = self._get_dataframe_stats(df)
+        sizes = self._get_sizes(df, config)
+        initial_stats = self._get_dataframe_stats(df, sizes, config)
 
-        df = self._apply_size_filters(df, config)
+        mask = self._get_size_mask(sizes, config)
+        df, sizes = df[mask.to_numpy()], sizes[mask.to_numpy()]
 
-        final_stats = self._get_dataframe_stats(df)
+        final_stats = self._get_dataframe_stats(df, sizes, config)
         self._log_results(initial_stats, final_stats, config)
 
         Log.info("Finished FilterBySizePipe")
@@ -99,6 +144,11 @@ class FilterBySizePipe(Pipe):
         if not isinstance(max_size, (int, float)):
             raise ValueError("max_size must be a number")
 
+        if config.get("metric", "chars") not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}")
+        if config.get("memory_stats", "estimate") not in MEMORY_STATS:
+            raise ValueError(f"memory_stats must be one of {MEMORY_STATS}")
+
     def _get_config(self) -> dict:
         """Get processing configuration.
 
@@ -108,47 +158,84 @@ class FilterBySizePipe(Pipe):
         return {
             'column_name': self.config.get("column_name", "pdf_content"),
             'min_size': self.config.get("min_size", 0),
-            'max_size': self.config.get("max_size", 0)
+            'max_size': self.config.get("max_size", 0),
+            'metric': self.config.get("metric", "chars"),
+            'memory_stats': self.config.get("memory_stats", "estimate")
         }
 
+    def _get_sizes(self, df: pd.DataFrame, config: dict) -> pd.Series:
+        """Get the size of every row, from stored features if possible.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            config (dict): Filter configuration
+
+        Returns:
+            pd.Series: Size per row
+        """
+        column = df[config['column_name']]
+        id_column = self.config.get("id_column", "id")
+        if self.features is None or id_column not in df.columns:
+            return SeriesUtils.lengths(column, config['metric']).fillna(0)
+
+        values, known = FeatureStore.lookup(
+            self.features, df[id_column],
+            FeatureStore.METRICS[config['metric']])
+        sizes = pd.Series(values, index=df.index)
+        if not known.all():
+            sizes[~known] = SeriesUtils.lengths(column[~known],
+                                                config['metric']).fillna(0)
+        Log.info(f"Stored sizes used for {int(known.sum())} of {len(df)} "
+                 "rows")
+        return sizes
+
     @staticmethod
-    def _get_dataframe_stats(df: pd.DataFrame) -> Tuple[int, int]:
+    def _get_dataframe_stats(df: pd.DataFrame, sizes: pd.Series,
+                             config: dict) -> Tuple[int, int]:
         """Get DataFrame statistics.
 
         Args:
             df (pd.DataFrame): DataFrame to analyze
+            sizes (pd.Series): Measured size per row
+            config (dict): Filter configuration
 
         Returns:
-            Tuple[int, int]: (row_count, memory_usage)
+            Tuple[int, int]: (row_count, memory_usage), memory is 0 when
+                memory stats are off
         """
-        return len(df), df.memory_usage(deep=True).sum()
+        mode = config['memory_stats']
+        if mode == "off":
+            return len(df), 0
+        if mode == "deep":
+            return len(df), int(df.memory_usage(deep=True).sum())
+        scale = 4 if config['metric'] == "tokens" else 1
+        return len(df), int(df.memory_usage(deep=False).sum() +
+                            sizes.sum() * scale)
 
-    @classmethod
-    def _apply_size_filters(cls, df: pd.DataFrame,
-                            config: dict) -> pd.DataFrame:
-        """Apply size-based filters to DataFrame.
+    @staticmethod
+    def _get_size_mask(sizes: pd.Series, config: dict) -> pd.Series:
+        """Get the rows within the size thresholds.
 
         Args:
-            df (pd.DataFrame): Input DataFrame
+            sizes (pd.Series): Measured size per row
             config (dict): Filter configuration
 
         Returns:
-            pd.DataFrame: Filtered DataFrame
+            pd.Series: True for rows to keep
         """
-        column = config['column_name']
         min_size = config['min_size']
         max_size = config['max_size']
 
+        mask = pd.Series(True, index=sizes.index)
         if min_size <= 0 and max_size <= 0:
             Log.info("No filtering applied based on size.")
-            return df
+            return mask
 
-        if min_size <= 0:
-            return df[df[column].apply(lambda x: len(x) <= max_size)]
-        if max_size <= 0:
-            return df[df[column].apply(lambda x: len(x) >= min_size)]
-
-        return df[df[column].apply(lambda x: min_size <= len(x) <= max_size)]
+        if min_size > 0:
+            mask &= sizes >= min_size
+        if max_size > 0:
+            mask &= sizes <= max_size
+        return mask
 
     @classmethod
     def _log_results(cls, initial: Tuple[int, int], final: Tuple[int, int],
@@ -170,10 +257,13 @@ class FilterBySizePipe(Pipe):
 
         Log.info(f"Filtering column: {config['column_name']}")
         Log.info(f"Size thresholds - Min: {config['min_size']}, "
-                 f"Max: {config['max_size']}")
+                 f"Max: {config['max_size']} ({config['metric']})")
         Log.info(f"Filtered out {filtered_count} entries based on size")
         Log.info(f"New item count: {final_rows}")
 
+        if config['memory_stats'] == "off":
+            return
+
         if reduction_percentage < 1:
             Log.info("Dataset size reduced by: <1%")
         else:
@@ -1,7 +1,8 @@
 """Handle Missing Values Pipeline Module.
 
 This module provides functionality for handling missing values in DataFrames
-based on specified column configurations.
+based on specified column configurations, including empty and partial-extract
+text records.
 
 Functions:
     None
@@ -15,9 +16,11 @@ from typing import Any, List, Optional
 import pandas as pd
 
 from thinking_dataset.utils.log import Log
+from thinking_dataset.utils.series_utils import SeriesUtils
+from thinking_dataset.utils.text_utils import TextUtils
 from .pipe import Pipe
 
-__version__ = "0.0.2"
+__version__ = "0.0.4"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
@@ -29,13 +32,22 @@ class HandleMissingValuesPipe(Pipe):
     This pipe:
     1. Validates column specifications
     2. Handles missing value imputation or removal
-    3. Provides detailed operation logging
+    3. Removes empty and partial-extract text records
+    4. Provides detailed operation logging
+
+    Empty and partial records are found with vectorized string kernels over
+    the text columns among the checked columns, so they are dropped before
+    any per-row pipe runs on them.
 
     Config:
         columns (List[str]): Columns to check for missing values
         strategy (str): Strategy for handling missing values ('drop' or 'fill')
         fill_value (Any): Value to use for filling missing values (if strategy
             is 'fill')
+        remove_partials (bool): Whether to drop rows whose text opens with
+            the partial-extract boilerplate. Defaults to False.
+        allow_empty (bool): Whether to keep rows with empty or
+            whitespace-only text. Defaults to True.
     """
 
     def __init__(self, config: dict) -> None:
@@ -82,6 +94,8 @@ class HandleMissingValuesPipe(Pipe):
             Log.error(f"Unknown strategy: {strategy}")
             raise ValueError(f"Unknown strategy: {strategy}")
 
+        df = self._drop_text_records(df, columns)
+
         self._log_results(initial_length, len(df))
         Log.info("Finished HandleMissingValuesPipe")
         return df
@@ -154,11 +168,46 @@ class HandleMissingValuesPipe(Pipe):
         Log.info(f"Dropping rows with missing values in columns: {columns}")
         return df.dropna(subset=columns)
 
+    def _drop_text_records(self, df: pd.DataFrame,
+                           columns: List[str]) -> pd.DataFrame:
+        """Drop empty and partial-extract records in text columns.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            columns (List[str]): Checked columns
+
+        Returns:
+            pd.DataFrame: DataFrame without the configured text records
+        """
+        remove_partials = self.config.get("remove_partials", False)
+        allow_empty = self.config.get("allow_empty", True)
+        if not remove_partials and allow_empty:
+            return df
+
+        empty = pd.Series(False, index=df.index)
+        partial = pd.Series(False, index=df.index)
+        for col in columns:
+            if not SeriesUtils.is_text(df[col]):
+                continue
+            strings = SeriesUtils.as_strings(df[col])
+            if not allow_empty:
+                empty |= ~strings.str.contains(r"\S").fillna(True)
+            if remove_partials:
+                partial |= strings.str.match(TextUtils.PARTIAL_EXTRACT_INTRO,
+                                             case=False).fillna(False)
+
+        partial &= ~empty
+        Log.info(f"Removed {int(empty.sum())} empty records and "
+                 f"{int(partial.sum())} partial-extract records")
+        return df[~(empty | partial).to_numpy()]
+
     @staticmethod
     def _fill_missing_values(df: pd.DataFrame, columns: List[str],
                              fill_value: Any) -> pd.DataFrame:
         """Fill missing values in specified columns with a given value.
 
+        The fill value is added to the categories of categorical columns.
+
         Args:
             df (pd.DataFrame): Input DataFrame
             columns (List[str]): Columns to check for missing values
@@ -169,6 +218,12 @@ class HandleMissingValuesPipe(Pipe):
         """
         Log.info(f"Filling missing values in columns: {columns} "
                  f"with value: {fill_value}")
+        for col in columns:
+            dtype = df[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype) and \
+                    fill_value not in dtype.categories:
+                df = df.assign(
+                    **{col: df[col].cat.add_categories([fill_value])})
         return df.fillna({col: fill_value for col in columns})
 
     @classmethod
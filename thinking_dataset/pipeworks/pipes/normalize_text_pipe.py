@@ -15,10 +15,14 @@ from typing import Dict, List, Optional, Callable
 import pandas as pd
 
 from thinking_dataset.utils.log import Log
+from thinking_dataset.utils.regex_backend import (
+    RegexBackend as Regex,
+    RegexTimeoutError,
+)
 from thinking_dataset.utils.text_utils import TextUtils as Text
 from .pipe import Pipe
 
-__version__ = "0.0.2"
+__version__ = "0.0.3"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
@@ -34,11 +38,24 @@ class NormalizeTextPipe(Pipe):
     4. Normalizes numbers and special characters
     5. Cleans up whitespace and formatting
     6. Supports multi-threaded processing
+    7. Runs patterns on a configurable regex backend with a time guard
+
+    The regex settings only apply while this pipe runs; the previous
+    backend settings are restored afterwards. The time guard is checked
+    before each step, so on the 're' engine it skips the remaining steps
+    of a slow document but cannot interrupt a single catastrophic match.
+    Only the 'regex' engine stops a match in progress.
 
     Config:
         columns (List[str]): Columns to normalize
         contractions (Dict[str, str]): Contraction mappings
         terms (Dict[str, str]): Term expansion mappings
+        regex (dict): Optional regex backend settings:
+            backend (str): 're', 'regex' or 're2'. Defaults to 're'.
+            overrides (Dict[str, str]): Backend per TextUtils function
+            timeout (float): Per-document budget in seconds. Once spent,
+                the remaining steps are skipped for that document; only
+                the 'regex' engine interrupts a match in progress.
     """
 
     def __init__(self, config: dict) -> None:
@@ -49,6 +66,7 @@ class NormalizeTextPipe(Pipe):
                 columns (List[str]): Columns to process
                 contractions (Dict[str, str]): Contraction mappings
                 terms (Dict[str, str]): Term mappings
+                regex (dict): Regex backend settings
         """
         super().__init__(config)
         self._validate_config(self.config)
@@ -68,11 +86,13 @@ class NormalizeTextPipe(Pipe):
         columns = self.config.get("columns", [])
         contractions = self.config.get("contractions", {})
         terms = self.config.get("terms", {})
+        regex = self.config.get("regex", {})
 
         normalize_func = self._create_normalizer(contractions, terms)
 
         self._log_start(columns)
-        df = self._process_columns(df, columns, normalize_func)
+        with Regex.settings(**regex):
+            df = self._process_columns(df, columns, normalize_func)
 
         Log.info("Finished NormalizeTextPipe")
         return df
@@ -102,6 +122,13 @@ class NormalizeTextPipe(Pipe):
         if not isinstance(terms, dict):
             raise ValueError("Terms must be specified as a dictionary")
 
+        regex = config.get("regex", {})
+        if not isinstance(regex, dict):
+            raise ValueError("Regex must be specified as a dictionary")
+        unknown = set(regex) - {"backend", "overrides", "timeout"}
+        if unknown:
+            raise ValueError(f"Unknown regex settings: {sorted(unknown)}")
+
     @classmethod
     def _log_start(cls, columns: List[str]) -> None:
         """Log initialization details.
@@ -159,28 +186,38 @@ class NormalizeTextPipe(Pipe):
             Callable[[str], str]: Text normalization function
         """
 
+        steps: List[Callable[[str], str]] = [
+            Text.remove_partial_extract_intro,
+            Text.remove_header,
+            Text.remove_initial_pattern,
+            Text.remove_tiny_parentheses_content,
+            Text.remove_separators,
+            Text.remove_special_characters,
+            lambda text: Text.expand_contractions(text, contractions),
+            lambda text: Text.expand_terms(text, terms),
+            Text.remove_section_headers,
+            Text.remove_signoff,
+            Text.remove_period_patterns,
+            Text.normalize_numbers,
+            Text.normalize_spaced_characters,
+            Text.remove_weird_ids,
+            Text.remove_weird_dates,
+            Text.remove_whitespace,
+        ]
+
         def normalize_text(text: str) -> str:
             """Apply all normalization steps to input text."""
             if not isinstance(text, str):
                 return str(text)
 
             text = text.lower()
-            text = Text.remove_partial_extract_intro(text)
-            text = Text.remove_header(text)
-            text = Text.remove_initial_pattern(text)
-            text = Text.remove_tiny_parentheses_content(text)
-            text = Text.remove_separators(text)
-            text = Text.remove_special_characters(text)
-            text = Text.expand_contractions(text, contractions)
-            text = Text.expand_terms(text, terms)
-            text = Text.remove_section_headers(text)
-            text = Text.remove_signoff(text)
-            text = Text.remove_period_patterns(text)
-            text = Text.normalize_numbers(text)
-            text = Text.normalize_spaced_characters(text)
-            text = Text.remove_weird_ids(text)
-            text = Text.remove_weird_dates(text)
-            text = Text.remove_whitespace(text)
+            with Regex.guard():
+                try:
+                    for step in steps:
+                        text = step(text)
+                except RegexTimeoutError as e:
+                    Log.warn(f"{e}; skipping remaining normalization for "
+                             f"document of {len(text)} characters")
             return text
 
         return normalize_text
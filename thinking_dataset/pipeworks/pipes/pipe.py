@@ -10,7 +10,7 @@ Classes:
     Pipe: Abstract base class for all processing pipes.
 """
 
-__version__ = "0.0.3"
+__version__ = "0.0.5"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
@@ -21,11 +21,12 @@ import sys
 import threading
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Callable, List, Type
+from typing import Any, Callable, Dict, List, Type
 
 import pandas as pd
 from tqdm import tqdm
 
+from thinking_dataset.io.read_plan import ReadPlan
 from thinking_dataset.utils.command_utils import CommandUtils as utils
 from thinking_dataset.utils.log import Log
 
@@ -42,10 +43,12 @@ class Pipe(ABC):
     Attributes:
         abort_flag (Event): Threading event for interruption handling
         config (dict): Pipe configuration dictionary
+        output_file (str): Output path of the file being processed
     """
 
     abort_flag: threading.Event = threading.Event()
     pipeline_config: dict = {}
+    output_file: str = ""
 
     def __init__(self, config: dict) -> None:
         """Initialize pipe with configuration.
@@ -65,6 +68,18 @@ class Pipe(ABC):
         """
         cls.pipeline_config = config or {}
 
+    @classmethod
+    def set_output_file(cls, file_path: str) -> None:
+        """Set the output path of the file being processed.
+
+        Pipes reading tables saved next to the output by earlier runs,
+        such as stored features, locate them from it.
+
+        Args:
+            file_path (str): Output file path
+        """
+        cls.output_file = file_path or ""
+
     @classmethod
     def get_batch_size(cls) -> int:
         """Get batch size from current pipeline configuration.
@@ -88,6 +103,76 @@ class Pipe(ABC):
         Log.info(f"Flow -- {self.__class__.__name__}")
         raise NotImplementedError("Pipe subclasses must implement flow()")
 
+    def pushdown(self, plan: ReadPlan) -> bool:
+        """Describe this pipe's effect on the columns and rows to read.
+
+        Leading pipes whose work can be done by the reader update the plan
+        and return True, so the pipeline keeps planning with the next pipe.
+        The pipe still runs on the data that was read and must give the
+        same result there. The default stops planning.
+
+        Args:
+            plan (ReadPlan): Read plan to update
+
+        Returns:
+            bool: Whether planning may continue past this pipe
+        """
+        return False
+
+    def prepare(self, input_file: str, dataset_type: str) -> str:
+        """Process the input file before the pipeline reads it.
+
+        Pipes that can work on the stored file without loading it, such as
+        out-of-core passes, override this hook and return the path of the
+        file to read instead. The default returns the input unchanged.
+
+        Args:
+            input_file (str): Path of the file about to be read
+            dataset_type (str): File type, e.g. "parquet" or "csv"
+
+        Returns:
+            str: Path of the file the pipeline should read
+        """
+        return input_file
+
+    def prepares_rows(self) -> bool:
+        """Check whether prepare() selects the rows of the input file.
+
+        Such passes see the stored file before any flow() runs, so the
+        pipeline only allows them ahead of every other pipe. The default
+        returns False.
+
+        Returns:
+            bool: Whether prepare() rewrites the input rows
+        """
+        return False
+
+    def side_tables(self) -> Dict[str, pd.DataFrame]:
+        """Get extra tables to save next to the pipeline output.
+
+        The pipeline writes each table to {base}-{suffix} beside the output
+        file once the output is saved. The default returns no tables.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Tables keyed by file suffix
+        """
+        return {}
+
+    def close(self) -> None:
+        """Finalize the pipe after the pipeline output was saved.
+
+        Pipes holding state that must only persist for successful runs
+        override this hook. The default does nothing.
+        """
+
+    def abort(self) -> None:
+        """Clean up the pipe after a failed run.
+
+        Pipes holding temporary files or staged state override this hook
+        to remove them without persisting anything. It may run after
+        close() and must then do nothing. The default does nothing.
+        """
+
     @classmethod
     def get_pipe(cls, pipe_type: str) -> Type['Pipe']:
         """Get pipe class by type name.
@@ -0,0 +1,205 @@
+"""Quality Gate Pipeline Module.
+
+This module provides functionality for dropping low-quality text rows early,
+using cheap vectorized signals computed in one pass over a text column.
+
+Functions:
+    None
+
+Classes:
+    QualityGatePipe: Handles signal-based quality filtering.
+"""
+
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from thinking_dataset.utils.log import Log
+from thinking_dataset.utils.series_utils import SeriesUtils
+from thinking_dataset.utils.text_utils import TextUtils
+from .pipe import Pipe
+
+__version__ = "0.0.2"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+THRESHOLDS = {
+    "max_non_ascii_ratio": ("non_ascii_ratio", "max"),
+    "max_digit_ratio": ("digit_ratio", "max"),
+    "min_mean_word_length": ("mean_word_length", "min"),
+    "max_mean_word_length": ("mean_word_length", "max"),
+    "max_repeated_line_ratio": ("repeated_line_ratio", "max"),
+}
+
+
+class QualityGatePipe(Pipe):
+    """Pipe for dropping rows whose cheap quality signals are out of range.
+
+    This pipe:
+    1. Validates threshold configurations
+    2. Computes vectorized signals over one text column
+    3. Drops rows outside any configured threshold
+    4. Logs rejection counts per signal
+
+    Place it before NormalizeTextPipe so rejected rows never reach the
+    per-row normalization and generation stages. Unset thresholds are not
+    computed. Rows with missing text are left to HandleMissingValuesPipe.
+
+    Config:
+        column_name (str): Text column to score
+        max_non_ascii_ratio (float): Maximum share of non-ASCII characters
+        max_digit_ratio (float): Maximum share of digits
+        min_mean_word_length (float): Minimum mean word length
+        max_mean_word_length (float): Maximum mean word length
+        max_repeated_line_ratio (float): Maximum share of repeated lines
+        drop_partials (bool): Drop rows opening with the partial-extract
+            boilerplate matched by TextUtils.remove_partial_extract_intro
+        markers (List[str]): Extra boilerplate patterns in Python re
+            syntax, matched case-insensitively with pandas str.contains;
+            rows matching any of them are dropped
+    """
+
+    def __init__(self, config: dict) -> None:
+        """Initialize quality gate pipe with configuration.
+
+        Args:
+            config (dict): Configuration containing:
+                column_name (str): Column to score
+                max_*/min_* (float): Signal thresholds
+                drop_partials (bool): Drop partial-extract rows
+                markers (List[str]): Extra boilerplate patterns
+        """
+        super().__init__(config)
+        self._validate_config(self.config)
+
+    def flow(self, df: pd.DataFrame, **args) -> pd.DataFrame:
+        """Execute the quality gate pipeline.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            **args: Additional arguments
+
+        Returns:
+            pd.DataFrame: DataFrame without rejected rows
+
+        Raises:
+            KeyError: If the text column is missing
+        """
+        Log.info("Starting QualityGatePipe")
+
+        column = self.config.get("column_name", "cable")
+        if column not in df.columns:
+            raise KeyError(f"Missing column for quality gate: {column}")
+
+        rejections = self._get_rejections(df[column])
+        if not rejections:
+            Log.info("No quality thresholds configured. Skipping.")
+            return df
+
+        rejected = pd.concat(rejections, axis=1).any(axis=1)
+        self._log_results(column, rejections, rejected, len(df))
+
+        Log.info("Finished QualityGatePipe")
+        return df[~rejected.to_numpy()]
+
+    @classmethod
+    def _validate_config(cls, config: Optional[dict] = None) -> None:
+        """Validate pipe configuration.
+
+        Args:
+            config (Optional[dict]): Configuration to validate
+
+        Raises:
+            ValueError: If configuration is invalid
+        """
+        if not config:
+            return
+
+        for key in THRESHOLDS:
+            value = config.get(key)
+            if value is not None and not isinstance(value, (int, float)):
+                raise ValueError(f"{key} must be a number")
+
+        markers = config.get("markers", [])
+        if not isinstance(markers, list):
+            raise ValueError("Markers must be specified as a list")
+
+    def _get_rejections(self, series: pd.Series) -> Dict[str, pd.Series]:
+        """Compute a rejection mask per configured signal.
+
+        Args:
+            series (pd.Series): Text column
+
+        Returns:
+            Dict[str, pd.Series]: Boolean mask per rejection reason
+        """
+        strings = SeriesUtils.as_strings(series)
+        signals = {}
+        rejections = {}
+
+        for key, (signal, bound) in THRESHOLDS.items():
+            threshold = self.config.get(key)
+            if threshold is None:
+                continue
+            if signal not in signals:
+                signals[signal] = self._compute_signal(strings, signal)
+            values = signals[signal]
+            rejections[key] = values > threshold \
+                if bound == "max" else values < threshold
+
+        markers = self._get_markers()
+        if markers:
+            pattern = "|".join(f"(?:{marker})" for marker in markers)
+            rejections["markers"] = strings.str.contains(
+                pattern, case=False, regex=True).fillna(False).astype(bool)
+
+        return rejections
+
+    def _get_markers(self) -> List[str]:
+        """Get boilerplate patterns to reject.
+
+        Returns:
+            List[str]: Configured markers plus the partial-extract intro
+        """
+        markers = list(self.config.get("markers", []))
+        if self.config.get("drop_partials", False):
+            markers.append(TextUtils.PARTIAL_EXTRACT_INTRO)
+        return markers
+
+    @staticmethod
+    def _compute_signal(strings: pd.Series, signal: str) -> pd.Series:
+        """Compute one vectorized quality signal.
+
+        Args:
+            strings (pd.Series): String column
+            signal (str): Signal name
+
+        Returns:
+            pd.Series: Signal value per row
+        """
+        if signal == "non_ascii_ratio":
+            return SeriesUtils.ratio(strings, r"[^\x00-\x7f]")
+        if signal == "digit_ratio":
+            return SeriesUtils.ratio(strings, r"[0-9]")
+        if signal == "mean_word_length":
+            return SeriesUtils.mean_word_length(strings)
+        return SeriesUtils.repeated_line_ratio(strings)
+
+    @staticmethod
+    def _log_results(column: str, rejections: Dict[str, pd.Series],
+                     rejected: pd.Series, initial_length: int) -> None:
+        """Log rejection counts per signal.
+
+        Args:
+            column (str): Scored column
+            rejections (Dict[str, pd.Series]): Mask per rejection reason
+            rejected (pd.Series): Combined rejection mask
+            initial_length (int): Initial number of rows
+        """
+        Log.info(f"Quality gate column: {column}")
+        for reason, mask in rejections.items():
+            Log.info(f"Rejected by {reason}: {int(mask.sum())}")
+        removed_count = int(rejected.sum())
+        Log.info(f"Removed {removed_count} rows failing quality gate")
+        Log.info(f"Final number of rows: {initial_length - removed_count}")
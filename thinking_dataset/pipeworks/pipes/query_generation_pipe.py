@@ -1,33 +1,84 @@
 """Query Generation Pipeline Module."""
 
-__version__ = "0.0.3"
+__version__ = "0.0.14"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
 
-import re
-from typing import List, Any
+from dataclasses import asdict
+from typing import Iterator, List, Any, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import (BigInteger, Column, Float, MetaData, Table, Text,
+                        insert, inspect, select, update)
 from tenacity import retry, stop_after_attempt, wait_fixed
 
+from thinking_dataset.db.template_registry import TemplateRegistry
 from thinking_dataset.decorators.with_db_session import with_db_session
+from thinking_dataset.templates.compiled_template import CompiledTemplate
 from thinking_dataset.templates.template_loader import TemplateLoader
 from thinking_dataset.sources.input_source import InputSource
 from thinking_dataset.sources.output_source import OutputSource
+from thinking_dataset.sources.query_reference import (QueryReferences,
+                                                      QueryRenderer)
+from thinking_dataset.sources.source_cache import SourceCache
 from thinking_dataset.utils.log import Log
 from .pipe import Pipe
 
 
 class QueryGenerationPipe(Pipe):
     """Pipe for generating queries by combining templates with
-       source text samples."""
+       source text samples.
+
+    With materialize set to "lazy", the output column holds a compact
+    reference per query instead of its text: the id of the template and
+    source configurations registered in a {table}_templates table, and the
+    sampled source positions. Label and seed columns are not written.
+    ResponseGenerationPipe renders referenced queries just before dispatch.
+    Lazy queries require memory sampling and source tables that keep their
+    rows until the responses are generated.
+
+    With chunk_size set below the batch size, queries are generated and
+    written in blocks of chunk_size rows, each in its own transaction, so
+    completed blocks survive a failed run and the rendering and database
+    writes work on one block at a time. Later blocks append to the table
+    written by the first one, or update it with if_exists "update". Once a
+    block is written, only its ids are kept: the returned frame holds a
+    stored reference per query in the output column, read back from the
+    table by ResponseGenerationPipe just before dispatch, and no label
+    columns. Query texts are held one block at a time.
+
+    With minify set, authoring metadata and redundant whitespace are
+    stripped from the template before rendering; a list of patterns
+    replaces the default ones of TemplateMinifier.
+
+    With layout set to "prefix", the template blocks holding placeholders
+    are moved after the static ones, so all queries share the static text
+    as a prefix that inference servers can keep in their prompt cache.
+    """
 
     def __init__(self, config: dict) -> None:
         """Initialize QueryGenerationPipe with configuration settings."""
         super().__init__(config)
+        self._validate_config(self.config)
         self.template_path = self.config.get("template", None)
         self.validate = self.config.get("validate", None)
+        self.materialize = self.config.get("materialize", "eager")
+
+    @classmethod
+    def _validate_config(cls, config: Optional[dict] = None) -> None:
+        """Validate query materialization settings."""
+        if not config:
+            return
+        if config.get("materialize", "eager") not in ["eager", "lazy"]:
+            raise ValueError("materialize must be 'eager' or 'lazy'")
+        if config.get("layout", "template") not in ["template", "prefix"]:
+            raise ValueError("layout must be 'template' or 'prefix'")
+        chunk_size = config.get("chunk_size")
+        if chunk_size is not None and (not isinstance(chunk_size, int)
+                                       or chunk_size < 1):
+            raise ValueError("chunk_size must be a positive integer")
 
     # Public methods
     @with_db_session
@@ -39,39 +90,60 @@ class QueryGenerationPipe(Pipe):
         Log.info("Starting QueryGenerationPipe")
 
         # Get configuration values
-        template = TemplateLoader.load(self.template_path, self.validate)
+        minify = self.config.get("minify", False)
+        patterns = tuple(minify) if isinstance(minify, list) else None
+        template = TemplateLoader.load(self.template_path, self.validate,
+                                       bool(minify), patterns)
         batch_size = self.get_batch_size()
         sources = self._parse_source_configs()
+        if self.config.get("layout", "template") == "prefix":
+            template = CompiledTemplate.slots_last(
+                template, [source.label for source in sources])
 
         # Flush the root df (if configured)
         if self.config.get("flush", False):
             df = self.flush(df)
 
-        # Generate queries with incremental id for each query
-        queries = self._generate_queries(template, batch_size, sources,
-                                         session)
-
         # Selection context logic: update DataFrame in one statement
         output = self._parse_output_configs()[0]
-        df = df.copy()
-
-        # Create base DataFrame with id and query columns
-        update_dict = {
-            'id': [item["id"] for item in queries],
-            output.column: [item["query"] for item in queries]
-        }
-
-        # Add source label columns (e.g., "seed")
-        for source in sources:
-            update_dict[source.label] = [
-                item[source.label] for item in queries
-            ]
-
-        # Update DataFrame with all columns at once
-        df = df.assign(**update_dict)
-
+        chunk_size = max(
+            1, min(self.config.get("chunk_size") or batch_size, batch_size))
+
+        blocks = []
+        for start, queries in self._generate_blocks(template, batch_size,
+                                                    chunk_size, sources,
+                                                    session, output.table):
+            # Create base DataFrame with id and query columns
+            update_dict = {
+                'id': queries["id"].to_numpy(),
+                output.column: queries["query"].to_numpy()
+            }
+
+            # Add source label columns (e.g., "seed"), which are not lazy
+            for source in sources:
+                if source.label in queries.columns:
+                    update_dict[source.label] = \
+                        queries[source.label].to_numpy()
+
+            # Update DataFrame with all columns at once
+            block = df.iloc[start:start + len(queries)] if len(df) else df
+            block = block.assign(**update_dict)
+
+            if_exists = output.if_exists
+            if start and if_exists != "update":
+                if_exists = "append"
+            self._write_to_db(block, session, output.table, if_exists,
+                              list(update_dict))
+            if chunk_size < batch_size:
+                block = self._release_block(block, output,
+                                            list(update_dict), sources)
+            blocks.append(block)
+            if chunk_size < batch_size:
+                Log.info(f"Wrote queries {start + 1}-{start + len(block)} "
+                         f"of {batch_size} to '{output.table}'")
+
+        df = pd.concat(blocks) if len(blocks) > 1 else blocks[0]
         self.log_df_state(df, f"Final - {output.table}.{output.column}")
-        self._write_to_db(df, session, output.table, output.if_exists)
 
         Log.info("Finished QueryGenerationPipe")
         return df
@@ -83,59 +155,142 @@ class QueryGenerationPipe(Pipe):
         Log.info(f"{prefix}DataFrame columns: {df.columns.tolist()}")
 
     # Protected methods
-    def _wrap_with_markdown_list(self, samples: List[str]) -> str:
-        """Join samples into a markdown list format.
-
-        Args:
-            samples (List[str]): List of sample texts
-
-        Returns:
-            str: Joined string with samples as markdown list items
+    def _release_block(self, block: pd.DataFrame, output: OutputSource,
+                       columns: List[str],
+                       sources: List[InputSource]) -> pd.DataFrame:
+        """Replace the generated texts of a written block by references.
+
+        Lazy references are kept as they are; query texts become stored
+        references to the output table and the generated label columns are
+        dropped.
         """
-        return ''.join(f'\n- {sample}' for sample in samples)
-
-    def _get_query(self, template: str, source: InputSource,
-                   samples: List[str]) -> str:
-        """Generate a query by replacing labels with markdown list text."""
-        value = self._wrap_with_markdown_list(samples) + "\n"
-        pattern = r'{{\s*' + re.escape(source.label) + r'\s*}}'
-        return re.sub(pattern, value, template)
-
-    def _generate_queries(self, template: str, batch_size: int,
+        block = block.drop(columns=[
+            column for column in columns + ["seed"]
+            if column in block.columns and column not in ["id", output.column]
+        ])
+        if self.materialize == "lazy" and sources:
+            return block
+        return block.assign(
+            **{
+                output.column:
+                QueryReferences.encode_stored(output.table, output.column,
+                                              block["id"].to_numpy())
+            })
+
+    def _generate_blocks(self, template: str, batch_size: int,
+                         chunk_size: int, sources: List[InputSource],
+                         session: Any,
+                         out_table: str) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """Generate queries in blocks of consecutive ids.
+
+        All blocks draw from one seeded generator and share one source
+        cache, so sources are read once per run.
+
+        Yields:
+            Tuple[int, pd.DataFrame]: Offset of the block and its queries
+        """
+        rng = np.random.default_rng(self.config.get("seed"))
+        cache = SourceCache()
+        for start in range(0, max(batch_size, 1), chunk_size):
+            count = min(chunk_size, batch_size - start)
+            if self.materialize == "lazy" and sources:
+                queries = self._generate_references(template, count, sources,
+                                                    session, out_table, rng,
+                                                    cache, start + 1)
+            else:
+                queries = self._generate_queries(template, count, sources,
+                                                 session, rng, cache,
+                                                 start + 1)
+            yield start, queries
+
+    def _generate_queries(self,
+                          template: str,
+                          batch_size: int,
                           sources: List[InputSource],
-                          session: Any) -> List[dict]:
-        """Generate queries using multiple sources, each with a unique id."""
+                          session: Any,
+                          rng: Optional[np.random.Generator] = None,
+                          cache: Optional[SourceCache] = None,
+                          first_id: int = 1) -> pd.DataFrame:
+        """Generate queries using multiple sources, each with a unique id.
+
+        The samples of all queries are drawn per source in one batch from a
+        generator seeded by the seed option, so runs are repeatable. Every
+        source table is read once into a cache and sampled from memory;
+        sources with SQL sampling are sampled in the database instead. The
+        template is parsed once and every label is replaced by the markdown
+        list of the first source with that label.
+        """
+        ids = np.arange(first_id, first_id + batch_size)
         if not sources:
             Log.info(
                 "No sources configured - returning template text directly")
-            return [{
-                "id": i,
+            return pd.DataFrame({
+                "id": ids,
                 "query": template,
                 "seed": ""
-            } for i in range(1, batch_size + 1)]
-
-        queries = []
-        for i in range(1, batch_size + 1):
-            record = {"id": i}
-            query = template
-            seeds = []
-
-            for source in sources:
-                df_source = source.fetch_source(session)
-                samples = source.get_samples(df_source, source.ellipsis)
-                query = self._get_query(query, source, samples)
-                record[source.label] = self._wrap_with_markdown_list(
-                    samples).strip()
-                seeds.extend(samples)
-
-            # Add combined seeds and final query to record
-            record["seed"] = self._wrap_with_markdown_list(seeds).strip()
-            record["query"] = query
-            queries.append(record)
+            })
+
+        if rng is None:
+            rng = np.random.default_rng(self.config.get("seed"))
+        cache = cache if cache is not None else SourceCache()
+        compiled = CompiledTemplate(template,
+                                    [source.label for source in sources])
+        samples = []
+        for source in sources:
+            if source.sampling == "sql":
+                batch = np.empty((batch_size, source.amount), object)
+                batch[:] = source.sample_sql(session, batch_size, rng)
+            else:
+                batch = source.sample_batch(cache.get(source, session),
+                                            batch_size, rng)
+            samples.append(batch)
+
+        rendered, columns = QueryRenderer.assemble(compiled, sources, samples)
+        queries = pd.DataFrame({
+            "id": ids,
+            "query": rendered,
+            **{label: column.to_numpy() for label, column in columns.items()}
+        })
 
         Log.info(f"Total queries generated: {len(queries)}")
         return queries
 
+    def _generate_references(self,
+                             template: str,
+                             batch_size: int,
+                             sources: List[InputSource],
+                             session: Any,
+                             out_table: str,
+                             rng: Optional[np.random.Generator] = None,
+                             cache: Optional[SourceCache] = None,
+                             first_id: int = 1) -> pd.DataFrame:
+        """Generate query references instead of query texts.
+
+        Indices are drawn as in _generate_queries, from the same seeded
+        generator, so a lazy run references the samples an eager run with
+        the same seed would render.
+        """
+        if any(source.sampling == "sql" for source in sources):
+            raise ValueError("Lazy queries require memory sampling")
+
+        if rng is None:
+            rng = np.random.default_rng(self.config.get("seed"))
+        cache = cache if cache is not None else SourceCache()
+        registry = TemplateRegistry(session, f"{out_table}_templates")
+        template_id = registry.register(
+            template, [asdict(source) for source in sources])
+        indices = [
+            source.draw_batch(len(cache.get(source, session)), batch_size,
+                              rng) for source in sources
+        ]
+
+        queries = pd.DataFrame({
+            "id": np.arange(first_id, first_id + batch_size),
+            "query": QueryReferences.encode(template_id, indices)
+        })
+        Log.info(f"Total query references generated: {len(queries)}")
+        return queries
+
     def _parse_source_configs(self) -> List[InputSource]:
         """Parse source configurations from config."""
         sources = []
@@ -199,12 +354,98 @@ class QueryGenerationPipe(Pipe):
             raise ValueError(f"All values in column '{column}' are null.")
 
     @retry(stop=stop_after_attempt(5), wait=wait_fixed(2), reraise=True)
-    def _write_to_db(self, df: pd.DataFrame, session: Any, out_table: str,
-                     if_exists: str) -> None:
-        """Write DataFrame to database with retry logic."""
+    def _write_to_db(self,
+                     df: pd.DataFrame,
+                     session: Any,
+                     out_table: str,
+                     if_exists: str,
+                     columns: Optional[List[str]] = None) -> None:
+        """Write DataFrame to database with retry logic.
+
+        With if_exists "update", only the given columns of an existing
+        table are written, keyed by id; a missing table is created from
+        the whole frame.
+        """
         # Ensure seed column exists
         if 'seed' not in df.columns:
             df['seed'] = ''
 
+        if if_exists == "update" and inspect(session.bind).has_table(
+                out_table):
+            self._update_db(df[columns or list(df.columns)], session,
+                            out_table)
+            return
+
+        if if_exists == "update":
+            if_exists = "fail"
         df.to_sql(out_table, session.bind, if_exists=if_exists, index=False)
         Log.info(f"Inserted {len(df)} rows into '{out_table}' table")
+
+    def _update_db(self, df: pd.DataFrame, session: Any,
+                   out_table: str) -> None:
+        """Upsert columns of an existing table by id.
+
+        The columns are bulk inserted into a temporary table and copied
+        with one UPDATE ... FROM, in a single transaction. Missing columns
+        are added to the table, rows with new ids are inserted and other
+        columns are left untouched.
+        """
+        if "id" not in df.columns:
+            raise ValueError("Column 'id' is required to update a table.")
+
+        columns = [column for column in df.columns if column != "id"]
+        with session.bind.begin() as connection:
+            table = Table(out_table, MetaData(), autoload_with=connection)
+            self._add_columns(connection, table, df)
+            table = Table(out_table, MetaData(), autoload_with=connection)
+
+            staging = Table(f"{out_table}_update",
+                            MetaData(),
+                            *[
+                                Column(column,
+                                       self._sql_type(df[column]),
+                                       primary_key=column == "id")
+                                for column in df.columns
+                            ],
+                            prefixes=["TEMPORARY"])
+            staging.create(connection)
+            try:
+                connection.execute(insert(staging),
+                                   df.astype(object).where(
+                                       df.notna(), None).to_dict("records"))
+                updated = connection.execute(
+                    update(table).values({
+                        column: staging.c[column]
+                        for column in columns
+                    }).where(table.c.id == staging.c.id)).rowcount
+                inserted = connection.execute(
+                    insert(table).from_select(
+                        list(df.columns),
+                        select(*staging.c).where(
+                            staging.c.id.not_in(select(table.c.id))))).rowcount
+            finally:
+                staging.drop(connection)
+
+        Log.info(f"Updated {updated} and inserted {inserted} rows of "
+                 f"{columns} in '{out_table}' table")
+
+    def _add_columns(self, connection: Any, table: Table,
+                     df: pd.DataFrame) -> None:
+        """Add frame columns missing from a table."""
+        preparer = connection.dialect.identifier_preparer
+        for column in df.columns:
+            if column in table.c:
+                continue
+            sql_type = self._sql_type(df[column]).compile(connection.dialect)
+            connection.exec_driver_sql(
+                f"ALTER TABLE {preparer.quote(table.name)} "
+                f"ADD COLUMN {preparer.quote(column)} {sql_type}")
+
+    @staticmethod
+    def _sql_type(series: pd.Series) -> Any:
+        """Get the SQL type of a frame column."""
+        if pd.api.types.is_integer_dtype(series.dtype):
+            return BigInteger()
+        if pd.api.types.is_float_dtype(series.dtype):
+            return Float()
+        return Text()
@@ -14,10 +14,11 @@ from typing import Dict, List, Optional
 
 import pandas as pd
 
+from thinking_dataset.io.read_plan import ReadPlan
 from thinking_dataset.utils.log import Log
 from .pipe import Pipe
 
-__version__ = "0.0.2"
+__version__ = "0.0.3"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
@@ -73,6 +74,21 @@ class RemapColumnsPipe(Pipe):
         Log.info("Finished RemapColumnsPipe")
         return df
 
+    def pushdown(self, plan: ReadPlan) -> bool:
+        """Apply the renames and the column order to the read plan.
+
+        Args:
+            plan (ReadPlan): Read plan to update
+
+        Returns:
+            bool: Always True
+        """
+        plan.rename(self.config.get("column_mapping", {}))
+        order = self.config.get("column_order", [])
+        if order:
+            plan.select(order)
+        return True
+
     @classmethod
     def _validate_config(cls, config: Optional[dict] = None) -> None:
         """Validate pipe configuration.
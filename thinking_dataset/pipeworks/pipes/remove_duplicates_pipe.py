@@ -1,7 +1,11 @@
 """Remove Duplicates Pipeline Module.
 
 This module provides functionality for removing duplicate rows from DataFrames
-based on specified column combinations.
+based on specified column combinations, either exactly, by fixed-width row
+fingerprints, or as near-duplicates found with MinHash signatures and
+locality-sensitive hashing (LSH). Inputs larger than memory can be
+deduplicated out-of-core before they are read, and rows seen by earlier runs
+can be dropped through a persistent dedup index.
 
 Functions:
     None
@@ -10,14 +14,21 @@ Classes:
     RemoveDuplicatesPipe: Handles duplicate row removal operations.
 """
 
-from typing import List, Optional
+import os
+import tempfile
+from typing import Dict, Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from thinking_dataset.utils.command_utils import CommandUtils as utils
+from thinking_dataset.utils.dedup_index import DedupIndex
+from thinking_dataset.utils.external_dedup import ExternalDedup
+from thinking_dataset.utils.hash_utils import EMPTY_HASH, HashUtils
 from thinking_dataset.utils.log import Log
 from .pipe import Pipe
 
-__version__ = "0.0.2"
+__version__ = "0.0.9"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
@@ -30,10 +41,65 @@ class RemoveDuplicatesPipe(Pipe):
     1. Validates column specifications
     2. Handles automatic column detection
     3. Removes duplicate rows based on specified columns
-    4. Provides detailed operation logging
+    4. Optionally dedups on row fingerprints or removes near-duplicates
+       with MinHash-LSH
+    5. Optionally drops rows seen by earlier runs
+    6. Provides detailed operation logging
+
+    Fingerprint mode hashes the selected columns of every row into a 64 or
+    128-bit value and dedups on that fixed-width array, so the hash table
+    grows with the row count instead of the text volume. With
+    verify_collisions, each dropped row is compared with the first row of
+    its fingerprint and kept if their values differ, erring on the side of
+    keeping rows.
+
+    External mode runs in prepare(), before the pipeline reads the input
+    file. Batches of the file are fingerprinted and spilled to disk in
+    hash partitions, each partition is deduplicated on its own, and the
+    rows to keep are streamed, in their original order, to a spill file
+    that the pipeline reads instead. Its columns refer to the input file,
+    not to the columns produced by earlier pipes. Since it runs before any
+    flow(), the pipeline only accepts it ahead of every pipe that is not
+    itself a prepare() pass, so it never dedups rows an earlier pipe would
+    have dropped. Only the hashing is out-of-core: the pipeline still
+    reads the kept rows into memory. Without prepare() it falls back to
+    fingerprint mode.
+
+    With index_path set, the 64-bit fingerprints of the remaining rows are
+    checked against a persistent SQLite index fronted by a Bloom filter,
+    and rows seen by any earlier run are dropped. New fingerprints are
+    staged and only written, in one transaction, when the pipeline closes
+    the pipe after saving its output.
+
+    Near mode joins the selected columns per row, shingles the text into
+    character n-grams, computes MinHash signatures in batches and buckets
+    them by LSH bands. Only rows sharing a bucket are compared, and pairs
+    whose estimated Jaccard similarity reaches the threshold are merged
+    into clusters; the first row of each cluster is kept.
 
     Config:
-        columns (List[str]): Columns to check for duplicates
+        columns (List[str]): Columns to check for duplicates, "auto" selects
+            every column except "id"
+        mode (str): "exact" (default), "fingerprint", "external" or "near"
+        hash_bits (int): Fingerprint and external mode hash width,
+            64 (default) or 128
+        verify_collisions (bool): Fingerprint mode check of dropped rows
+            against their kept row. Defaults to False.
+        threshold (float): Near mode Jaccard threshold. Defaults to 0.8.
+        num_perm (int): Near mode signature length. Defaults to 64.
+        bands (int): Near mode LSH bands, derived from threshold if unset
+        shingle_size (int): Near mode shingle length. Defaults to 5.
+        batch_size (int): Near and external mode rows per batch.
+            Defaults to 10000.
+        workers (int): Near mode worker processes, external mode partition
+            threads. Defaults to 1.
+        partitions (int): External mode spill partitions. Defaults to 16.
+        spill_dir (str): External mode spill directory, the system temp
+            directory if unset
+        index_path (str): SQLite file of the persistent dedup index
+        index_table (str): Index table name. Defaults to "dedup_index".
+        index_error_rate (float): Bloom filter false positive rate.
+            Defaults to 0.01.
     """
 
     def __init__(self, config: dict) -> None:
@@ -42,9 +108,17 @@ class RemoveDuplicatesPipe(Pipe):
         Args:
             config (dict): Configuration containing:
                 columns (List[str]): Columns to use for duplicate detection
+                mode (str): Duplicate detection mode
         """
         super().__init__(config)
         self._validate_config(self.config)
+        self.index: Optional[DedupIndex] = None
+        self.spill_file: Optional[str] = None
+        if self.config.get("index_path"):
+            self.index = DedupIndex(
+                self.config["index_path"],
+                self.config.get("index_table", "dedup_index"),
+                self.config.get("index_error_rate", 0.01))
 
     def flow(self, df: pd.DataFrame, **args) -> pd.DataFrame:
         """Execute the duplicate removal pipeline.
@@ -62,6 +136,10 @@ class RemoveDuplicatesPipe(Pipe):
         Log.info("Starting RemoveDuplicatesPipe")
         initial_length = len(df)
 
+        if self.spill_file is not None:
+            Log.info("Duplicates were removed out-of-core. Skipping.")
+            return df
+
         columns = self._get_columns(df)
         self._validate_columns(df, columns)
 
@@ -70,7 +148,16 @@ class RemoveDuplicatesPipe(Pipe):
                      "Skipping duplicate removal.")
             return df
 
-        df = self._remove_duplicates(df, columns)
+        mode = self.config.get("mode", "exact")
+        if mode == "near":
+            df = self._remove_near_duplicates(df, columns)
+        elif mode in ["fingerprint", "external"]:
+            df = self._remove_fingerprint_duplicates(df, columns)
+        else:
+            df = self._remove_duplicates(df, columns)
+
+        if self.index is not None:
+            df = self._remove_indexed_duplicates(df, columns)
 
         self._log_results(initial_length, len(df))
         Log.info("Finished RemoveDuplicatesPipe")
@@ -93,8 +180,165 @@ class RemoveDuplicatesPipe(Pipe):
         if not isinstance(columns, list):
             raise ValueError("Columns must be specified as a list")
 
-    @classmethod
-    def _get_columns(cls, df: pd.DataFrame) -> List[str]:
+        mode = config.get("mode", "exact")
+        if mode not in ["exact", "fingerprint", "external", "near"]:
+            raise ValueError("Mode must be 'exact', 'fingerprint', "
+                             "'external' or 'near'")
+
+        partitions = config.get("partitions", 16)
+        if not isinstance(partitions, int) or partitions < 1:
+            raise ValueError("partitions must be a positive integer")
+
+        if config.get("hash_bits", 64) not in [64, 128]:
+            raise ValueError("hash_bits must be 64 or 128")
+
+        threshold = config.get("threshold", 0.8)
+        if not isinstance(threshold, (int, float)) or \
+                not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+
+        num_perm = config.get("num_perm", 64)
+        bands = config.get("bands", None)
+        if not isinstance(num_perm, int) or num_perm < 1:
+            raise ValueError("num_perm must be a positive integer")
+        if bands is not None and (not isinstance(bands, int) or bands < 1
+                                  or num_perm % bands):
+            raise ValueError("bands must be a positive divisor of num_perm")
+
+        error_rate = config.get("index_error_rate", 0.01)
+        if not isinstance(error_rate, float) or not 0 < error_rate < 1:
+            raise ValueError("index_error_rate must be in (0, 1)")
+
+    def prepare(self, input_file: str, dataset_type: str) -> str:
+        """Deduplicate the input file out-of-core in external mode.
+
+        Args:
+            input_file (str): Path of the file about to be read
+            dataset_type (str): File type, e.g. "parquet" or "csv"
+
+        Returns:
+            str: Spill file holding the kept rows in external mode, the
+                input file otherwise
+        """
+        if self.config.get("mode", "exact") != "external":
+            return input_file
+
+        Log.info(f"Removing duplicates out-of-core from: {input_file}")
+        batch_size = self.config.get("batch_size", 10000)
+        columns = self.config.get("columns", [])
+        read_columns = None if "auto" in columns else columns
+        dedup = ExternalDedup(self.config.get("partitions", 16),
+                              self.config.get("hash_bits", 64),
+                              self.config.get("workers", 1),
+                              self.config.get("spill_dir"))
+        mask = dedup.keep_mask(
+            self._dedup_columns(batch) for batch in utils.iter_batches(
+                input_file, dataset_type, batch_size, read_columns))
+        if not len(mask):
+            return input_file
+
+        if self.config.get("spill_dir"):
+            os.makedirs(self.config["spill_dir"], exist_ok=True)
+        handle, self.spill_file = tempfile.mkstemp(
+            prefix="dedup-",
+            suffix=os.path.splitext(input_file)[1],
+            dir=self.config.get("spill_dir"))
+        os.close(handle)
+        utils.write_batches(
+            self._filter_batches(
+                utils.iter_batches(input_file, dataset_type, batch_size),
+                mask), self.spill_file, dataset_type,
+            self._read_schema(input_file, dataset_type))
+        return self.spill_file
+
+    def prepares_rows(self) -> bool:
+        """Check whether prepare() dedups the input rows.
+
+        Returns:
+            bool: True in external mode
+        """
+        return self.config.get("mode", "exact") == "external"
+
+    @staticmethod
+    def _read_schema(input_file: str, dataset_type: str):
+        """Read the Arrow schema the spill file is written with.
+
+        Batches whose rows are all dropped infer null-typed columns, so the
+        spill file takes its schema from the input file instead.
+
+        Args:
+            input_file (str): Path of the input file
+            dataset_type (str): File type, e.g. "parquet" or "csv"
+
+        Returns:
+            Optional[pa.Schema]: Schema of a parquet input, None otherwise
+        """
+        if dataset_type != "parquet":
+            return None
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(input_file).schema_arrow
+
+    def _dedup_columns(self, batch: pd.DataFrame) -> pd.DataFrame:
+        """Select the columns compared for duplicates in a batch.
+
+        Args:
+            batch (pd.DataFrame): Input batch
+
+        Returns:
+            pd.DataFrame: Compared columns
+        """
+        if "auto" in self.config.get("columns", []):
+            return batch[[col for col in batch.columns if col != "id"]]
+        return batch[self.config.get("columns", [])]
+
+    def _filter_batches(self, batches: Iterator[pd.DataFrame],
+                        mask: np.ndarray) -> Iterator[pd.DataFrame]:
+        """Stream the kept rows of each batch.
+
+        Batches keep their schema even when no row survives, and rows seen
+        by earlier runs are dropped when a dedup index is configured.
+
+        Args:
+            batches (Iterator[pd.DataFrame]): Input batches in row order
+            mask (np.ndarray): Keep-mask over all rows
+
+        Yields:
+            pd.DataFrame: Kept rows of each batch
+        """
+        offset = 0
+        for batch in batches:
+            keep = mask[offset:offset + len(batch)]
+            offset += len(batch)
+            batch = batch[keep]
+            if self.index is not None:
+                fingerprints = HashUtils.fingerprint(
+                    self._dedup_columns(batch))
+                seen = self.index.seen(fingerprints)
+                self.index.stage(fingerprints[~seen])
+                batch = batch[~seen]
+            yield batch
+
+        Log.info(f"Removed {offset - int(mask.sum())} duplicates "
+                 "out-of-core")
+
+    def close(self) -> None:
+        """Remove the spill file and commit staged index fingerprints."""
+        if self.spill_file is not None:
+            os.remove(self.spill_file)
+            self.spill_file = None
+        if self.index is not None:
+            committed = self.index.commit()
+            Log.info(f"Committed {committed} fingerprints to dedup index")
+
+    def abort(self) -> None:
+        """Remove the spill file and discard staged index fingerprints."""
+        if self.spill_file is not None:
+            os.remove(self.spill_file)
+            self.spill_file = None
+        if self.index is not None:
+            self.index.rollback()
+
+    def _get_columns(self, df: pd.DataFrame) -> List[str]:
         """Get columns to use for duplicate detection.
 
         Args:
@@ -103,10 +347,10 @@ class RemoveDuplicatesPipe(Pipe):
         Returns:
             List[str]: Columns to check for duplicates
         """
-        columns = cls.pipeline_config.get("columns", [])
+        columns = self.config.get("columns", [])
         if "auto" in columns:
             Log.info("Auto-detecting columns for duplicate check")
-            return df.columns.tolist()
+            return [col for col in df.columns if col != "id"]
         return columns
 
     @classmethod
@@ -141,6 +385,172 @@ class RemoveDuplicatesPipe(Pipe):
         Log.info(f"Checking columns for duplicates: {columns}")
         return df.drop_duplicates(subset=columns)
 
+    def _remove_fingerprint_duplicates(self, df: pd.DataFrame,
+                                       columns: List[str]) -> pd.DataFrame:
+        """Remove duplicate rows by their fixed-width fingerprints.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            columns (List[str]): Columns to check for duplicates
+
+        Returns:
+            pd.DataFrame: DataFrame keeping first occurrences
+        """
+        bits = self.config.get("hash_bits", 64)
+        Log.info(f"Checking columns for duplicates: {columns} "
+                 f"(fingerprint: {bits} bits)")
+
+        fingerprints = HashUtils.fingerprint(df[columns], bits)
+        keys = [fingerprints] if bits == 64 else list(fingerprints.T)
+        positions = pd.Series(np.arange(len(df)))
+        firsts = positions.groupby(keys, sort=False).transform(
+            "first").to_numpy()
+        duplicated = firsts != positions.to_numpy()
+
+        if self.config.get("verify_collisions", False) and duplicated.any():
+            rows = np.flatnonzero(duplicated)
+            collisions = rows[~self._rows_equal(df[columns], rows,
+                                                firsts[rows])]
+            Log.info(f"Fingerprint collisions kept: {len(collisions)}")
+            duplicated[collisions] = False
+
+        return df[~duplicated]
+
+    @staticmethod
+    def _rows_equal(df: pd.DataFrame, left: np.ndarray,
+                    right: np.ndarray) -> np.ndarray:
+        """Compare rows at two sets of positions, treating NaN as equal.
+
+        Args:
+            df (pd.DataFrame): Compared columns
+            left (np.ndarray): First row positions
+            right (np.ndarray): Second row positions
+
+        Returns:
+            np.ndarray: True where all values of both rows match
+        """
+        a = df.iloc[left].reset_index(drop=True)
+        b = df.iloc[right].reset_index(drop=True)
+        return ((a == b) | (a.isna() & b.isna())).all(axis=1).to_numpy()
+
+    def _remove_indexed_duplicates(self, df: pd.DataFrame,
+                                   columns: List[str]) -> pd.DataFrame:
+        """Remove rows seen by earlier runs and stage the remaining ones.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            columns (List[str]): Columns to fingerprint
+
+        Returns:
+            pd.DataFrame: DataFrame without previously seen rows
+        """
+        fingerprints = HashUtils.fingerprint(df[columns])
+        seen = self.index.seen(fingerprints)
+        self.index.stage(fingerprints[~seen])
+        Log.info(f"Rows seen by earlier runs: {int(seen.sum())} "
+                 f"(index: {self.index.path})")
+        return df[~seen]
+
+    def _remove_near_duplicates(self, df: pd.DataFrame,
+                                columns: List[str]) -> pd.DataFrame:
+        """Remove near-duplicate rows with MinHash-LSH.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            columns (List[str]): Columns whose joined text is compared
+
+        Returns:
+            pd.DataFrame: DataFrame keeping the first row of each cluster
+        """
+        threshold = self.config.get("threshold", 0.8)
+        num_perm = self.config.get("num_perm", 64)
+        bands = self.config.get("bands") or HashUtils.optimal_bands(
+            num_perm, threshold)
+        Log.info(f"Checking columns for near-duplicates: {columns} "
+                 f"(threshold: {threshold}, num_perm: {num_perm}, "
+                 f"bands: {bands})")
+
+        texts = df[columns[0]].astype(str)
+        for col in columns[1:]:
+            texts = texts.str.cat(df[col].astype(str), sep="\n")
+
+        signatures = HashUtils.minhash_batches(
+            texts.tolist(),
+            num_perm=num_perm,
+            shingle_size=self.config.get("shingle_size", 5),
+            batch_size=self.config.get("batch_size", 10000),
+            workers=self.config.get("workers", 1))
+        parents = self._cluster_signatures(signatures, bands, threshold)
+
+        self._log_clusters(parents)
+        return df[parents == np.arange(len(df))]
+
+    @staticmethod
+    def _cluster_signatures(signatures: np.ndarray, bands: int,
+                            threshold: float) -> np.ndarray:
+        """Cluster rows whose signatures collide in an LSH band.
+
+        Each bucket links its members to the bucket's first row when their
+        estimated Jaccard similarity reaches the threshold, so the number of
+        comparisons grows with bucket sizes rather than with row pairs.
+
+        Args:
+            signatures (np.ndarray): MinHash matrix (rows, num_perm)
+            bands (int): Number of LSH bands
+            threshold (float): Jaccard threshold
+
+        Returns:
+            np.ndarray: Cluster root (lowest row position) for every row
+        """
+        rows = len(signatures)
+        parents = np.arange(rows)
+        valid = ~(signatures == EMPTY_HASH).all(axis=1)
+        keys = HashUtils.band_keys(signatures, bands)
+
+        def find(row: int) -> int:
+            while parents[row] != row:
+                parents[row] = parents[parents[row]]
+                row = parents[row]
+            return row
+
+        for band in range(bands):
+            band_keys = pd.Series(keys[valid, band])
+            positions = np.flatnonzero(valid)
+            heads = band_keys.groupby(band_keys).transform("idxmin")
+            members = np.flatnonzero(heads.to_numpy() != np.arange(
+                len(band_keys)))
+            for member in members:
+                row = positions[member]
+                head = positions[heads.iat[member]]
+                similarity = np.mean(signatures[row] == signatures[head])
+                if similarity < threshold:
+                    continue
+                root_row, root_head = find(row), find(head)
+                if root_row != root_head:
+                    low, high = sorted((root_row, root_head))
+                    parents[high] = low
+
+        return np.array([find(row) for row in range(rows)])
+
+    @staticmethod
+    def _log_clusters(parents: np.ndarray) -> None:
+        """Log near-duplicate cluster statistics.
+
+        Args:
+            parents (np.ndarray): Cluster root for every row
+        """
+        sizes = pd.Series(parents).value_counts()
+        clusters = sizes[sizes > 1]
+        stats: Dict[str, float] = {
+            "clusters": len(clusters),
+            "rows": int(clusters.sum()),
+            "largest": int(clusters.max()) if len(clusters) else 0,
+            "mean": float(clusters.mean()) if len(clusters) else 0.0,
+        }
+        Log.info(f"Near-duplicate clusters: {stats['clusters']} covering "
+                 f"{stats['rows']} rows (largest: {stats['largest']}, "
+                 f"mean size: {stats['mean']:.2f})")
+
     @classmethod
     def _log_results(cls, initial_length: int, final_length: int) -> None:
         """Log the results of the duplicate removal process.
@@ -1,13 +1,13 @@
 """Response Generation Pipeline Module."""
 
-__version__ = "0.0.3"
+__version__ = "0.0.8"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
 
 import time
 import asyncio
-from typing import Any
+from typing import Any, Optional
 from tenacity import (
     retry,
     wait_fixed,
@@ -19,11 +19,16 @@ import pandas as pd
 from sqlalchemy import update
 
 from thinking_dataset.db.database import Database
+from thinking_dataset.db.simhash_index import SimHashIndex
+from thinking_dataset.db.template_registry import TemplateRegistry
 from thinking_dataset.decorators.with_db_session import with_db_session
 from thinking_dataset.providers.ollama_provider import OllamaProvider
+from thinking_dataset.sources.query_reference import (QueryReferences,
+                                                      QueryRenderer)
 from thinking_dataset.templates.response_validator import ResponseValidator
 from thinking_dataset.templates.template_extractor import TemplateExtractor
 from thinking_dataset.templates.template_loader import TemplateLoader
+from thinking_dataset.utils.hash_utils import HashUtils
 from thinking_dataset.utils.log import Log
 from thinking_dataset.utils.exceptions import (
     XMLExtractionError,
@@ -34,15 +39,51 @@ from .pipe import Pipe
 
 
 class ResponseGenerationPipe(Pipe):
-    """Handle asynchronous generation of AI responses from input queries."""
+    """Handle asynchronous generation of AI responses from input queries.
+
+    With dedup_outputs set, every response is checked against a banded
+    SimHash index of earlier outputs of the same column before it is
+    committed. "flag" stores the id of the matched row in a
+    {column}_duplicate_of column, "regenerate" requests a new response up to
+    dedup_retries times and flags it if it still collides. dedup_distance
+    is the maximum Hamming distance of a near-duplicate and dedup_bands the
+    number of index bands (2 to 64, default 3), probed with flipped bits
+    when there are not more bands than the distance.
+
+    Query references written by a lazy QueryGenerationPipe are rendered
+    just before dispatch, from the templates registered in templates_table
+    (defaults to {table}_templates of the output table). Stored references
+    returned by a chunked QueryGenerationPipe are read from their table.
+
+    The timing fields the server returns are summed over the stage and
+    logged once it finishes: prompt tokens evaluated against the estimated
+    prompt tokens show how much of the prompts was served from the prompt
+    cache, and prompt eval time is what a shared prefix saves.
+    """
 
     def __init__(self, config: dict) -> None:
         """Initialize ResponseGenerationPipe with configuration settings."""
         super().__init__(config)
+        self._validate_config(self.config)
         self.max_workers = self.config.get("max_workers", 1)
         self.template_path = self.config.get("template", None)
+        self.dedup_outputs = self.config.get("dedup_outputs", None)
+        self.simhash_index: Optional[SimHashIndex] = None
+        self.dedup_stats = {"checked": 0, "detected": 0, "flagged": 0}
+        self.renderer: Optional[QueryRenderer] = None
+        self.timing_stats = self._empty_timing_stats()
         self.db = Database()
 
+    @classmethod
+    def _validate_config(cls, config: Optional[dict] = None) -> None:
+        """Validate output dedup settings."""
+        if not config:
+            return
+        if config.get("dedup_outputs") not in [None, "flag", "regenerate"]:
+            raise ValueError("dedup_outputs must be 'flag' or 'regenerate'")
+        SimHashIndex.validate(config.get("dedup_bands", 3),
+                              config.get("dedup_distance", 5))
+
     @with_db_session
     def flow(
         self,
@@ -78,16 +119,38 @@ class ResponseGenerationPipe(Pipe):
                           state=f"Batch size: {batch_size}, "
                           f"Columns: {in_column}, {out_column}")
 
+        # Render referenced queries on demand
+        self.renderer = None
+        if QueryReferences.is_reference(df[in_column]):
+            registry = TemplateRegistry(
+                session,
+                self.config.get("templates_table", f"{out_table}_templates"))
+            self.renderer = QueryRenderer(session, registry)
+            Log.info(f"Rendering query references of column {in_column}")
+
         # Initialize output column if it doesn't exist
         if out_column not in df.columns:
             df[out_column] = None
 
+        # Index earlier outputs for near-duplicate checks
+        if self.dedup_outputs:
+            self.simhash_index = SimHashIndex(
+                session, f"{out_table}_simhash",
+                self.config.get("dedup_bands", 3),
+                self.config.get("dedup_distance", 5))
+            self.dedup_stats = {"checked": 0, "detected": 0, "flagged": 0}
+
         # Call the local async process method
+        self.timing_stats = self._empty_timing_stats()
         asyncio.run(
             self._run_async_process(session, df, out_table, out_column,
                                     in_column, format, template, mock,
                                     min_length))
 
+        if self.dedup_outputs:
+            self._log_dedup_stats(out_column)
+        self._log_timing_stats(out_column)
+
         Log.info("Finished ResponseGenerationPipe")
         return df
 
@@ -128,7 +191,9 @@ class ResponseGenerationPipe(Pipe):
         template: str | None,
         min_length: int = 0,
     ) -> str:
-        response = await provider.process_request_async(prompt=query)
+        response, timings = await provider.process_request_timed_async(
+            prompt=query)
+        self._add_timings(query, timings)
         response = self._format_response(response, template, format,
                                          min_length)
         return response
@@ -243,6 +308,8 @@ class ResponseGenerationPipe(Pipe):
             if pd.isna(row_id) or pd.isna(query) or str(query).strip() == '':
                 Log.warn(f"Skipping -- ID: {row_id}, Query: {query}")
                 return
+            if self.renderer is not None:
+                query = self.renderer.render([str(query)])[0]
 
             start_time = time.perf_counter()
             try:
@@ -265,6 +332,95 @@ class ResponseGenerationPipe(Pipe):
                 self._log_metrics(row_id, duration, error=e)
                 raise
 
+    async def _generate_unique_response(
+        self,
+        row_id: int,
+        query: str,
+        provider: OllamaProvider,
+        out_column: str,
+        format: str | None,
+        template: str | None,
+        min_length: int = 0,
+    ) -> tuple[str, Optional[str]]:
+        """Generate a response and check it for near-duplicates.
+
+        The final check and the index insert run without awaiting, so
+        concurrent rows cannot both miss each other. The insert is
+        committed together with the response.
+
+        Returns:
+            tuple[str, Optional[str]]: Response and id of the row it
+                duplicates, if any
+        """
+        response = await self.generate_response(query, provider, format,
+                                                template, min_length)
+        if self.simhash_index is None:
+            return response, None
+
+        retries = self.config.get("dedup_retries", 2) \
+            if self.dedup_outputs == "regenerate" else 0
+        self.dedup_stats["checked"] += 1
+        for attempt in range(retries + 1):
+            simhash = HashUtils.simhash(response)
+            match = self.simhash_index.find(out_column, simhash, row_id)
+            if attempt == 0 and match is not None:
+                self.dedup_stats["detected"] += 1
+            if match is None or attempt == retries:
+                break
+            Log.info(f"Regenerating -- ID: {row_id} | "
+                     f"Attempt: {attempt + 1}/{retries}")
+            response = await self.generate_response(query, provider, format,
+                                                    template, min_length)
+
+        if match is not None:
+            self.dedup_stats["flagged"] += 1
+        self.simhash_index.add(out_column, row_id, simhash)
+        return response, match
+
+    @staticmethod
+    def _empty_timing_stats() -> dict:
+        """Create zeroed server timing totals."""
+        return {
+            "requests": 0,
+            "prompt_chars": 0,
+            **{field: 0
+               for field in OllamaProvider.TIMINGS}
+        }
+
+    def _add_timings(self, query: str, timings: dict) -> None:
+        """Add the server timings of one request to the stage totals."""
+        self.timing_stats["requests"] += 1
+        self.timing_stats["prompt_chars"] += len(query)
+        for field, value in timings.items():
+            self.timing_stats[field] += value
+
+    def _log_timing_stats(self, out_column: str) -> None:
+        """Log the prompt eval and generation totals of this stage."""
+        stats = self.timing_stats
+        if not stats["prompt_eval_duration"] and not stats["eval_duration"]:
+            return
+        estimated = stats["prompt_chars"] / 4
+        evaluated = stats["prompt_eval_count"]
+        prompt_sec = stats["prompt_eval_duration"] / 1e9
+        eval_sec = stats["eval_duration"] / 1e9
+        Log.info(f"Server timings -- Column: {out_column} | "
+                 f"Requests: {stats['requests']} | "
+                 f"Prompt: {evaluated} of ~{estimated:.0f} tk evaluated "
+                 f"({evaluated / max(estimated, 1):.1%}) in "
+                 f"{prompt_sec:.2f} sec "
+                 f"({evaluated / max(prompt_sec, 1e-9):.2f} tk/sec) | "
+                 f"Output: {stats['eval_count']} tk in {eval_sec:.2f} sec")
+
+    def _log_dedup_stats(self, out_column: str) -> None:
+        """Log the near-duplicate collapse rates of this stage."""
+        checked = self.dedup_stats["checked"]
+        detected = self.dedup_stats["detected"]
+        flagged = self.dedup_stats["flagged"]
+        Log.info(f"Near-duplicate outputs -- Column: {out_column} | "
+                 f"Checked: {checked} | "
+                 f"Detected: {detected} ({detected / max(checked, 1):.1%}) | "
+                 f"Flagged: {flagged} ({flagged / max(checked, 1):.1%})")
+
     async def _process_query(
         self,
         session: Any,
@@ -279,10 +435,13 @@ class ResponseGenerationPipe(Pipe):
     ) -> str:
         """Process a query through the AI pipeline and return response."""
         try:
-            response = await self.generate_response(query, provider, format,
-                                                    template, min_length)
+            response, duplicate_of = await self._generate_unique_response(
+                row_id, query, provider, out_column, format, template,
+                min_length)
+            extra = {f"{out_column}_duplicate_of": duplicate_of} \
+                if self.dedup_outputs else None
             await self._update_db(session, out_table, row_id, response,
-                                  out_column)
+                                  out_column, extra)
             return response
         except Exception as e:
             Log.warn(
@@ -302,17 +461,20 @@ class ResponseGenerationPipe(Pipe):
         row_id: int,
         response: str,
         out_column: str,
+        extra: dict | None = None,
     ) -> None:
-        """Update the database with the generated AI response."""
+        """Update the database with the generated AI response and any
+        extra column values."""
         try:
             if row_id is None:
                 raise ValueError("Row ID cannot be None")
 
             table = await self.db.ensure_table_exists(session, out_table)
-            table = await self.db.ensure_column_exists(session, table,
-                                                       out_column)
-            stmt = (update(table).where(table.c.id == row_id).values(
-                {out_column: response}))
+            values = {out_column: response, **(extra or {})}
+            for column in values:
+                table = await self.db.ensure_column_exists(
+                    session, table, column)
+            stmt = (update(table).where(table.c.id == row_id).values(values))
 
             session.execute(stmt)
             session.commit()
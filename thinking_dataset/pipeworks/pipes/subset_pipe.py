@@ -1,7 +1,8 @@
 """Subset Pipeline Module.
 
 This module provides functionality for creating data subsets by selecting
-specific rows and columns from input DataFrames based on configuration.
+specific rows and columns from input DataFrames based on configuration,
+either by position or by seeded random and stratified sampling.
 
 Functions:
     None
@@ -10,18 +11,25 @@ Classes:
     SubsetPipe: Handles data subsetting operations.
 """
 
-from typing import List, Optional, Union
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 
+from thinking_dataset.io.read_plan import ReadPlan
+from thinking_dataset.utils.command_utils import CommandUtils as utils
 from thinking_dataset.utils.log import Log
+from thinking_dataset.utils.stream_sampler import ALLOCATIONS, StreamSampler
 from .pipe import Pipe
 
-__version__ = "0.0.2"
+__version__ = "0.0.6"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
 
+MODES = ["range", "reservoir", "stratified"]
+
 
 class SubsetPipe(Pipe):
     """Pipe for creating configurable data subsets.
@@ -33,9 +41,30 @@ class SubsetPipe(Pipe):
     4. Maintains ID column positioning
     5. Provides detailed operation logging
 
+    As a leading pipe, its row and column ranges are pushed down into the
+    file read, and flow() then only keeps the ID column first.
+
+    The reservoir and stratified modes replace the row range with a seeded
+    sample of a fixed size. When the pipeline reads a file, the sample is
+    taken over its batches before the read, so memory is bounded by the
+    sample rather than the input; the pipe should then lead the pipeline,
+    since it samples the stored rows. Stratified mode first counts the
+    strata in a pass over the stratify column, so each stratum only keeps
+    its share of the sample.
+
     Config:
+        mode (str): "range" (default), "reservoir" or "stratified"
         rows (List[int]): Start and end indices for row selection
         columns (List[int]): Start and end indices for column selection
+        size (int): Sampling modes, number of rows to sample
+        seed (int): Sampling modes, random seed. Defaults to 42.
+        batch_size (int): Sampling modes, rows per streamed batch
+        spill_dir (str): Sampling modes, directory of the sample file
+        stratify_column (str): Stratified mode, text column to bucket by
+        metric (str): Stratified mode, "chars", "bytes" or "tokens"
+        strata (List[int]): Stratified mode, inner length bucket edges.
+            Defaults to power-of-two buckets.
+        allocation (str): Stratified mode, "proportional" or "equal"
     """
 
     def __init__(self, config: dict) -> None:
@@ -48,6 +77,8 @@ class SubsetPipe(Pipe):
         """
         super().__init__(config)
         self._validate_config(config)
+        self.pushed_down = False
+        self.spill_file: Optional[str] = None
 
     def flow(self, df: pd.DataFrame, **args) -> pd.DataFrame:
         """Execute the subsetting pipeline.
@@ -66,20 +97,141 @@ class SubsetPipe(Pipe):
 
         rows = self.config.get("rows")
         columns = self.config.get("columns")
+        sampling = self.config.get("mode", "range") != "range"
 
-        if not self._has_valid_ranges(rows, columns):
+        if not sampling and not self._has_valid_ranges(rows, columns):
             Log.error("Both rows and columns configurations are missing. "
                       "One or both must be configured.")
             return df
 
-        df = self._apply_row_filter(df, rows)
-        df = self._apply_column_filter(df, columns)
+        if self.pushed_down:
+            Log.info("Row and column ranges applied by the reader")
+            self.pushed_down = False
+        else:
+            if not sampling:
+                df = self._apply_row_filter(df, rows)
+            elif self.spill_file is None:
+                sampler = self._sampler()
+                df = sampler.sample([df], self._count(sampler, [df]))
+            df = self._apply_column_filter(df, columns)
         df = self._reorder_columns(df)
 
         self._log_results(df)
         Log.info("Finished SubsetPipe")
         return df
 
+    def pushdown(self, plan: ReadPlan) -> bool:
+        """Push the row and column ranges into the read plan.
+
+        Args:
+            plan (ReadPlan): Read plan to update
+
+        Returns:
+            bool: Whether planning may continue past this pipe
+        """
+        rows = self.config.get("rows")
+        columns = self.config.get("columns")
+        if self.config.get("mode", "range") != "range":
+            if self.spill_file is None:
+                return False
+            rows = None
+        elif not self._has_valid_ranges(rows, columns):
+            return False
+        if columns and columns != ["all"] and not all(
+                isinstance(value, int) for value in columns):
+            return False
+        if rows and rows != ["all"] and not plan.limit(rows[0], rows[1]):
+            return False
+
+        if columns and columns != ["all"]:
+            plan.select(plan.columns[columns[0]:columns[1]])
+        self.pushed_down = True
+        return True
+
+    def prepare(self, input_file: str, dataset_type: str) -> str:
+        """Sample the input file in streaming passes in sampling modes.
+
+        Args:
+            input_file (str): Path of the file about to be read
+            dataset_type (str): File type, e.g. "parquet" or "csv"
+
+        Returns:
+            str: File holding the sampled rows in sampling modes, the input
+                file otherwise
+        """
+        if self.config.get("mode", "range") == "range":
+            return input_file
+
+        Log.info(f"Sampling {self.config['size']} rows from: {input_file}")
+        batch_size = self.config.get("batch_size", 10000)
+        sampler = self._sampler()
+        counts = self._count(
+            sampler,
+            utils.iter_batches(input_file, dataset_type, batch_size,
+                               [self.config.get("stratify_column")]))
+        sample = sampler.sample(
+            utils.iter_batches(input_file, dataset_type, batch_size), counts)
+
+        spill_dir = self.config.get("spill_dir")
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+        handle, self.spill_file = tempfile.mkstemp(
+            prefix="subset-",
+            suffix=os.path.splitext(input_file)[1],
+            dir=spill_dir)
+        os.close(handle)
+        utils.to(sample, self.spill_file, dataset_type)
+        return self.spill_file
+
+    def prepares_rows(self) -> bool:
+        """Check whether prepare() samples the input rows.
+
+        Returns:
+            bool: True in sampling modes
+        """
+        return self.config.get("mode", "range") != "range"
+
+    def close(self) -> None:
+        """Remove the sample file."""
+        if self.spill_file is not None:
+            os.remove(self.spill_file)
+            self.spill_file = None
+
+    def abort(self) -> None:
+        """Remove the sample file after a failed run."""
+        self.close()
+
+    def _sampler(self) -> StreamSampler:
+        """Create the sampler of the configured sampling mode.
+
+        Returns:
+            StreamSampler: Configured sampler
+        """
+        stratified = self.config.get("mode") == "stratified"
+        return StreamSampler(
+            self.config["size"],
+            seed=self.config.get("seed", 42),
+            column=self.config["stratify_column"] if stratified else None,
+            metric=self.config.get("metric", "chars"),
+            strata=self.config.get("strata"),
+            allocation=self.config.get("allocation", "proportional"))
+
+    def _count(self, sampler: StreamSampler,
+               batches: Iterable[pd.DataFrame]) -> Optional[Dict[int, int]]:
+        """Count the strata of stratified mode.
+
+        Args:
+            sampler (StreamSampler): Configured sampler
+            batches (Iterable[pd.DataFrame]): Batches to count
+
+        Returns:
+            Optional[Dict[int, int]]: Rows per stratum, or None in
+                reservoir mode
+        """
+        if self.config.get("mode") != "stratified":
+            return None
+        return sampler.count(batches)
+
     @classmethod
     def _validate_config(cls, config: dict) -> None:
         """Validate pipe configuration.
@@ -101,6 +253,21 @@ class SubsetPipe(Pipe):
         if columns and columns != ["all"] and len(columns) != 2:
             raise ValueError("Column range must be [start, end]")
 
+        mode = config.get("mode", "range")
+        if mode not in MODES:
+            raise ValueError(f"Subset mode must be one of: {MODES}")
+        if mode == "range":
+            return
+        size = config.get("size")
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("Sample size must be a positive integer")
+        if rows and rows != ["all"]:
+            raise ValueError("Row range cannot be combined with sampling")
+        if mode == "stratified" and not config.get("stratify_column"):
+            raise ValueError("Stratified sampling requires stratify_column")
+        if config.get("allocation", "proportional") not in ALLOCATIONS:
+            raise ValueError(f"Allocation must be one of: {ALLOCATIONS}")
+
     @staticmethod
     def _has_valid_ranges(rows: Optional[List[int]],
                           columns: Optional[List[int]]) -> bool:
@@ -1,9 +1,9 @@
 # @file thinking_dataset/providers/ollama_provider.py
 # @description Ollama provider class
-# @version 1.1.16
+# @version 1.1.17
 # @license MIT
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from tenacity import retry, stop_after_attempt, wait_fixed
 from .provider import Provider
 from .ollama_provider_mock import OllamaProviderMock
@@ -17,8 +17,11 @@ class OllamaProvider(Provider):
     This class:
     1. Initializes the Ollama provider with configuration settings
     2. Provides methods for processing requests asynchronously
+    3. Reports the timing fields the server returns per request
 
     Attributes:
+        TIMINGS (List[str]): Token counts and nanosecond durations of a
+            response
         config (Dict[str, Any]): Configuration dictionary
         mock (Optional[bool]): Flag to use mock provider
         model (str): Model name for the provider
@@ -26,6 +29,11 @@ class OllamaProvider(Provider):
         client (Any): Client instance for the provider
     """
 
+    TIMINGS = [
+        "prompt_eval_count", "prompt_eval_duration", "eval_count",
+        "eval_duration", "load_duration", "total_duration"
+    ]
+
     def __init__(self, config: Dict[str, Any], mock: Optional[bool] = False):
         """
         Initialize the Ollama provider with configuration settings.
@@ -48,7 +56,6 @@ class OllamaProvider(Provider):
         else:
             self.client = AsyncClient(host=self.url)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
     async def process_request_async(self, prompt: str) -> str:
         """
         Process a request asynchronously and return the response.
@@ -59,10 +66,31 @@ class OllamaProvider(Provider):
         Returns:
             str: The response from the provider
         """
+        response, _ = await self.process_request_timed_async(prompt)
+        return response
+
+    @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
+    async def process_request_timed_async(
+            self, prompt: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Process a request asynchronously and return the response with its
+        timings.
+
+        Args:
+            prompt (str): The input prompt for the request
+
+        Returns:
+            Tuple[str, Dict[str, int]]: The response from the provider and
+                the value of each timing field, 0 where the server sent none
+        """
         if self.mock:
             response = await self.client.process_request_async(prompt)
         else:
             response = await self.client.generate(model=self.model,
                                                   prompt=prompt,
                                                   stream=False)
-        return response.response
+        timings = {
+            field: getattr(response, field, None) or 0
+            for field in self.TIMINGS
+        }
+        return response.response, timings
@@ -1,9 +1,9 @@
 # @file thinking_dataset/providers/provider.py
 # @description Base class for providers.
-# @version 1.1.6
+# @version 1.1.7
 # @license MIT
 
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from abc import ABC, abstractmethod
 from thinking_dataset.utils.provider_utils import ProviderUtils
 
@@ -15,6 +15,8 @@ class Provider(ABC):
     This class:
     1. Initializes the provider with configuration settings.
     2. Provides an abstract method for processing requests.
+    3. Provides a timed request method that providers reporting server
+       timings override.
 
     Attributes:
         config (Dict[str, Any]): Configuration dictionary.
@@ -60,3 +62,21 @@ class Provider(ABC):
             str: The response from the provider.
         """
         pass
+
+    async def process_request_timed_async(
+            self, prompt: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Process a request asynchronously and return the response with its
+        timings.
+
+        Providers whose servers report timings override this method. The
+        default has no timings to report.
+
+        Args:
+            prompt (str): The input prompt for the request.
+
+        Returns:
+            Tuple[str, Dict[str, int]]: The response from the provider and
+                an empty timings dictionary.
+        """
+        return await self.process_request_async(prompt), {}
@@ -1,17 +1,22 @@
 """Input Source Module."""
 
-__version__ = "0.0.3"
+__version__ = "0.0.10"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
 
 import random
 from dataclasses import dataclass
-from typing import List, Any
+from typing import List, Any, Optional, Union
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import MetaData, Table, select
+from sqlalchemy import MetaData, Select, Table, func, select
+
+from thinking_dataset.utils.chunk_index import ChunkIndex
 from .source import Source
+from .source_cache import SourceData
+from .sql_sampler import SqlSampler
 
 
 @dataclass
@@ -23,6 +28,10 @@ class InputSource(Source):
     offset: int = 0
     ellipsis: str = ""  # Empty string means no ellipsis
     shuffle: bool = False
+    chunks: bool = False  # Sample chunks from the table's chunk index
+    sampling: str = "memory"  # "sql" samples and truncates in the database
+    min_length: int = 0  # 0 means no lower bound on text characters
+    max_length: int = 0  # 0 means no upper bound on text characters
 
     def validate(self) -> None:
         """Validate input source configuration."""
@@ -35,14 +44,149 @@ class InputSource(Source):
             raise ValueError("Length cannot be negative")
         if self.offset < 0:
             raise ValueError("Offset cannot be negative")
+        if self.sampling not in ["memory", "sql"]:
+            raise ValueError("Sampling must be 'memory' or 'sql'")
         if self.length > 0 and self.offset >= self.length:
             raise ValueError(f"Offset ({self.offset}) cannot be greater than "
                              f"length ({self.length})")
+        if self.min_length < 0 or self.max_length < 0:
+            raise ValueError("Length bounds cannot be negative")
+        if self.max_length and self.min_length > self.max_length:
+            raise ValueError(f"Min length ({self.min_length}) cannot be "
+                             f"greater than max length ({self.max_length})")
+        if (self.min_length or self.max_length) and self.sampling != "memory":
+            raise ValueError("Length bounds require 'memory' sampling")
 
     def fetch_source(self, session: Any) -> pd.DataFrame:
-        """Fetch source texts from database table."""
+        """Fetch source texts from database table.
+
+        With chunks enabled, one row per chunk is returned with the parent
+        text shared by reference and the chunk's start and end offsets.
+        Length bounds select the texts, or the parents of the chunks, whose
+        character length lies within them.
+        """
         table = Table(self.table, MetaData(), autoload_with=session.bind)
-        return pd.read_sql(select(table.c[self.column]), session.bind)
+        if not self.chunks:
+            return pd.read_sql(
+                self._bounded(select(table.c[self.column]), table),
+                session.bind)
+
+        parents = pd.read_sql(
+            self._bounded(select(table.c.id, table.c[self.column]), table),
+            session.bind)
+        index = Table(ChunkIndex.table_name(self.table),
+                      MetaData(),
+                      autoload_with=session.bind)
+        chunks = ChunkIndex.join(parents, pd.read_sql(select(index),
+                                                      session.bind))
+        return chunks[[self.column, "start", "end"]]
+
+    def _bounded(self, query: Select, table: Table) -> Select:
+        """Restrict a source query to texts within the length bounds.
+
+        Lengths are measured by the database on the current texts, so the
+        bounds always hold for the rows that are read.
+        """
+        lengths = func.length(table.c[self.column])
+        if self.min_length:
+            query = query.where(lengths >= self.min_length)
+        if self.max_length:
+            query = query.where(lengths <= self.max_length)
+        return query
+
+    def sample_sql(self,
+                   session: Any,
+                   count: int,
+                   rng: Optional[np.random.Generator] = None
+                   ) -> List[List[str]]:
+        """Draw the samples of a number of queries in the database.
+
+        Only the sampled rows are read, already truncated, so the source
+        table is never materialized.
+        """
+        return SqlSampler(self, session).sample(count, rng)
+
+    def sample_batch(self, source: SourceData, count: int,
+                     rng: np.random.Generator) -> np.ndarray:
+        """Draw the samples of a number of queries at once.
+
+        Returns:
+            np.ndarray: Object array of shape (count, amount) of samples
+        """
+        return self.take(source, self.draw_batch(len(source), count, rng))
+
+    def draw_batch(self, size: int, count: int,
+                   rng: np.random.Generator) -> np.ndarray:
+        """Draw the sample indices of a number of queries at once.
+
+        Returns:
+            np.ndarray: Integer array of shape (count, amount) of distinct
+                indices per query
+        """
+        if not size:
+            raise ValueError(
+                f"No source data available for label {self.label}")
+        if self.amount > size:
+            raise ValueError(f"Amount ({self.amount}) exceeds the "
+                             f"{size} samples of label {self.label}")
+        if not count:
+            return np.empty((0, self.amount), dtype=np.int64)
+        return self._draw_indices(size, count, rng)
+
+    def take(self, source: SourceData, indices: np.ndarray) -> np.ndarray:
+        """Get the truncated samples at drawn indices.
+
+        Every distinct sampled text is truncated once with vectorized
+        string slicing.
+
+        Returns:
+            np.ndarray: Object array of samples shaped like the indices
+        """
+        if not indices.size:
+            return np.empty(indices.shape, dtype=object)
+        unique, inverse = np.unique(indices, return_inverse=True)
+        texts = pd.Series([source.text(index) for index in unique],
+                          dtype=object)
+        return self._truncate(texts)[inverse].reshape(indices.shape)
+
+    def _draw_indices(self, size: int, count: int,
+                      rng: np.random.Generator) -> np.ndarray:
+        """Draw distinct indices per query for all queries.
+
+        Rows with a repeated index are redrawn whole, which keeps every
+        ordered draw equally likely. When repeats are likely, indices are
+        taken from a random permutation per query instead.
+        """
+        if self.amount**2 > size:
+            block = max(1, (1 << 22) // size)
+            return np.concatenate([
+                np.argsort(rng.random((min(block, count - start), size)),
+                           axis=1)[:, :self.amount]
+                for start in range(0, count, block)
+            ])
+
+        indices = rng.integers(0, size, (count, self.amount))
+        while self.amount > 1:
+            ordered = np.sort(indices, axis=1)
+            repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+            if not repeated.any():
+                break
+            indices[repeated] = rng.integers(0, size,
+                                             (repeated.sum(), self.amount))
+        return indices
+
+    def _truncate(self, texts: pd.Series) -> np.ndarray:
+        """Apply offset, length and ellipsis to sampled texts."""
+        if self.length <= 0:
+            return texts.to_numpy()
+        actual_length = self.length
+        if self.ellipsis:
+            actual_length = max(0, self.length - len(self.ellipsis))
+        samples = texts.str.slice(self.offset, self.offset + actual_length)
+        if self.ellipsis:
+            longer = texts.str.len() - self.offset > actual_length
+            samples = samples.where(~longer, samples + self.ellipsis)
+        return samples.to_numpy()
 
     def shuffle_samples(self, source: pd.DataFrame) -> pd.DataFrame:
         """Shuffle the source data if enabled."""
@@ -51,19 +195,25 @@ class InputSource(Source):
         return source
 
     def get_samples(self,
-                    source: pd.DataFrame,
+                    source: Union[pd.DataFrame, SourceData],
                     ellipsis: str = "") -> List[str]:
-        """Get random samples from source data."""
-        if source.empty:
+        """Get random samples from fetched or cached source data.
+
+        Cached data is sampled directly, since a uniform sample of indices
+        needs no prior shuffle.
+        """
+        if isinstance(source, pd.DataFrame):
+            source = SourceData.from_frame(self.shuffle_samples(source))
+        if not len(source):
             raise ValueError(
                 f"No source data available for label {self.label}")
 
-        source = self.shuffle_samples(source)
         indices = random.sample(range(len(source)), self.amount)
         samples = []
 
         for idx in indices:
-            full_text = source.iloc[idx].values[0]
+            # Chunks are materialized only once they are sampled
+            full_text = source.text(idx)
             if self.length > 0:
                 # Account for ellipsis length in sample size
                 actual_length = self.length
@@ -91,6 +241,10 @@ class InputSource(Source):
                      length=config.get("length", 0),
                      offset=config.get("offset", 0),
                      ellipsis=config.get("ellipsis", ""),
-                     shuffle=config.get("shuffle", False))
+                     shuffle=config.get("shuffle", False),
+                     chunks=config.get("chunks", False),
+                     sampling=config.get("sampling", "memory"),
+                     min_length=config.get("min_length", 0),
+                     max_length=config.get("max_length", 0))
         source.validate()
         return source
@@ -1,6 +1,6 @@
 """Output Source Module."""
 
-__version__ = "0.0.3"
+__version__ = "0.0.4"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
@@ -19,6 +19,9 @@ class OutputSource(Source):
         if not self.table or not self.column:
             raise ValueError(
                 "Both table and column must be provided for OutputSource")
+        if self.if_exists not in ["fail", "replace", "append", "update"]:
+            raise ValueError(
+                "if_exists must be 'fail', 'replace', 'append' or 'update'")
 
     @classmethod
     def from_config(cls, config: dict) -> 'OutputSource':
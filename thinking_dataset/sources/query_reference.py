@@ -0,0 +1,244 @@
+"""Query Reference Module."""
+
+__version__ = "0.0.2"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import MetaData, Table, select
+
+from thinking_dataset.db.template_registry import TemplateRegistry
+from thinking_dataset.templates.compiled_template import CompiledTemplate
+from .input_source import InputSource
+from .source_cache import SourceCache
+
+
+class QueryReferences:
+    """Compact references to generated queries.
+
+    A reference names a registered template and the sampled source
+    positions of each of its sources, e.g. ``@query:1f2e3d4c5b6a7988:3,17;5``
+    for two sources drawing two and one samples. Truncation settings are
+    part of the registered source configurations, so a reference renders to
+    the same query as long as the source tables keep their rows.
+
+    A stored reference names a query already written to a table instead,
+    by table, column and id, e.g. ``@stored:cables:query:42``.
+    """
+
+    PREFIX = "@query:"
+    STORED_PREFIX = "@stored:"
+
+    @classmethod
+    def encode(cls, template_id: str,
+               indices: Sequence[np.ndarray]) -> np.ndarray:
+        """Encode the drawn indices of every source into references.
+
+        Args:
+            template_id (str): Id of the registered template.
+            indices (Sequence[np.ndarray]): Index matrix of shape
+                (queries, amount) per source, in source order.
+
+        Returns:
+            np.ndarray: Object array of one reference per query
+        """
+        references = None
+        for matrix in indices:
+            joined = None
+            for column in matrix.T:
+                texts = column.astype(str).astype(object)
+                joined = texts if joined is None else joined + "," + texts
+            references = joined if references is None \
+                else references + ";" + joined
+        return f"{cls.PREFIX}{template_id}:" + references
+
+    @classmethod
+    def encode_stored(cls, table: str, column: str,
+                      ids: np.ndarray) -> np.ndarray:
+        """Encode references to queries stored in a table column.
+
+        Args:
+            table (str): Table holding the queries.
+            column (str): Column holding the queries.
+            ids (np.ndarray): Ids of the stored queries.
+
+        Returns:
+            np.ndarray: Object array of one reference per id
+        """
+        return (f"{cls.STORED_PREFIX}{table}:{column}:" +
+                np.asarray(ids).astype(str).astype(object))
+
+    @classmethod
+    def decode(cls,
+               references: Sequence[str]) -> Tuple[np.ndarray, List[Any]]:
+        """Split references into template ids and index matrices.
+
+        Args:
+            references (Sequence[str]): References to decode.
+
+        Returns:
+            Tuple[np.ndarray, List[Any]]: Template id per reference, and
+                the index matrix per source of every reference, as lists
+                of integer arrays
+        """
+        parts = pd.Series(references, dtype=object).str.slice(
+            len(cls.PREFIX)).str.split(":", n=1, expand=True)
+        indices = [[
+            np.array(group.split(","), dtype=np.int64)
+            for group in body.split(";")
+        ] for body in parts[1].tolist()]
+        return parts[0].to_numpy(), indices
+
+    @classmethod
+    def is_reference(cls, values: pd.Series) -> bool:
+        """Check whether every non-null value is a query reference."""
+        values = values.dropna()
+        return bool(len(values)) and bool(
+            values.astype(str).str.startswith(
+                (cls.PREFIX, cls.STORED_PREFIX)).all())
+
+
+class QueryRenderer:
+    """Render queries from source samples or from query references.
+
+    Each label of a template is replaced by the markdown list of the first
+    source with that label. Sources are read once into a shared cache.
+    Stored references are read back from their table.
+    """
+
+    def __init__(self,
+                 session: Any,
+                 registry: Optional[TemplateRegistry] = None,
+                 cache: Optional[SourceCache] = None) -> None:
+        """Initialize a renderer with a registry to resolve references."""
+        self.session = session
+        self.registry = registry
+        self.cache = cache if cache is not None else SourceCache()
+        self._templates: Dict[str, Tuple[CompiledTemplate,
+                                         List[InputSource]]] = {}
+        self._tables: Dict[str, Table] = {}
+
+    @staticmethod
+    def wrap(samples: np.ndarray) -> np.ndarray:
+        """Join the samples of every query into a markdown list.
+
+        Args:
+            samples (np.ndarray): Object array of shape (queries, amount)
+
+        Returns:
+            np.ndarray: Markdown list text per query, each sample on its
+                own "- " line after a newline
+        """
+        wrapped = np.full(len(samples), "", object)
+        for column in samples.T:
+            texts = pd.Series(column).astype(str).to_numpy()
+            wrapped = wrapped + "\n- " + texts
+        return wrapped
+
+    @classmethod
+    def assemble(
+        cls, compiled: CompiledTemplate, sources: List[InputSource],
+        samples: List[np.ndarray]
+    ) -> Tuple[List[str], Dict[str, pd.Series]]:
+        """Render queries from the samples of every source.
+
+        Args:
+            compiled (CompiledTemplate): Template of the queries
+            sources (List[InputSource]): Sources, in order
+            samples (List[np.ndarray]): Samples of shape (queries, amount)
+                per source
+
+        Returns:
+            Tuple[List[str], Dict[str, pd.Series]]: Queries, and the
+                stripped markdown list per label with the combined lists of
+                all sources as "seed"
+        """
+        count = len(samples[0])
+        columns, values, seeds = {}, {}, np.full(count, "", object)
+        for source, batch in zip(sources, samples):
+            wrapped = cls.wrap(batch)
+            values.setdefault(source.label, wrapped + "\n")
+            columns[source.label] = pd.Series(wrapped).str.strip()
+            seeds = seeds + wrapped
+
+        # Combined seeds of all sources replace a "seed" label column
+        columns["seed"] = pd.Series(seeds).str.strip()
+        return compiled.render_columns(values), columns
+
+    def render(self, references: Sequence[str]) -> List[str]:
+        """Render the queries of references.
+
+        Args:
+            references (Sequence[str]): Query references.
+
+        Returns:
+            List[str]: Rendered queries, in reference order
+
+        Raises:
+            ValueError: If no registry resolves the references
+        """
+        references = pd.Series(references, dtype=object)
+        stored = references.str.startswith(QueryReferences.STORED_PREFIX)
+        queries: List[str] = [""] * len(references)
+        for row, query in zip(np.flatnonzero(stored),
+                              self._read_stored(references[stored])):
+            queries[row] = query
+        if stored.all():
+            return queries
+        if self.registry is None:
+            raise ValueError("A template registry is required to render "
+                             "query references")
+
+        positions = np.flatnonzero(~stored)
+        template_ids, indices = QueryReferences.decode(references[~stored])
+        for template_id in pd.unique(template_ids):
+            matches = np.flatnonzero(template_ids == template_id)
+            rows = positions[matches]
+            compiled, sources = self._template(template_id)
+            samples = [
+                source.take(
+                    self.cache.get(source, self.session),
+                    np.stack([indices[row][position] for row in matches]))
+                for position, source in enumerate(sources)
+            ]
+            for row, query in zip(rows,
+                                  self.assemble(compiled, sources,
+                                                samples)[0]):
+                queries[row] = query
+        return queries
+
+    def _read_stored(self, references: pd.Series) -> List[str]:
+        """Read the queries of stored references from their tables."""
+        if not len(references):
+            return []
+        parts = references.str.slice(len(
+            QueryReferences.STORED_PREFIX)).str.rsplit(":", n=2, expand=True)
+        queries = pd.Series("", index=references.index, dtype=object)
+        for (name, column), group in parts.groupby([0, 1]):
+            if name not in self._tables:
+                self._tables[name] = Table(name,
+                                           MetaData(),
+                                           autoload_with=self.session.bind)
+            table = self._tables[name]
+            ids = group[2].astype(np.int64)
+            stored = dict(
+                self.session.execute(
+                    select(table.c.id, table.c[column]).where(
+                        table.c.id.in_(ids.tolist()))).all())
+            queries[group.index] = ids.map(stored).to_numpy()
+        return queries.tolist()
+
+    def _template(
+            self,
+            template_id: str) -> Tuple[CompiledTemplate, List[InputSource]]:
+        """Get a registered template compiled, with its sources."""
+        if template_id not in self._templates:
+            template, configs = self.registry.get(template_id)
+            sources = [InputSource.from_config(config) for config in configs]
+            self._templates[template_id] = (CompiledTemplate(
+                template, [source.label for source in sources]), sources)
+        return self._templates[template_id]
@@ -0,0 +1,72 @@
+"""Source Cache Module."""
+
+__version__ = "0.0.2"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from thinking_dataset.utils.log import Log
+
+if TYPE_CHECKING:
+    from .input_source import InputSource
+
+
+@dataclass
+class SourceData:
+    """Source texts held as arrays for repeated sampling.
+
+    Chunked sources keep one reference to the parent text per chunk and
+    the chunk offsets, so chunk text is only sliced once it is sampled.
+    """
+    texts: np.ndarray
+    starts: Optional[np.ndarray] = None
+    ends: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        """Get the number of samples to draw from."""
+        return len(self.texts)
+
+    def text(self, index: int) -> Any:
+        """Get the text of one sample."""
+        text = self.texts[index]
+        if self.starts is None:
+            return text
+        return text[self.starts[index]:self.ends[index]]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'SourceData':
+        """Create source data from a fetched source frame."""
+        texts = df.iloc[:, 0].to_numpy(dtype=object)
+        if "start" not in df.columns:
+            return cls(texts)
+        return cls(texts, df["start"].to_numpy(dtype=np.int64),
+                   df["end"].to_numpy(dtype=np.int64))
+
+
+class SourceCache:
+    """Fetch-once cache of input source texts.
+
+    Each table column is read once and sampled from memory afterwards. A
+    cache lives for one pipe run, during which the sources are not written.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._data: Dict[Tuple[str, str, bool, int, int], SourceData] = {}
+
+    def get(self, source: 'InputSource', session: Any) -> SourceData:
+        """Get the texts of a source, fetching them on first use."""
+        key = (source.table, source.column, source.chunks,
+               source.min_length, source.max_length)
+        if key not in self._data:
+            self._data[key] = SourceData.from_frame(
+                source.fetch_source(session))
+            Log.info(f"Cached {len(self._data[key])} samples from "
+                     f"{source.table}.{source.column}")
+        return self._data[key]
@@ -0,0 +1,159 @@
+"""SQL Sampler Module."""
+
+__version__ = "0.0.2"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+import numpy as np
+from sqlalchemy import MetaData, Table, case, func, literal_column, select
+
+from thinking_dataset.utils.chunk_index import ChunkIndex
+from thinking_dataset.utils.log import Log
+
+if TYPE_CHECKING:
+    from .input_source import InputSource
+
+QUERY_CHUNK = 900
+
+
+class SqlSampler:
+    """Database-side random sampling of input source texts.
+
+    Samples are drawn as random rowids and fetched with their offset,
+    length and ellipsis applied by the database, so only the sampled
+    characters are read into Python. Rowid gaps are redrawn, which keeps
+    the sample uniform. Databases without rowids sample each query with
+    ORDER BY random() LIMIT.
+    """
+
+    def __init__(self, source: 'InputSource', session: Any) -> None:
+        """Reflect the tables of a source."""
+        self.source = source
+        self.session = session
+        self.dialect = session.bind.dialect
+        self.table = Table(source.table,
+                           MetaData(),
+                           autoload_with=session.bind)
+        self.index = None
+        if source.chunks:
+            self.index = Table(ChunkIndex.table_name(source.table),
+                               MetaData(),
+                               autoload_with=session.bind)
+
+    def sample(self,
+               count: int,
+               rng: Optional[np.random.Generator] = None) -> List[List[str]]:
+        """Draw the samples of a number of queries.
+
+        Each query gets the source amount of distinct rows. Rowids are drawn
+        from the given generator; ordered sampling cannot be seeded.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        if self.dialect.name != "sqlite":
+            return [self._sample_ordered() for _ in range(count)]
+
+        rowid = self._rowid()
+        sampled = self.index if self.index is not None else self.table
+        low, high, total = self.session.execute(
+            select(func.min(rowid), func.max(rowid),
+                   func.count()).select_from(sampled)).one()
+        if total < self.source.amount:
+            raise ValueError(
+                f"No source data available for label {self.source.label}")
+
+        samples: List[List[str]] = [[] for _ in range(count)]
+        drawn: List[Set[int]] = [set() for _ in range(count)]
+        pending = list(range(count))
+        while pending:
+            draws = {
+                query: self._draw(rng, low, high, drawn[query],
+                                  self.source.amount - len(samples[query]))
+                for query in pending
+            }
+            found = self._fetch({r for rows in draws.values() for r in rows})
+            for query, rowids in draws.items():
+                samples[query].extend(found[r] for r in rowids if r in found)
+            pending = [
+                query for query in pending
+                if len(samples[query]) < self.source.amount
+            ]
+
+        Log.info(f"Sampled {count * self.source.amount} rows from "
+                 f"{self.source.table}.{self.source.column} in SQL")
+        return samples
+
+    @staticmethod
+    def _draw(rng: np.random.Generator, low: int, high: int, drawn: Set[int],
+              amount: int) -> List[int]:
+        """Draw rowids not drawn before for a query."""
+        rowids = []
+        while len(rowids) < amount:
+            rowid = int(rng.integers(low, high + 1))
+            if rowid not in drawn:
+                drawn.add(rowid)
+                rowids.append(rowid)
+        return rowids
+
+    def _rowid(self) -> Any:
+        """Get the rowid column of the sampled table."""
+        sampled = self.index if self.index is not None else self.table
+        name = self.dialect.identifier_preparer.quote(sampled.name)
+        return literal_column(f"{name}.rowid")
+
+    def _statement(self, *columns: Any) -> Any:
+        """Select columns next to the sample text."""
+        column = self.table.c[self.source.column]
+        if self.index is None:
+            text = self._truncate(column, 0, func.length(column))
+            return select(*columns, text)
+
+        start, end = self.index.c.start, self.index.c.end
+        text = self._truncate(column, start, end - start)
+        return select(*columns, text).select_from(
+            self.index.join(self.table,
+                            self.table.c.id == self.index.c.parent_id))
+
+    def _truncate(self, column: Any, start: Any, length: Any) -> Any:
+        """Apply the chunk, offset, length and ellipsis to a text."""
+        source = self.source
+        if source.length <= 0:
+            if self.index is None:
+                return column
+            return func.substr(column, start + 1, length)
+
+        size = source.length
+        if source.ellipsis:
+            size = max(0, source.length - len(source.ellipsis))
+        remaining = length - source.offset
+        body = func.substr(
+            column, start + 1 + source.offset,
+            case((remaining < 0, 0), (remaining < size, remaining),
+                 else_=size))
+        if not source.ellipsis:
+            return body
+        return case((remaining > size, body.concat(source.ellipsis)),
+                    else_=body)
+
+    def _fetch(self, rowids: Set[int]) -> Dict[int, str]:
+        """Fetch the sample text of existing rowids."""
+        rowid = self._rowid()
+        found = {}
+        rowids = sorted(rowids)
+        for start in range(0, len(rowids), QUERY_CHUNK):
+            chunk = rowids[start:start + QUERY_CHUNK]
+            stmt = self._statement(rowid).where(rowid.in_(chunk))
+            found.update(self.session.execute(stmt).all())
+        return found
+
+    def _sample_ordered(self) -> List[str]:
+        """Sample one query by random ordering."""
+        order = func.rand() if self.dialect.name == "mysql" else func.random()
+        stmt = self._statement().order_by(order).limit(self.source.amount)
+        samples = self.session.execute(stmt).scalars().all()
+        if len(samples) < self.source.amount:
+            raise ValueError(
+                f"No source data available for label {self.source.label}")
+        return samples
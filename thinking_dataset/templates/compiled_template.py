@@ -0,0 +1,151 @@
+"""Compiled Template Module.
+
+This module provides templates parsed once into literal segments and
+placeholder slots, so that rendering is a single join per query.
+
+Classes:
+    CompiledTemplate
+
+Functions:
+    CompiledTemplate.render(values: Dict[str, str]) -> str
+    CompiledTemplate.render_batch(rows: List[Dict[str, str]]) -> List[str]
+    CompiledTemplate.render_columns(columns: Dict[str, Sequence[str]])
+        -> List[str]
+    CompiledTemplate.slots_last(template: str, labels: Iterable[str]) -> str
+"""
+
+__version__ = "0.0.3"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+import re
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+class CompiledTemplate:
+    """Template split into literal segments and placeholder slots.
+
+    A placeholder is a label between double braces with optional whitespace
+    around it, e.g. ``{{ seed }}`` or ``{{seed}}``. Only the given labels
+    become slots; other placeholders stay literal text. Values are inserted
+    as they are, without escape processing.
+
+    Attributes:
+        segments (List[str]): Literal text around the slots, one more than
+            there are slots
+        slots (List[str]): Label of each slot, in template order
+    """
+
+    def __init__(self, template: str, labels: Iterable[str]) -> None:
+        """Parse a template for the given labels.
+
+        Args:
+            template (str): Template text.
+            labels (Iterable[str]): Placeholder labels to fill.
+        """
+        pattern = self._pattern(labels)
+        self.segments: List[str] = []
+        self.slots: List[str] = []
+        if pattern is None:
+            self.segments = [template]
+            self._parts, self._positions = [template], []
+            return
+
+        position = 0
+        for match in pattern.finditer(template):
+            self.segments.append(template[position:match.start()])
+            self.slots.append(match.group(1))
+            position = match.end()
+        self.segments.append(template[position:])
+
+        self._parts = [self.segments[0]]
+        for segment in self.segments[1:]:
+            self._parts.extend(["", segment])
+        self._positions = [(2 * index + 1, label)
+                           for index, label in enumerate(self.slots)]
+
+    @staticmethod
+    def _pattern(labels: Iterable[str]) -> Optional[re.Pattern]:
+        """Build the placeholder pattern of labels, if there are any."""
+        labels = list(dict.fromkeys(labels))
+        if not labels:
+            return None
+        alternatives = "|".join(re.escape(label) for label in labels)
+        return re.compile(r'{{\s*(' + alternatives + r')\s*}}')
+
+    @classmethod
+    def slots_last(cls, template: str, labels: Iterable[str]) -> str:
+        """Move the placeholder blocks of a template after its static ones.
+
+        Blocks are separated by blank lines. Blocks holding a placeholder
+        keep their order after all static blocks, so every rendering shares
+        the static text as its prefix. Runs of blank lines between blocks
+        become single blank lines.
+
+        Args:
+            template (str): Template text.
+            labels (Iterable[str]): Placeholder labels to fill.
+
+        Returns:
+            str: Reordered template text.
+        """
+        pattern = cls._pattern(labels)
+        if pattern is None:
+            return template
+
+        blocks = re.split(r'\n(?:[ \t]*\n)+', template.strip("\n"))
+        static = [block for block in blocks if not pattern.search(block)]
+        variable = [block for block in blocks if pattern.search(block)]
+        trailing = "\n" if template.endswith("\n") else ""
+        return "\n\n".join(static + variable) + trailing
+
+    def render(self, values: Dict[str, str]) -> str:
+        """Render the template with one value per label.
+
+        Args:
+            values (Dict[str, str]): Value of each label.
+
+        Returns:
+            str: Rendered text.
+        """
+        parts = self._parts.copy()
+        for position, label in self._positions:
+            parts[position] = values[label]
+        return "".join(parts)
+
+    def render_batch(self, rows: List[Dict[str, str]]) -> List[str]:
+        """Render the template once per row of values.
+
+        Args:
+            rows (List[Dict[str, str]]): Values of each rendering.
+
+        Returns:
+            List[str]: Rendered texts.
+        """
+        return [self.render(values) for values in rows]
+
+    def render_columns(self, columns: Dict[str, Sequence[str]]) -> List[str]:
+        """Render the template once per row of value columns.
+
+        Args:
+            columns (Dict[str, Sequence[str]]): Values of each label, one
+                per rendering.
+
+        Returns:
+            List[str]: Rendered texts.
+        """
+        slots = [(position, columns[label])
+                 for position, label in self._positions]
+        if not slots:
+            rows = len(next(iter(columns.values()))) if columns else 0
+            return ["".join(self._parts)] * rows
+
+        rendered = []
+        positions = [position for position, _ in slots]
+        for row in zip(*(values for _, values in slots)):
+            parts = self._parts.copy()
+            for position, value in zip(positions, row):
+                parts[position] = value
+            rendered.append("".join(parts))
+        return rendered
@@ -7,19 +7,23 @@ Classes:
     TemplateLoader
 
 Functions:
-    TemplateLoader.load(path: str, validate: bool) -> str
+    TemplateLoader.load(path: str, validate: bool, minify: bool,
+                        patterns: Optional[Tuple[str, ...]]) -> str
 
 Exceptions:
     FileNotFoundError
     IOError
 """
 
-__version__ = "0.0.2"
+__version__ = "0.0.3"
 __author__ = "MultiTonic Team"
 __copyright__ = "Copyright (c) 2025 MultiTonic Team"
 __license__ = "MIT"
 
 from functools import lru_cache
+from typing import Optional, Tuple
+
+from thinking_dataset.templates.template_minifier import TemplateMinifier
 from thinking_dataset.templates.template_validator import TemplateValidator
 
 
@@ -27,13 +31,21 @@ class TemplateLoader:
 
     @staticmethod
     @lru_cache(maxsize=None)
-    def load(path: str, validate: bool = False) -> str:
+    def load(path: str,
+             validate: bool = False,
+             minify: bool = False,
+             patterns: Optional[Tuple[str, ...]] = None) -> str:
         """Load a template file from the specified path.
 
         Args:
             path (str): The path to the template file.
             validate (bool, optional): If True, validate the template
                 using TemplateValidator. Defaults to False.
+            minify (bool, optional): If True, strip authoring metadata
+                and redundant whitespace using TemplateMinifier, after
+                validation. Defaults to False.
+            patterns (Optional[Tuple[str, ...]], optional): Patterns the
+                minifier removes. Defaults to TemplateMinifier.PATTERNS.
 
         Returns:
             str: The content of the template file.
@@ -48,6 +60,8 @@ class TemplateLoader:
                 template = file.read()
                 if validate:
                     TemplateValidator.validate(template)
+            if minify:
+                template = TemplateMinifier.minify(template, patterns, path)
             return template
         except FileNotFoundError:
             raise FileNotFoundError(f"Template file not found: {path}")
@@ -0,0 +1,89 @@
+"""Template Minifier Module.
+
+This module provides a compilation step that strips authoring metadata and
+redundant whitespace from templates before they are sent as prompts.
+
+Classes:
+    TemplateMinifier
+
+Functions:
+    TemplateMinifier.minify(template: str,
+                            patterns: Optional[Sequence[str]]) -> str
+"""
+
+__version__ = "0.0.1"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+import re
+from typing import Optional, Sequence
+
+from thinking_dataset.utils.log import Log
+
+
+class TemplateMinifier:
+    """Strip authoring metadata and collapse whitespace in templates.
+
+    Text matching any pattern is removed, trailing whitespace is stripped
+    from every line and runs of blank lines are collapsed into one. The
+    <output> schema is left exactly as written, so TemplateExtractor reads
+    the same elements from a minified template.
+
+    Attributes:
+        PATTERNS (List[str]): Default patterns: @meta, @data and @hint
+            comments, and @stage, @flow and @version lines
+        OUTPUT (re.Pattern): <output> schema block, kept as written
+    """
+
+    PATTERNS = [
+        r'<!--\s*@(?:meta|data|hint)\b[\s\S]*?-->[ \t]*',
+        r'^@(?:stage|flow|version):.*$',
+    ]
+    OUTPUT = re.compile(r'<output>(?:(?!</output>).)*?</output>', re.DOTALL)
+
+    @classmethod
+    def minify(cls,
+               template: str,
+               patterns: Optional[Sequence[str]] = None,
+               name: str = "template") -> str:
+        """Minify a template and log the estimated token savings.
+
+        Args:
+            template (str): Template text.
+            patterns (Optional[Sequence[str]]): Patterns of text to remove,
+                matched in multiline mode. Defaults to PATTERNS.
+            name (str, optional): Template name to report. Defaults to
+                "template".
+
+        Returns:
+            str: Minified template.
+        """
+        compiled = [
+            re.compile(pattern, re.MULTILINE)
+            for pattern in (cls.PATTERNS if patterns is None else patterns)
+        ]
+
+        parts, position = [], 0
+        for match in cls.OUTPUT.finditer(template):
+            parts.append(cls._strip(template[position:match.start()],
+                                    compiled))
+            parts.append(match.group(0))
+            position = match.end()
+        parts.append(cls._strip(template[position:], compiled))
+        minified = "".join(parts).strip()
+
+        before, after = len(template) // 4, len(minified) // 4
+        saved = before - after
+        percentage = saved / before * 100 if before else 0
+        Log.info(f"Minified {name}: {before:,} -> {after:,} tokens "
+                 f"(saved {saved:,} tokens, {percentage:.1f}%)")
+        return minified
+
+    @staticmethod
+    def _strip(text: str, patterns: Sequence[re.Pattern]) -> str:
+        """Remove patterns and redundant whitespace from template text."""
+        for pattern in patterns:
+            text = pattern.sub("", text)
+        text = re.sub(r'[ \t]+$', "", text, flags=re.MULTILINE)
+        return re.sub(r'\n{3,}', "\n\n", text)
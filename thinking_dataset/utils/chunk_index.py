@@ -0,0 +1,173 @@
+"""Chunk Index Module.
+
+This module provides helpers for compact chunk indexes: integer tables of
+(parent_id, chunk_no, start, end) stored next to the parent texts, from
+which chunk text is materialized only when it is needed.
+
+Functions:
+    None
+
+Classes:
+    ChunkIndex: Naming, building and materialization of chunk indexes.
+"""
+
+import os
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+__version__ = "0.0.1"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+
+class ChunkIndex:
+    """Naming, building and materialization of chunk indexes.
+
+    This class:
+    1. Names chunk index files and tables after their parent
+    2. Builds index frames from per-row chunk offsets
+    3. Slices chunk text out of parent texts on demand
+
+    Attributes:
+        SUFFIX (str): Suffix of chunk index files and tables
+        COLUMNS (List[str]): Columns of a chunk index
+    """
+
+    SUFFIX = "chunks"
+    COLUMNS = ["parent_id", "chunk_no", "start", "end"]
+
+    @classmethod
+    def table_name(cls, table: str) -> str:
+        """Get the chunk index table of a parent table.
+
+        Args:
+            table (str): Parent table name
+
+        Returns:
+            str: Chunk index table name
+        """
+        return f"{table}-{cls.SUFFIX}"
+
+    @classmethod
+    def is_index_table(cls, table: str) -> bool:
+        """Check whether a table is a chunk index.
+
+        Args:
+            table (str): Table name
+
+        Returns:
+            bool: True for chunk index tables
+        """
+        return table.endswith(f"-{cls.SUFFIX}")
+
+    @classmethod
+    def file_path(cls, file_path: str) -> str:
+        """Get the chunk index file stored next to a parent file.
+
+        Args:
+            file_path (str): Parent file path
+
+        Returns:
+            str: Chunk index file path
+        """
+        base, ext = os.path.splitext(file_path)
+        return f"{cls.table_name(base)}{ext}"
+
+    @classmethod
+    def build(cls, parent_ids: pd.Series,
+              offsets: List[List[Tuple[int, int]]]) -> pd.DataFrame:
+        """Build a chunk index from per-row chunk offsets.
+
+        Args:
+            parent_ids (pd.Series): Parent id per row
+            offsets (List[List[Tuple[int, int]]]): Chunk offsets per row
+
+        Returns:
+            pd.DataFrame: Chunk index with int64 parent ids and int32
+                chunk numbers and offsets
+        """
+        counts = np.fromiter((len(row) for row in offsets),
+                             dtype=np.int64,
+                             count=len(offsets))
+        flat = np.array([pair for row in offsets for pair in row],
+                        dtype=np.int32).reshape(-1, 2)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        return pd.DataFrame({
+            "parent_id":
+            np.repeat(parent_ids.to_numpy(dtype=np.int64), counts),
+            "chunk_no": (np.arange(len(flat)) - starts).astype(np.int32),
+            "start": flat[:, 0],
+            "end": flat[:, 1],
+        })
+
+    @staticmethod
+    def materialize(texts: pd.Series, starts: pd.Series,
+                    ends: pd.Series) -> List[str]:
+        """Slice chunk text out of parent texts.
+
+        Args:
+            texts (pd.Series): Parent text per chunk
+            starts (pd.Series): Chunk start offsets
+            ends (pd.Series): Chunk end offsets
+
+        Returns:
+            List[str]: Chunk texts
+        """
+        return [
+            text[start:end] for text, start, end in zip(
+                texts.tolist(), starts.tolist(), ends.tolist())
+        ]
+
+    @classmethod
+    def join(cls,
+             parents: pd.DataFrame,
+             index: pd.DataFrame,
+             id_column: str = "id") -> pd.DataFrame:
+        """Attach every chunk of the index to its parent row.
+
+        Parent values are shared by reference, so the result holds one
+        pointer per chunk rather than a copy of the parent text.
+
+        Args:
+            parents (pd.DataFrame): Parent rows
+            index (pd.DataFrame): Chunk index
+            id_column (str, optional): Parent id column. Defaults to "id".
+
+        Returns:
+            pd.DataFrame: One row per chunk, parent columns followed by
+                start and end, ordered by parent row then chunk number
+        """
+        positions = pd.Series(np.arange(len(parents)),
+                              index=parents[id_column].to_numpy(np.int64))
+        index = index[index["parent_id"].isin(positions.index)]
+        index = index.assign(_row=positions.loc[index["parent_id"]].to_numpy())
+        index = index.sort_values(["_row", "chunk_no"], kind="stable")
+        chunks = parents.take(index["_row"].to_numpy()).reset_index(drop=True)
+        chunks["start"] = index["start"].to_numpy()
+        chunks["end"] = index["end"].to_numpy()
+        return chunks
+
+    @classmethod
+    def expand(cls,
+               parents: pd.DataFrame,
+               index: pd.DataFrame,
+               column: str,
+               id_column: str = "id") -> pd.DataFrame:
+        """Materialize one row per chunk, as the rows chunking mode does.
+
+        Args:
+            parents (pd.DataFrame): Parent rows
+            index (pd.DataFrame): Chunk index
+            column (str): Chunked text column
+            id_column (str, optional): Parent id column. Defaults to "id".
+
+        Returns:
+            pd.DataFrame: Parent rows repeated per chunk with the chunk text
+        """
+        chunks = cls.join(parents, index, id_column)
+        chunks[column] = cls.materialize(chunks[column], chunks["start"],
+                                         chunks["end"])
+        return chunks.drop(columns=["start", "end"])
@@ -1,6 +1,6 @@
 # @file thinking_dataset/utils/command_utils.py
 # @description Utility class for common command-related operations.
-# @version 1.2.5
+# @version 1.2.9
 # @license MIT
 
 import os
@@ -40,14 +40,113 @@ class CommandUtils:
         return True
 
     @staticmethod
-    def read_data(file, type):
+    def read_data(file, type, columns=None, rows=None):
+        if columns is None and rows is None:
+            if type == "parquet":
+                return pd.read_parquet(file)
+            elif type == "csv":
+                return pd.read_csv(file)
+            raise ValueError(f"Unsupported dataset type: {type}")
+
+        start, end = rows or (0, None)
+        if type == "parquet":
+            df = CommandUtils._read_parquet_range(file, columns, start, end)
+        elif type == "csv":
+            df = pd.read_csv(file,
+                             usecols=columns,
+                             skiprows=range(1, start + 1),
+                             nrows=None if end is None else end - start)
+            df = df[columns] if columns is not None else df
+        else:
+            raise ValueError(f"Unsupported dataset type: {type}")
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+
+    @staticmethod
+    def read_schema(file, type):
+        if type == "parquet":
+            import pyarrow.parquet as pq
+            return list(pq.read_schema(file).names)
+        elif type == "csv":
+            return list(pd.read_csv(file, nrows=0).columns)
+        else:
+            raise ValueError(f"Unsupported dataset type: {type}")
+
+    @staticmethod
+    def _read_parquet_range(file, columns, start, end):
+        import pyarrow.parquet as pq
+        parquet = pq.ParquetFile(file)
+        metadata = parquet.metadata
+        if end is None or end > metadata.num_rows:
+            end = metadata.num_rows
+        groups, offset, first = [], 0, None
+        read_bytes = total_bytes = 0
+        wanted = None if columns is None else set(columns)
+        for index in range(metadata.num_row_groups):
+            group = metadata.row_group(index)
+            stop = offset + group.num_rows
+            overlaps = offset < end and stop > start
+            if overlaps and first is None:
+                first = offset
+            for leaf in range(group.num_columns):
+                chunk = group.column(leaf)
+                size = chunk.total_compressed_size
+                total_bytes += size
+                top = chunk.path_in_schema.split(".")[0]
+                if overlaps and (wanted is None or top in wanted):
+                    read_bytes += size
+            if overlaps:
+                groups.append(index)
+            offset = stop
+
+        Log.info(f"Reading {len(groups)}/{metadata.num_row_groups} row "
+                 f"groups, {read_bytes}/{total_bytes} compressed bytes")
+        table = parquet.read_row_groups(groups,
+                                        columns=columns,
+                                        use_pandas_metadata=False)
+        if first is not None:
+            table = table.slice(start - first, max(0, end - start))
+        return table.to_pandas()
+
+    @staticmethod
+    def iter_batches(file, type, batch_size, columns=None):
         if type == "parquet":
-            return pd.read_parquet(file)
+            import pyarrow.parquet as pq
+            parquet = pq.ParquetFile(file)
+            for batch in parquet.iter_batches(batch_size=batch_size,
+                                              columns=columns):
+                yield batch.to_pandas()
         elif type == "csv":
-            return pd.read_csv(file)
+            yield from pd.read_csv(file, chunksize=batch_size,
+                                   usecols=columns)
         else:
             raise ValueError(f"Unsupported dataset type: {type}")
 
+    @staticmethod
+    def write_batches(batches, file, type, schema=None):
+        if type not in ["parquet", "csv"]:
+            raise ValueError(f"Unsupported dataset type: {type}")
+        writer = table = None
+        try:
+            for index, df in enumerate(batches):
+                if type == "csv":
+                    df.to_csv(file, index=False, header=index == 0,
+                              mode="w" if index == 0 else "a")
+                    continue
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None and schema is None and not len(df):
+                    continue
+                if writer is None:
+                    writer = pq.ParquetWriter(file, schema or table.schema)
+                writer.write_table(table.cast(writer.schema))
+            if writer is None and table is not None:
+                writer = pq.ParquetWriter(file, schema or table.schema)
+        finally:
+            if writer is not None:
+                writer.close()
+
     @staticmethod
     def to(df, file, type):
         if type == "parquet":
@@ -0,0 +1,254 @@
+"""Dedup Index Module.
+
+This module provides a persistent index of row fingerprints shared across
+pipeline runs, backed by a SQLite table and fronted by an in-memory Bloom
+filter so that unseen rows never reach the database.
+
+Functions:
+    None
+
+Classes:
+    BloomFilter: Vectorized Bloom filter over 64-bit fingerprints.
+    DedupIndex: Persistent fingerprint index for cross-run deduplication.
+"""
+
+import math
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import numpy as np
+
+from thinking_dataset.utils.hash_utils import HashUtils
+
+__version__ = "0.0.1"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+QUERY_CHUNK = 900
+FETCH_CHUNK = 100000
+
+
+class BloomFilter:
+    """Vectorized Bloom filter over 64-bit fingerprints.
+
+    Bit positions are derived by double hashing the mixed fingerprint, so
+    lookups and inserts run over whole arrays at once.
+
+    Attributes:
+        size (int): Number of bits
+        hashes (int): Number of bit positions per fingerprint
+        bits (np.ndarray): Packed bit array
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """Initialize an empty filter sized for a capacity.
+
+        Args:
+            capacity (int): Expected number of fingerprints
+            error_rate (float, optional): Target false positive rate.
+                Defaults to 0.01.
+        """
+        capacity = max(capacity, 1)
+        self.size = max(
+            64, int(-capacity * math.log(error_rate) / math.log(2)**2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+
+    def _positions(self, fingerprints: np.ndarray) -> np.ndarray:
+        """Get bit positions of fingerprints.
+
+        Args:
+            fingerprints (np.ndarray): uint64 fingerprints
+
+        Returns:
+            np.ndarray: Positions of shape (len(fingerprints), hashes)
+        """
+        mixed = HashUtils.mix64(fingerprints.astype(np.uint64))
+        first = mixed[:, None] & np.uint64(0xFFFFFFFF)
+        second = (mixed[:, None] >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.hashes, dtype=np.uint64)[None, :]
+        with np.errstate(over="ignore"):
+            return (first + steps * second) % np.uint64(self.size)
+
+    def add(self, fingerprints: np.ndarray) -> None:
+        """Insert fingerprints into the filter.
+
+        Args:
+            fingerprints (np.ndarray): uint64 fingerprints
+        """
+        positions = self._positions(fingerprints).ravel()
+        np.bitwise_or.at(self.bits, positions >> np.uint64(3),
+                         (1 << (positions & np.uint64(7))).astype(np.uint8))
+
+    def contains(self, fingerprints: np.ndarray) -> np.ndarray:
+        """Test fingerprints for possible membership.
+
+        Args:
+            fingerprints (np.ndarray): uint64 fingerprints
+
+        Returns:
+            np.ndarray: False where a fingerprint was never added
+        """
+        positions = self._positions(fingerprints)
+        bytes_ = self.bits[positions >> np.uint64(3)]
+        masks = (1 << (positions & np.uint64(7))).astype(np.uint8)
+        return ((bytes_ & masks) != 0).all(axis=1)
+
+
+class DedupIndex:
+    """Persistent fingerprint index for cross-run deduplication.
+
+    This class:
+    1. Stores 64-bit row fingerprints in an indexed SQLite table
+    2. Loads them into a Bloom filter for fast negative lookups
+    3. Confirms possible hits against the table in chunked queries
+    4. Stages new fingerprints and commits them in one transaction
+
+    Fingerprints are stored as signed 64-bit integers, the native SQLite
+    integer type.
+
+    Attributes:
+        path (str): SQLite database file
+        table (str): Fingerprint table name
+        error_rate (float): Bloom filter false positive rate
+    """
+
+    def __init__(self,
+                 path: str,
+                 table: str = "dedup_index",
+                 error_rate: float = 0.01) -> None:
+        """Initialize the index and create its table if missing.
+
+        Args:
+            path (str): SQLite database file
+            table (str, optional): Table name. Defaults to "dedup_index".
+            error_rate (float, optional): Bloom filter false positive rate.
+                Defaults to 0.01.
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid dedup index table name: {table}")
+        self.path = path
+        self.table = table
+        self.error_rate = error_rate
+        self._pending = np.empty(0, dtype=np.uint64)
+        self._bloom: Optional[BloomFilter] = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {table} "
+                         "(fingerprint INTEGER PRIMARY KEY)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection running one transaction.
+
+        Yields:
+            sqlite3.Connection: Connection, committed on success and rolled
+                back on error, closed afterwards
+        """
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        """Get the number of committed fingerprints.
+
+        Returns:
+            int: Row count of the index table
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def _iter_fingerprints(self) -> Iterator[np.ndarray]:
+        """Stream committed fingerprints in chunks.
+
+        Yields:
+            np.ndarray: uint64 fingerprint chunk
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(f"SELECT fingerprint FROM {self.table}")
+            while True:
+                rows = cursor.fetchmany(FETCH_CHUNK)
+                if not rows:
+                    break
+                yield np.array(rows, dtype=np.int64).ravel().view(np.uint64)
+
+    def _load_bloom(self) -> BloomFilter:
+        """Build the Bloom filter from the committed fingerprints.
+
+        Returns:
+            BloomFilter: Filter holding every committed fingerprint
+        """
+        if self._bloom is None:
+            self._bloom = BloomFilter(len(self), self.error_rate)
+            for chunk in self._iter_fingerprints():
+                self._bloom.add(chunk)
+        return self._bloom
+
+    def seen(self, fingerprints: np.ndarray) -> np.ndarray:
+        """Check which fingerprints were committed by an earlier run.
+
+        Args:
+            fingerprints (np.ndarray): uint64 fingerprints
+
+        Returns:
+            np.ndarray: True where the fingerprint is in the index
+        """
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        result = np.zeros(len(fingerprints), dtype=bool)
+        if not len(fingerprints):
+            return result
+
+        candidates = np.flatnonzero(self._load_bloom().contains(fingerprints))
+        if not len(candidates):
+            return result
+
+        values = fingerprints[candidates].view(np.int64)
+        found = set()
+        with self._connect() as conn:
+            for start in range(0, len(values), QUERY_CHUNK):
+                chunk = values[start:start + QUERY_CHUNK].tolist()
+                marks = ",".join("?" * len(chunk))
+                found.update(row[0] for row in conn.execute(
+                    f"SELECT fingerprint FROM {self.table} "
+                    f"WHERE fingerprint IN ({marks})", chunk))
+        result[candidates] = np.isin(values, list(found))
+        return result
+
+    def stage(self, fingerprints: np.ndarray) -> None:
+        """Stage fingerprints to be committed at the end of the run.
+
+        Args:
+            fingerprints (np.ndarray): uint64 fingerprints
+        """
+        self._pending = np.concatenate(
+            [self._pending,
+             np.asarray(fingerprints, dtype=np.uint64)])
+
+    def commit(self) -> int:
+        """Write staged fingerprints in a single transaction.
+
+        Returns:
+            int: Number of fingerprints staged
+        """
+        pending = np.unique(self._pending).view(np.int64).tolist()
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {self.table} (fingerprint) "
+                "VALUES (?)", ((value, ) for value in pending))
+        self._pending = np.empty(0, dtype=np.uint64)
+        self._bloom = None
+        return len(pending)
+
+    def rollback(self) -> None:
+        """Discard staged fingerprints."""
+        self._pending = np.empty(0, dtype=np.uint64)
@@ -0,0 +1,151 @@
+"""External Dedup Module.
+
+This module provides out-of-core exact deduplication for inputs larger than
+memory. Row fingerprints are streamed into hash partitions spilled to disk,
+each partition is deduplicated on its own, and the result is a keep-mask in
+the original row order.
+
+Functions:
+    None
+
+Classes:
+    ExternalDedup: Hash-partitioned out-of-core deduplication.
+"""
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from thinking_dataset.utils.hash_utils import HashUtils
+
+__version__ = "0.0.1"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+
+class ExternalDedup:
+    """Hash-partitioned out-of-core deduplication.
+
+    This class:
+    1. Fingerprints streamed batches and appends (fingerprint, position)
+       records to one spill file per hash partition
+    2. Deduplicates every partition independently, optionally in parallel
+    3. Merges the first position of each fingerprint into a keep-mask
+
+    Equal rows always land in the same partition, so peak memory is one
+    partition of fixed-width records plus one byte per row for the mask.
+
+    Attributes:
+        partitions (int): Number of spill partitions
+        bits (int): Fingerprint width, 64 or 128
+        workers (int): Threads deduplicating partitions
+        spill_dir (Optional[str]): Parent directory for spill files
+    """
+
+    def __init__(self,
+                 partitions: int = 16,
+                 bits: int = 64,
+                 workers: int = 1,
+                 spill_dir: Optional[str] = None) -> None:
+        """Initialize the deduplicator.
+
+        Args:
+            partitions (int, optional): Spill partitions. Defaults to 16.
+            bits (int, optional): Fingerprint width. Defaults to 64.
+            workers (int, optional): Partition threads. Defaults to 1.
+            spill_dir (Optional[str], optional): Parent directory for spill
+                files, the system temp directory if None. Defaults to None.
+        """
+        self.partitions = partitions
+        self.bits = bits
+        self.workers = workers
+        self.spill_dir = spill_dir
+        fields = [("fingerprint", np.uint64, (bits // 64, )),
+                  ("position", np.int64)]
+        self.dtype = np.dtype(fields)
+
+    def keep_mask(self, batches: Iterable[pd.DataFrame]) -> np.ndarray:
+        """Compute which rows of a batch stream are first occurrences.
+
+        Args:
+            batches (Iterable[pd.DataFrame]): Batches of the compared
+                columns, in row order
+
+        Returns:
+            np.ndarray: Boolean keep-mask over all streamed rows
+        """
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix="dedup-",
+                                         dir=self.spill_dir) as spill:
+            paths = [
+                os.path.join(spill, f"part-{index:04d}.bin")
+                for index in range(self.partitions)
+            ]
+            total = self._spill(batches, paths)
+            mask = np.zeros(total, dtype=bool)
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for positions in executor.map(self._first_positions, paths):
+                    mask[positions] = True
+        return mask
+
+    def _spill(self, batches: Iterable[pd.DataFrame], paths: list) -> int:
+        """Append fingerprint records of every batch to partition files.
+
+        Args:
+            batches (Iterable[pd.DataFrame]): Batches of compared columns
+            paths (list): Spill file per partition
+
+        Returns:
+            int: Number of streamed rows
+        """
+        total = 0
+        files = [open(path, "wb") for path in paths]
+        try:
+            for batch in batches:
+                fingerprints = HashUtils.fingerprint(batch, self.bits)
+                records = np.empty(len(batch), dtype=self.dtype)
+                records["fingerprint"] = fingerprints.reshape(len(batch), -1)
+                records["position"] = np.arange(total, total + len(batch))
+                total += len(batch)
+
+                heads = records["fingerprint"][:, 0]
+                owners = (heads % np.uint64(self.partitions)).astype(np.intp)
+                order = np.argsort(owners, kind="stable")
+                bounds = np.searchsorted(owners[order],
+                                         np.arange(self.partitions + 1))
+                for index, handle in enumerate(files):
+                    chunk = records[order[bounds[index]:bounds[index + 1]]]
+                    if len(chunk):
+                        handle.write(chunk.tobytes())
+        finally:
+            for handle in files:
+                handle.close()
+        return total
+
+    def _first_positions(self, path: str) -> np.ndarray:
+        """Get the first position of every fingerprint in one partition.
+
+        Args:
+            path (str): Partition spill file
+
+        Returns:
+            np.ndarray: Positions of rows to keep
+        """
+        records = np.fromfile(path, dtype=self.dtype)
+        if not len(records):
+            return np.empty(0, dtype=np.int64)
+        fingerprints = records["fingerprint"]
+        keys = [records["position"]] + [
+            fingerprints[:, index] for index in range(fingerprints.shape[1])
+        ]
+        order = np.lexsort(keys)
+        ordered = fingerprints[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+        return records["position"][order[first]]
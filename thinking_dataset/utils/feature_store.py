@@ -0,0 +1,200 @@
+"""Feature Store Module.
+
+This module provides helpers for per-row feature tables: sizes, hashes and
+text signals of one text column computed once in vectorized form and stored
+next to the parent rows, so that later stages read them instead of
+recomputing them.
+
+Functions:
+    None
+
+Classes:
+    FeatureStore: Naming, building and lookup of feature tables.
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from thinking_dataset.utils.command_utils import CommandUtils
+from thinking_dataset.utils.hash_utils import HashUtils
+from thinking_dataset.utils.series_utils import SeriesUtils
+from thinking_dataset.utils.text_utils import TextUtils
+
+__version__ = "0.0.3"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+
+class FeatureStore:
+    """Naming, building and lookup of feature tables.
+
+    This class:
+    1. Names feature files and tables after their parent
+    2. Builds feature frames from a text column
+    3. Reads feature files and looks features up by row id
+
+    Features describe whole rows and are looked up by row id, so they must
+    be built before ChunkingPipe, whose chunks share the id of their row.
+    Ids must be the hash ids of AddIdPipe: a row whose content changed gets
+    a new id, so stale features never apply and callers measure rows
+    without features themselves. Features built after other transforms
+    hold as long as those transforms are configured the same way.
+
+    Attributes:
+        SUFFIX (str): Suffix of feature files and tables
+        COLUMNS (List[str]): Columns of a feature table
+        METRICS (Dict[str, str]): Feature column of each size metric
+    """
+
+    SUFFIX = "features"
+    COLUMNS = [
+        "id", "column", "char_length", "byte_length", "token_estimate",
+        "content_hash", "non_ascii_ratio", "is_partial"
+    ]
+    METRICS = {
+        "chars": "char_length",
+        "bytes": "byte_length",
+        "tokens": "token_estimate"
+    }
+
+    @classmethod
+    def table_name(cls, table: str) -> str:
+        """Get the feature table of a parent table.
+
+        Args:
+            table (str): Parent table name
+
+        Returns:
+            str: Feature table name
+        """
+        return f"{table}-{cls.SUFFIX}"
+
+    @classmethod
+    def is_feature_table(cls, table: str) -> bool:
+        """Check whether a table is a feature table.
+
+        Args:
+            table (str): Table name
+
+        Returns:
+            bool: True for feature tables
+        """
+        return table.endswith(f"-{cls.SUFFIX}")
+
+    @classmethod
+    def file_path(cls, file_path: str) -> str:
+        """Get the feature file stored next to a parent file.
+
+        Args:
+            file_path (str): Parent file path
+
+        Returns:
+            str: Feature file path
+        """
+        base, ext = os.path.splitext(file_path)
+        return f"{cls.table_name(base)}{ext}"
+
+    @staticmethod
+    def content_hash(series: pd.Series) -> np.ndarray:
+        """Hash every text of a column.
+
+        Args:
+            series (pd.Series): Text column
+
+        Returns:
+            np.ndarray: 64-bit fingerprint per row as signed int64, equal
+                for equal texts of any string dtype
+        """
+        return HashUtils.fingerprint(series.to_frame()).view(np.int64)
+
+    @classmethod
+    def build(cls,
+              df: pd.DataFrame,
+              column: str,
+              id_column: str = "id") -> pd.DataFrame:
+        """Build the features of a text column.
+
+        Args:
+            df (pd.DataFrame): Parent rows
+            column (str): Text column to describe
+            id_column (str, optional): Parent id column. Defaults to "id".
+
+        Returns:
+            pd.DataFrame: One row per parent row with int64 sizes, token
+                estimates of characters / 4 as FilterBySizePipe measures
+                them, and 64-bit fingerprints of the column as signed
+                int64 content hashes; missing texts have size 0
+        """
+        strings = SeriesUtils.as_strings(df[column])
+        chars = SeriesUtils.lengths(strings, "chars").fillna(0)
+        chars = chars.to_numpy(dtype=np.int64)
+        nbytes = SeriesUtils.lengths(strings, "bytes").fillna(0)
+        nbytes = nbytes.to_numpy(dtype=np.int64)
+        # Only texts with multi-byte characters are scanned for non-ASCII
+        ratio = np.zeros(len(df))
+        wide = nbytes != chars
+        if wide.any():
+            ratio[wide] = SeriesUtils.ratio(strings[wide],
+                                            r"[^\x00-\x7F]").fillna(0)
+        partial = strings.str.match(TextUtils.PARTIAL_EXTRACT_INTRO,
+                                    case=False).fillna(False)
+        return pd.DataFrame({
+            "id": df[id_column].to_numpy(),
+            "column": pd.Categorical([column] * len(df)),
+            "char_length": chars,
+            "byte_length": nbytes,
+            "token_estimate": chars / 4,
+            "content_hash": cls.content_hash(df[column]),
+            "non_ascii_ratio": ratio,
+            "is_partial": partial.to_numpy(dtype=bool),
+        })
+
+    @classmethod
+    def read(cls, file_path: str, dataset_type: str, column: str,
+             features: List[str]) -> Optional[pd.DataFrame]:
+        """Read the features of a column stored next to a parent file.
+
+        Args:
+            file_path (str): Parent file path
+            dataset_type (str): File type, e.g. "parquet" or "csv"
+            column (str): Described text column
+            features (List[str]): Feature columns to read
+
+        Returns:
+            Optional[pd.DataFrame]: Features indexed by id, or None without
+                a feature file or features of the column
+        """
+        path = cls.file_path(file_path) if file_path else ""
+        if not os.path.exists(path):
+            return None
+        df = CommandUtils.read_data(path, dataset_type,
+                                    ["id", "column", *features])
+        df = df[df["column"].astype(str) == column]
+        if df.empty:
+            return None
+        return df.drop_duplicates("id").set_index("id")[features]
+
+    @staticmethod
+    def lookup(features: Optional[pd.DataFrame], ids: pd.Series,
+               feature: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get one feature for every row id.
+
+        Args:
+            features (Optional[pd.DataFrame]): Features indexed by id
+            ids (pd.Series): Id per row
+            feature (str): Feature column
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Feature per row as float64, NaN
+                where unknown, and whether each row has features
+        """
+        if features is None:
+            return np.full(len(ids), np.nan), np.zeros(len(ids), bool)
+        positions = features.index.get_indexer(ids)
+        known = positions >= 0
+        values = features[feature].to_numpy(dtype=np.float64)[positions]
+        return np.where(known, values, np.nan), known
@@ -0,0 +1,297 @@
+"""Hash Utility Module.
+
+This module provides vectorized hashing primitives for deduplication:
+fixed-width row fingerprints, character shingling, MinHash signatures, LSH
+banding and SimHash.
+
+Functions:
+    None
+
+Classes:
+    HashUtils: Vectorized hashing helpers built on numpy.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence
+
+import numpy as np
+import pandas as pd
+
+__version__ = "0.0.4"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+MASK64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+EMPTY_HASH = np.uint32(0xFFFFFFFF)
+SHINGLE_BLOCK = 4096
+FINGERPRINT_KEYS = ("0123456789123456", "thinking-dataset")
+HEX_BYTES = np.array([f"{byte:02x}" for byte in range(256)], dtype="U2")
+
+
+class HashUtils:
+    """Vectorized hashing helpers built on numpy.
+
+    This class:
+    1. Mixes 64-bit integers with the splitmix64 finalizer
+    2. Fingerprints DataFrame rows into 64 or 128-bit hashes
+    3. Hashes character shingles of a document with a rolling hash
+    4. Computes MinHash signatures in batches, optionally multiprocess
+    5. Derives LSH band keys from signatures
+    6. Computes 64-bit SimHash fingerprints and their Hamming distances
+    7. Formats 64-bit hashes as fixed-width hex strings
+
+    All arithmetic wraps modulo 2**64, so hashes are stable across runs and
+    platforms.
+    """
+
+    @staticmethod
+    def mix64(values: np.ndarray) -> np.ndarray:
+        """Scramble 64-bit integers with the splitmix64 finalizer.
+
+        Args:
+            values (np.ndarray): Unsigned 64-bit integers
+
+        Returns:
+            np.ndarray: Mixed values with the same shape
+        """
+        with np.errstate(over="ignore"):
+            z = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+            z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+            z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+            return z ^ (z >> np.uint64(31))
+
+    @staticmethod
+    def fingerprint(df: pd.DataFrame, bits: int = 64) -> np.ndarray:
+        """Hash every row of a DataFrame into a fixed-width fingerprint.
+
+        Rows are hashed by pandas' vectorized hashing, one pass per 64-bit
+        half, so the result does not depend on the index and equal rows
+        always share a fingerprint.
+
+        Args:
+            df (pd.DataFrame): Columns to fingerprint
+            bits (int, optional): 64 or 128. Defaults to 64.
+
+        Returns:
+            np.ndarray: uint64 array of shape (rows,) for 64 bits or
+                (rows, 2) for 128 bits
+        """
+        if bits not in (64, 128):
+            raise ValueError("Fingerprint bits must be 64 or 128")
+        halves = [
+            pd.util.hash_pandas_object(df, index=False,
+                                       hash_key=key).to_numpy()
+            for key in FINGERPRINT_KEYS[:bits // 64]
+        ]
+        return halves[0] if bits == 64 else np.column_stack(halves)
+
+    @staticmethod
+    def to_hex(values: np.ndarray) -> np.ndarray:
+        """Format 64-bit hashes as 16-digit lowercase hex strings.
+
+        Every byte is looked up in a table, so no Python-level formatting
+        runs per value.
+
+        Args:
+            values (np.ndarray): Unsigned 64-bit integers
+
+        Returns:
+            np.ndarray: Unicode array of hex strings
+        """
+        data = np.ascontiguousarray(values, dtype=">u8").view(np.uint8)
+        return HEX_BYTES[data.reshape(-1, 8)].view("U16").ravel()
+
+    @classmethod
+    def shingles(cls, text: str, size: int = 5) -> np.ndarray:
+        """Hash the distinct character shingles of a document.
+
+        The text is lowercased and whitespace runs collapse to one space, so
+        documents differing only in case or spacing share their shingles.
+
+        Args:
+            text (str): Input document
+            size (int, optional): Shingle length in bytes. Defaults to 5.
+
+        Returns:
+            np.ndarray: Sorted distinct uint64 shingle hashes
+        """
+        data = " ".join(str(text).lower().split()).encode("utf-8")
+        if not data:
+            return np.empty(0, dtype=np.uint64)
+        codes = np.frombuffer(data, dtype=np.uint8).astype(np.uint64)
+        if len(codes) < size:
+            return cls.mix64(np.array([codes.sum()], dtype=np.uint64))
+
+        windows = np.lib.stride_tricks.sliding_window_view(codes, size)
+        powers = np.uint64(257)**np.arange(size, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            hashes = (windows * powers).sum(axis=1, dtype=np.uint64)
+        return np.unique(cls.mix64(hashes))
+
+    @classmethod
+    def permutation_seeds(cls, num_perm: int, seed: int = 1) -> np.ndarray:
+        """Get the per-permutation seeds of a MinHash family.
+
+        Args:
+            num_perm (int): Number of permutations
+            seed (int, optional): Family seed. Defaults to 1.
+
+        Returns:
+            np.ndarray: uint64 seed per permutation
+        """
+        base = np.arange(num_perm, dtype=np.uint64) + np.uint64(seed << 32)
+        return cls.mix64(base)
+
+    @classmethod
+    def minhash(cls,
+                texts: Sequence[str],
+                num_perm: int = 64,
+                shingle_size: int = 5,
+                seed: int = 1) -> np.ndarray:
+        """Compute MinHash signatures for a batch of documents.
+
+        Args:
+            texts (Sequence[str]): Documents
+            num_perm (int, optional): Signature length. Defaults to 64.
+            shingle_size (int, optional): Shingle length. Defaults to 5.
+            seed (int, optional): Family seed. Defaults to 1.
+
+        Returns:
+            np.ndarray: uint32 matrix of shape (len(texts), num_perm); empty
+                documents get an all-max signature
+        """
+        seeds = cls.permutation_seeds(num_perm, seed)[:, None]
+        signatures = np.full((len(texts), num_perm),
+                             EMPTY_HASH,
+                             dtype=np.uint32)
+        for row, text in enumerate(texts):
+            shingles = cls.shingles(text, shingle_size)
+            if not len(shingles):
+                continue
+            minimum = np.full(num_perm, MASK64, dtype=np.uint64)
+            for start in range(0, len(shingles), SHINGLE_BLOCK):
+                block = shingles[None, start:start + SHINGLE_BLOCK]
+                permuted = cls.mix64(block ^ seeds).min(axis=1)
+                np.minimum(minimum, permuted, out=minimum)
+            signatures[row] = minimum >> np.uint64(32)
+        return signatures
+
+    @classmethod
+    def minhash_batches(cls,
+                        texts: Sequence[str],
+                        num_perm: int = 64,
+                        shingle_size: int = 5,
+                        seed: int = 1,
+                        batch_size: int = 10000,
+                        workers: int = 1) -> np.ndarray:
+        """Compute MinHash signatures in batches, optionally multiprocess.
+
+        Args:
+            texts (Sequence[str]): Documents
+            num_perm (int, optional): Signature length. Defaults to 64.
+            shingle_size (int, optional): Shingle length. Defaults to 5.
+            seed (int, optional): Family seed. Defaults to 1.
+            batch_size (int, optional): Documents per batch.
+                Defaults to 10000.
+            workers (int, optional): Worker processes, 1 runs in-process.
+                Defaults to 1.
+
+        Returns:
+            np.ndarray: uint32 matrix of shape (len(texts), num_perm)
+        """
+        batches: List[Sequence[str]] = [
+            texts[start:start + batch_size]
+            for start in range(0, len(texts), batch_size)
+        ]
+        if not batches:
+            return np.empty((0, num_perm), dtype=np.uint32)
+        if workers <= 1 or len(batches) == 1:
+            results = [
+                cls.minhash(batch, num_perm, shingle_size, seed)
+                for batch in batches
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(cls.minhash, batches,
+                                 [num_perm] * len(batches),
+                                 [shingle_size] * len(batches),
+                                 [seed] * len(batches)))
+        return np.concatenate(results)
+
+    @classmethod
+    def band_keys(cls, signatures: np.ndarray, bands: int) -> np.ndarray:
+        """Hash each LSH band of every signature into one key.
+
+        Args:
+            signatures (np.ndarray): Matrix of shape (rows, num_perm)
+            bands (int): Number of bands, must divide num_perm
+
+        Returns:
+            np.ndarray: uint64 matrix of shape (rows, bands)
+        """
+        rows, num_perm = signatures.shape
+        width = num_perm // bands
+        keys = np.zeros((rows, bands), dtype=np.uint64)
+        for offset in range(width):
+            column = signatures[:, offset::width][:, :bands]
+            keys = cls.mix64(keys ^ column.astype(np.uint64))
+        return keys
+
+    @staticmethod
+    def optimal_bands(num_perm: int, threshold: float) -> int:
+        """Pick the band count whose LSH threshold is closest to a target.
+
+        The similarity at which a pair becomes a candidate with probability
+        1/2 is roughly (1 / bands) ** (1 / rows).
+
+        Args:
+            num_perm (int): Signature length
+            threshold (float): Target Jaccard similarity
+
+        Returns:
+            int: Number of bands dividing num_perm
+        """
+        divisors = [b for b in range(1, num_perm + 1) if num_perm % b == 0]
+        return min(divisors,
+                   key=lambda b: abs((1 / b)**(b / num_perm) - threshold))
+
+    @classmethod
+    def simhash(cls, text: str, shingle_size: int = 5) -> int:
+        """Compute the 64-bit SimHash of a document.
+
+        Every distinct shingle votes on each bit of the result, so documents
+        sharing most shingles differ in few bits.
+
+        Args:
+            text (str): Input document
+            shingle_size (int, optional): Shingle length. Defaults to 5.
+
+        Returns:
+            int: Unsigned 64-bit SimHash, 0 for empty documents
+        """
+        shingles = cls.shingles(text, shingle_size)
+        if not len(shingles):
+            return 0
+        positions = np.arange(64, dtype=np.uint64)
+        votes = np.zeros(64, dtype=np.int64)
+        for start in range(0, len(shingles), SHINGLE_BLOCK):
+            block = shingles[start:start + SHINGLE_BLOCK, None]
+            votes += ((block >> positions) & np.uint64(1)).sum(axis=0,
+                                                               dtype=np.int64)
+        bits = (2 * votes > len(shingles)).astype(np.uint64) << positions
+        return int(np.bitwise_or.reduce(bits))
+
+    @staticmethod
+    def hamming(left: int, right: int) -> int:
+        """Count the differing bits of two 64-bit hashes.
+
+        Args:
+            left (int): First hash
+            right (int): Second hash
+
+        Returns:
+            int: Hamming distance
+        """
+        return bin((left ^ right) & 0xFFFFFFFFFFFFFFFF).count("1")
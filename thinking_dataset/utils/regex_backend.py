@@ -0,0 +1,317 @@
+"""Regex Backend Module.
+
+This module provides a pluggable regular expression backend for the text
+utilities, allowing each named pattern to run on the stdlib ``re`` engine,
+the ``regex`` module or a linear-time RE2 engine when it is installed.
+
+Functions:
+    None
+
+Classes:
+    RegexTimeoutError: Raised when a document exceeds its time budget.
+    RegexBackend: Compiles and executes named patterns on a chosen engine.
+"""
+
+import importlib
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from thinking_dataset.utils.log import Log
+
+__version__ = "0.0.2"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+ENGINES = ("re", "regex", "re2")
+INLINE_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+
+
+class RegexTimeoutError(RuntimeError):
+    """Exception raised when a document exceeds its regex time budget."""
+    pass
+
+
+class RegexBackend:
+    """Pluggable regex engine used by all TextUtils functions.
+
+    This class:
+    1. Resolves an engine per named pattern (default plus overrides)
+    2. Compiles and caches patterns per engine, flags and pattern text
+    3. Falls back to ``re`` when an engine is missing or rejects a pattern
+    4. Enforces an optional per-document time budget
+
+    The ``re2`` engine runs in linear time but does not support lookaround
+    or backreferences and treats ``\\w``/``\\s`` as ASCII; patterns it cannot
+    compile transparently run on ``re`` instead. The ``regex`` engine can
+    interrupt a single runaway match, while ``re`` can only be checked
+    between calls, so one catastrophic ``re`` match runs to completion.
+
+    Attributes:
+        backend (str): Default engine name
+        overrides (Dict[str, str]): Engine per pattern name
+        timeout (float): Per-document budget in seconds, 0 disables it
+    """
+
+    backend: str = "re"
+    overrides: Dict[str, str] = {}
+    timeout: float = 0.0
+
+    _modules: Dict[str, Any] = {}
+    _compiled: Dict[Tuple[str, str, int], Tuple[str, Any]] = {}
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    @classmethod
+    def configure(cls,
+                  backend: str = "re",
+                  overrides: Optional[Dict[str, str]] = None,
+                  timeout: float = 0.0) -> None:
+        """Configure the default engine, per-pattern overrides and budget.
+
+        Args:
+            backend (str, optional): Default engine. Defaults to "re".
+            overrides (Optional[Dict[str, str]]): Engine per pattern name.
+            timeout (float, optional): Per-document budget in seconds.
+                Defaults to 0 (disabled).
+
+        Raises:
+            ValueError: If an engine name is unknown or timeout is negative
+        """
+        overrides = overrides or {}
+        for engine in [backend, *overrides.values()]:
+            if engine not in ENGINES:
+                raise ValueError(f"Unknown regex backend '{engine}', "
+                                 f"expected one of {list(ENGINES)}")
+        if not isinstance(timeout, (int, float)) or timeout < 0:
+            raise ValueError("Regex timeout must be a non-negative number")
+
+        cls.backend = backend
+        cls.overrides = dict(overrides)
+        cls.timeout = float(timeout)
+        Log.info(f"Regex backend: {backend}, overrides: {cls.overrides}, "
+                 f"timeout: {cls.timeout}s")
+
+    @classmethod
+    @contextmanager
+    def settings(cls, **config: Any) -> Iterator[None]:
+        """Configure the backend for the block and restore it afterwards.
+
+        Compiled patterns are cached per engine, so they stay valid when
+        the previous settings return.
+
+        Args:
+            **config: Arguments of configure()
+
+        Yields:
+            None
+        """
+        previous = (cls.backend, cls.overrides, cls.timeout)
+        cls.configure(**config)
+        try:
+            yield
+        finally:
+            cls.backend, cls.overrides, cls.timeout = previous
+
+    @classmethod
+    def reset(cls) -> None:
+        """Restore the stdlib defaults and drop compiled patterns."""
+        cls.backend = "re"
+        cls.overrides = {}
+        cls.timeout = 0.0
+        with cls._lock:
+            cls._compiled.clear()
+
+    @classmethod
+    def available(cls, engine: str) -> bool:
+        """Check whether an engine can be imported.
+
+        Args:
+            engine (str): Engine name
+
+        Returns:
+            bool: True if the engine module is installed
+        """
+        return cls._load(engine) is not None
+
+    @classmethod
+    def engine_for(cls, name: str) -> str:
+        """Get the configured engine for a named pattern.
+
+        Args:
+            name (str): Pattern name, usually the TextUtils function name
+
+        Returns:
+            str: Engine name
+        """
+        return cls.overrides.get(name, cls.backend)
+
+    @classmethod
+    def compile(cls,
+                name: str,
+                pattern: str,
+                flags: int = 0,
+                engine: Optional[str] = None) -> Tuple[str, Any]:
+        """Compile a pattern on its configured engine.
+
+        Args:
+            name (str): Pattern name used for engine overrides
+            pattern (str): Regular expression
+            flags (int, optional): ``re`` flags. Defaults to 0.
+            engine (Optional[str]): Force an engine instead of the configured
+                one.
+
+        Returns:
+            Tuple[str, Any]: (engine actually used, compiled pattern)
+        """
+        engine = engine or cls.engine_for(name)
+        key = (engine, pattern, flags)
+        compiled = cls._compiled.get(key)
+        if compiled is None:
+            compiled = cls._compile(name, engine, pattern, flags)
+            with cls._lock:
+                cls._compiled[key] = compiled
+        return compiled
+
+    @classmethod
+    def sub(cls,
+            name: str,
+            pattern: str,
+            repl: Union[str, Callable[[Any], str]],
+            text: str,
+            flags: int = 0,
+            engine: Optional[str] = None) -> str:
+        """Substitute a named pattern within the current time budget.
+
+        Args:
+            name (str): Pattern name used for engine overrides
+            pattern (str): Regular expression
+            repl (Union[str, Callable]): Replacement string or function
+            text (str): Input text
+            flags (int, optional): ``re`` flags. Defaults to 0.
+            engine (Optional[str]): Force an engine instead of the configured
+                one.
+
+        Returns:
+            str: Text with substitutions applied
+
+        Raises:
+            RegexTimeoutError: If the document exceeded its time budget
+        """
+        used, compiled = cls.compile(name, pattern, flags, engine)
+        remaining = cls._remaining(name)
+        if used != "regex" or remaining is None:
+            return compiled.sub(repl, text)
+        try:
+            return compiled.sub(repl, text, timeout=remaining)
+        except TimeoutError as e:
+            raise RegexTimeoutError(
+                f"Regex '{name}' exceeded the document time budget") from e
+
+    @classmethod
+    @contextmanager
+    def guard(cls, timeout: Optional[float] = None) -> Iterator[None]:
+        """Apply a time budget to all substitutions in the block.
+
+        Args:
+            timeout (Optional[float]): Budget in seconds, defaults to the
+                configured timeout. 0 disables the guard.
+
+        Yields:
+            None
+        """
+        budget = cls.timeout if timeout is None else timeout
+        previous = getattr(cls._local, "deadline", None)
+        cls._local.deadline = time.monotonic() + budget if budget else None
+        try:
+            yield
+        finally:
+            cls._local.deadline = previous
+
+    @classmethod
+    def _remaining(cls, name: str) -> Optional[float]:
+        """Get the remaining budget of the current document.
+
+        Args:
+            name (str): Pattern about to run
+
+        Returns:
+            Optional[float]: Seconds left, or None when no guard is active
+
+        Raises:
+            RegexTimeoutError: If the budget is already spent
+        """
+        deadline = getattr(cls._local, "deadline", None)
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RegexTimeoutError(
+                f"Document time budget spent before regex '{name}'")
+        return remaining
+
+    @classmethod
+    def _load(cls, engine: str) -> Optional[Any]:
+        """Import an engine module once.
+
+        Args:
+            engine (str): Engine name
+
+        Returns:
+            Optional[Any]: Engine module, or None if it is not installed
+        """
+        if engine not in cls._modules:
+            try:
+                cls._modules[engine] = importlib.import_module(engine)
+            except ImportError:
+                Log.warn(f"Regex backend '{engine}' is not installed, "
+                         "falling back to 're'")
+                cls._modules[engine] = None
+        return cls._modules[engine]
+
+    @classmethod
+    def _compile(cls, name: str, engine: str, pattern: str,
+                 flags: int) -> Tuple[str, Any]:
+        """Compile a pattern, falling back to ``re`` when needed.
+
+        Args:
+            name (str): Pattern name
+            engine (str): Requested engine
+            pattern (str): Regular expression
+            flags (int): ``re`` flags
+
+        Returns:
+            Tuple[str, Any]: (engine actually used, compiled pattern)
+        """
+        module = cls._load(engine) if engine != "re" else None
+        if module is None:
+            return "re", re.compile(pattern, flags)
+
+        inline = cls._inline_flags(flags)
+        try:
+            if engine == "re2":
+                options = module.Options()
+                options.log_errors = False
+                return engine, module.compile(inline + pattern, options)
+            return engine, module.compile(inline + pattern)
+        except Exception as e:
+            Log.debug(f"Regex '{name}' unsupported by {engine} ({e}), "
+                      "using 're'")
+            return "re", re.compile(pattern, flags)
+
+    @staticmethod
+    def _inline_flags(flags: int) -> str:
+        """Convert ``re`` flags into an inline flag group.
+
+        Args:
+            flags (int): ``re`` flags
+
+        Returns:
+            str: Inline group such as ``(?i)``, or an empty string
+        """
+        letters = "".join(letter for flag, letter in INLINE_FLAGS.items()
+                          if flags & flag)
+        return f"(?{letters})" if letters else ""
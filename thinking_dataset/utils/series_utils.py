@@ -0,0 +1,176 @@
+"""Series Utility Module.
+
+This module provides vectorized helpers for text columns, converting them
+to Arrow-backed strings when pyarrow is installed so that per-row signals
+run in compiled string kernels instead of Python loops.
+
+Functions:
+    None
+
+Classes:
+    SeriesUtils: Vectorized helpers for text columns.
+"""
+
+import pandas as pd
+
+__version__ = "0.0.3"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+
+class SeriesUtils:
+    """Vectorized helpers for text columns.
+
+    This class:
+    1. Converts text columns to Arrow-backed (or fallback) string dtype
+    2. Counts pattern matches and ratios per row without Python loops
+    3. Computes per-row line statistics in one exploded pass
+    4. Measures per-row sizes in characters, UTF-8 bytes or tokens
+    5. Detects columns holding only strings
+    """
+
+    @staticmethod
+    def is_text(series: pd.Series) -> bool:
+        """Check whether a column holds only strings and missing values.
+
+        Args:
+            series (pd.Series): Input column
+
+        Returns:
+            bool: True for string, categorical of strings and object
+                columns of strings
+        """
+        dtype = series.dtype
+        if isinstance(dtype, pd.StringDtype):
+            return True
+        if isinstance(dtype, pd.CategoricalDtype):
+            series = pd.Series(dtype.categories)
+        elif dtype != object:
+            return False
+        return pd.api.types.infer_dtype(series, skipna=True) == "string"
+
+    @staticmethod
+    def as_strings(series: pd.Series) -> pd.Series:
+        """Convert a column to a vectorizable string dtype.
+
+        Args:
+            series (pd.Series): Input column
+
+        Returns:
+            pd.Series: Column with Arrow-backed strings if pyarrow is
+                installed, pandas strings otherwise
+        """
+        if isinstance(series.dtype, (pd.StringDtype, pd.ArrowDtype)):
+            return series
+        try:
+            return series.astype(pd.StringDtype("pyarrow"))
+        except ImportError:
+            return series.astype(pd.StringDtype("python"))
+
+    @staticmethod
+    def lengths(series: pd.Series, metric: str = "chars") -> pd.Series:
+        """Measure the size of every row.
+
+        Arrow-backed columns use the pyarrow length kernels. Object columns
+        are measured in place, since converting them would copy every
+        string.
+
+        Args:
+            series (pd.Series): Input column
+            metric (str, optional): "chars", "bytes" (UTF-8) or "tokens"
+                (characters / 4). Defaults to "chars".
+
+        Returns:
+            pd.Series: Size per row (float, NaN for missing values)
+
+        Raises:
+            ValueError: If the metric is unknown
+        """
+        if metric not in ["chars", "bytes", "tokens"]:
+            raise ValueError(f"Unknown size metric: {metric}")
+
+        arrow = isinstance(series.dtype, pd.StringDtype) and \
+            series.dtype.storage == "pyarrow"
+        if metric != "bytes":
+            lengths = series.str.len()
+        elif arrow:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            lengths = pc.binary_length(pa.array(series.array)).to_numpy(
+                zero_copy_only=False)
+        else:
+            lengths = series.str.encode("utf-8").str.len()
+
+        lengths = pd.Series(pd.array(lengths, dtype="Float64").to_numpy(
+            dtype="float64", na_value=float("nan")),
+                            index=series.index)
+        return lengths / 4 if metric == "tokens" else lengths
+
+    @staticmethod
+    def count(strings: pd.Series, pattern: str) -> pd.Series:
+        """Count regex matches per row.
+
+        Args:
+            strings (pd.Series): String column from as_strings
+            pattern (str): RE2-compatible regular expression
+
+        Returns:
+            pd.Series: Match count per row (float, NaN for missing values)
+        """
+        return strings.str.count(pattern).astype("float64")
+
+    @classmethod
+    def ratio(cls, strings: pd.Series, pattern: str) -> pd.Series:
+        """Fraction of characters per row matching a single-char pattern.
+
+        Args:
+            strings (pd.Series): String column from as_strings
+            pattern (str): Single-character class, e.g. ``[0-9]``
+
+        Returns:
+            pd.Series: Ratio per row in [0, 1], 0 for empty rows and NaN
+                for missing values
+        """
+        lengths = strings.str.len().astype("float64")
+        counts = cls.count(strings, pattern)
+        return (counts / lengths.where(lengths > 0)).mask(lengths == 0, 0.0)
+
+    @classmethod
+    def mean_word_length(cls, strings: pd.Series) -> pd.Series:
+        """Mean word length per row.
+
+        Args:
+            strings (pd.Series): String column from as_strings
+
+        Returns:
+            pd.Series: Non-whitespace characters per word, 0 without words
+                and NaN for missing values
+        """
+        lengths = strings.str.len().astype("float64")
+        spaces = cls.count(strings, r"\s")
+        words = cls.count(strings, r"\S+")
+        return ((lengths - spaces) / words.where(words > 0)).mask(
+            words == 0, 0.0)
+
+    @staticmethod
+    def repeated_line_ratio(strings: pd.Series) -> pd.Series:
+        """Fraction of non-empty lines repeating an earlier line in the row.
+
+        Args:
+            strings (pd.Series): String column from as_strings
+
+        Returns:
+            pd.Series: Ratio per row in [0, 1], 0 for rows without lines
+        """
+        positions = pd.Series(strings.to_numpy(), dtype=strings.dtype)
+        lines = positions.str.split("\n").explode().dropna()
+        lines = SeriesUtils.as_strings(lines).str.strip()
+        lines = lines[lines.str.len() > 0]
+
+        frame = pd.DataFrame({"row": lines.index, "line": lines.to_numpy()})
+        repeated = frame.duplicated().groupby(frame["row"]).agg(
+            ["sum", "count"])
+        ratio = (repeated["sum"] / repeated["count"]).reindex(
+            range(len(strings)), fill_value=0.0)
+        return pd.Series(ratio.to_numpy(), index=strings.index)
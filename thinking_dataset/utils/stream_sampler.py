@@ -0,0 +1,229 @@
+"""Stream Sampler Module.
+
+This module provides seeded random and stratified sampling of a fixed
+number of rows over streamed batches, holding no more than the sample in
+memory once the strata were counted.
+
+Functions:
+    None
+
+Classes:
+    StreamSampler: Bottom-k reservoir sampling over batch streams.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from thinking_dataset.utils.series_utils import SeriesUtils
+
+__version__ = "0.0.2"
+__author__ = "MultiTonic Team"
+__copyright__ = "Copyright (c) 2025 MultiTonic Team"
+__license__ = "MIT"
+
+ALLOCATIONS = ["proportional", "equal"]
+
+
+class StreamSampler:
+    """Bottom-k reservoir sampling over batch streams.
+
+    This class:
+    1. Draws one seeded uniform key per streamed row
+    2. Keeps the rows with the smallest keys per stratum, which is a
+       uniform sample of the rows seen so far
+    3. Allocates the sample size across strata once all rows were counted
+    4. Returns the sampled rows in their original order
+
+    Keys are drawn in row order from a single generator, so a seed gives
+    the same sample for any batch size. Without a stratify column every row
+    belongs to one stratum. With one, the strata should be counted in a
+    first pass and the counts passed to sample(), which then allocates
+    first and keeps each stratum to its share of the sample size. Without
+    counts, every stratum keeps up to size rows until the end, so memory
+    grows with the number of strata.
+
+    Attributes:
+        size (int): Number of rows to sample
+        seed (int): Random seed
+        column (Optional[str]): Text column whose length defines strata
+        metric (str): Length metric of the stratify column
+        strata (Optional[List[float]]): Inner length bucket edges, or None
+            for power-of-two buckets
+        allocation (str): "proportional" or "equal" sample sizes per stratum
+    """
+
+    def __init__(self,
+                 size: int,
+                 seed: int = 42,
+                 column: Optional[str] = None,
+                 metric: str = "chars",
+                 strata: Optional[List[float]] = None,
+                 allocation: str = "proportional") -> None:
+        """Initialize the sampler.
+
+        Args:
+            size (int): Number of rows to sample
+            seed (int, optional): Random seed. Defaults to 42.
+            column (Optional[str], optional): Stratify column. Defaults to
+                None.
+            metric (str, optional): Length metric. Defaults to "chars".
+            strata (Optional[List[float]], optional): Inner bucket edges.
+                Defaults to None.
+            allocation (str, optional): Per-stratum allocation. Defaults to
+                "proportional".
+        """
+        self.size = size
+        self.seed = seed
+        self.column = column
+        self.metric = metric
+        self.strata = strata
+        self.allocation = allocation
+
+    def count(self, batches: Iterable[pd.DataFrame]) -> Dict[int, int]:
+        """Count the rows of every stratum in a batch stream.
+
+        Args:
+            batches (Iterable[pd.DataFrame]): Batches holding at least the
+                stratify column
+
+        Returns:
+            Dict[int, int]: Rows per stratum
+        """
+        counts: Dict[int, int] = {}
+        for batch in batches:
+            strata, sizes = np.unique(self._strata(batch), return_counts=True)
+            for stratum, size in zip(strata.tolist(), sizes.tolist()):
+                counts[stratum] = counts.get(stratum, 0) + size
+        return counts
+
+    def sample(self,
+               batches: Iterable[pd.DataFrame],
+               counts: Optional[Dict[int, int]] = None) -> pd.DataFrame:
+        """Sample rows from a batch stream.
+
+        Args:
+            batches (Iterable[pd.DataFrame]): Batches in row order
+            counts (Optional[Dict[int, int]], optional): Rows per stratum
+                from count() over the same stream. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Sampled rows in row order, indexed by their
+                position in the stream
+        """
+        rng = np.random.default_rng(self.seed)
+        reservoirs: Dict[int, pd.DataFrame] = {}
+        quotas = None if counts is None else self._quotas(counts)
+        counts = {}
+        template, offset = None, 0
+
+        for batch in batches:
+            if template is None:
+                template = batch.iloc[:0]
+            batch = batch.assign(_key=rng.random(len(batch)))
+            batch.index = pd.RangeIndex(offset, offset + len(batch))
+            offset += len(batch)
+            for stratum, rows in batch.groupby(self._strata(batch),
+                                               sort=False):
+                counts[stratum] = counts.get(stratum, 0) + len(rows)
+                limit = self.size if quotas is None else quotas.get(
+                    stratum, 0)
+                if limit:
+                    reservoirs[stratum] = self._merge(
+                        reservoirs.get(stratum), rows, limit)
+
+        if template is None:
+            return pd.DataFrame()
+        if quotas is None:
+            quotas = self._quotas(counts)
+        parts = [
+            reservoirs[stratum].nsmallest(quota, "_key")
+            for stratum, quota in sorted(quotas.items())
+            if quota and stratum in reservoirs
+        ]
+        if not parts:
+            return template
+        return pd.concat(parts).sort_index().drop(columns="_key")
+
+    def _strata(self, batch: pd.DataFrame) -> np.ndarray:
+        """Assign every row of a batch to a length stratum.
+
+        Args:
+            batch (pd.DataFrame): Input batch
+
+        Returns:
+            np.ndarray: Stratum per row
+        """
+        if self.column is None:
+            return np.zeros(len(batch), dtype=np.int64)
+        lengths = SeriesUtils.lengths(batch[self.column],
+                                      self.metric).fillna(0).to_numpy()
+        if self.strata is None:
+            return np.floor(np.log2(lengths + 1)).astype(np.int64)
+        return np.searchsorted(np.asarray(self.strata, dtype=float),
+                               lengths,
+                               side="right")
+
+    @staticmethod
+    def _merge(reservoir: Optional[pd.DataFrame], rows: pd.DataFrame,
+               limit: int) -> pd.DataFrame:
+        """Merge new rows into a stratum reservoir.
+
+        Args:
+            reservoir (Optional[pd.DataFrame]): Current reservoir
+            rows (pd.DataFrame): New rows of the stratum
+            limit (int): Reservoir size
+
+        Returns:
+            pd.DataFrame: The rows with the smallest keys, at most limit
+        """
+        if reservoir is not None:
+            if len(reservoir) >= limit:
+                rows = rows[rows["_key"] < reservoir["_key"].max()]
+            rows = pd.concat([reservoir, rows])
+        if len(rows) > limit:
+            rows = rows.nsmallest(limit, "_key")
+        return rows
+
+    def _quotas(self, counts: Dict[int, int]) -> Dict[int, int]:
+        """Allocate the sample size to counted strata.
+
+        Args:
+            counts (Dict[int, int]): Rows per stratum
+
+        Returns:
+            Dict[int, int]: Rows to sample per stratum
+        """
+        strata = sorted(counts)
+        quotas = self._allocate(np.array([counts[s] for s in strata]))
+        return dict(zip(strata, quotas.tolist()))
+
+    def _allocate(self, counts: np.ndarray) -> np.ndarray:
+        """Split the sample size across strata.
+
+        Proportional allocation rounds by largest remainder. Equal
+        allocation fills strata evenly and hands the share of exhausted
+        strata to the others.
+
+        Args:
+            counts (np.ndarray): Rows seen per stratum
+
+        Returns:
+            np.ndarray: Rows to sample per stratum
+        """
+        size = min(self.size, int(counts.sum()))
+        if self.allocation == "proportional":
+            exact = counts * size / max(int(counts.sum()), 1)
+            quotas = np.floor(exact).astype(np.int64)
+            order = np.argsort(quotas - exact, kind="stable")
+            quotas[order[:size - quotas.sum()]] += 1
+            return quotas
+
+        quotas = np.zeros(len(counts), dtype=np.int64)
+        while quotas.sum() < size:
+            open_ = np.flatnonzero(quotas < counts)
+            share = max((size - quotas.sum()) // len(open_), 1)
+            for index in open_[:size - quotas.sum()]:
+                quotas[index] += min(share, counts[index] - quotas[index])
+        return quotas
@@ -1,12 +1,14 @@
 # @file thinking_dataset/utils/text_utils.py
 # @description Utility functions for text processing in the thinking-dataset.
-# @version 1.1.3
+# @version 1.2.0
 # @license MIT
 
 import re
 from typing import Optional
 from lorem_text import lorem
 
+from thinking_dataset.utils.regex_backend import RegexBackend as Regex
+
 
 class TextUtils:
     """
@@ -16,6 +18,7 @@ class TextUtils:
     1. Provides methods for text truncation, size formatting, and normalization
     2. Handles text cleaning, contraction expansion, and special char removal
     3. Generates lorem ipsum text for testing purposes
+    4. Runs every pattern through the configurable RegexBackend
 
     Methods:
         truncate_text(text, max_length): Truncate text to a maximum length.
@@ -38,8 +41,16 @@ class TextUtils:
         remove_weird_dates(text): Remove weird dates from text.
         shorten_path(path, max_length): Shorten a path to a maximum length.
         generate_lorem_ipsum(paragraphs, char_limit): Generate random text.
+
+    Attributes:
+        PARTIAL_EXTRACT_INTRO (str): Case-insensitive pattern of the
+            partial-extract boilerplate opening some cables.
     """
 
+    PARTIAL_EXTRACT_INTRO = (
+        r'^this record is a partial extract of the original cable\.\s*'
+        r'the full text of the original cable is not available\.\s*')
+
     @staticmethod
     def truncate_text(text, max_length=240):
         """
@@ -87,8 +98,9 @@ class TextUtils:
             str: The text with expanded contractions.
         """
         for contraction, full_form in contractions.items():
-            text = re.sub(r'\b' + re.escape(contraction) + r'\b', full_form,
-                          text)
+            text = Regex.sub('expand_contractions',
+                             r'\b' + re.escape(contraction) + r'\b',
+                             full_form, text)
         return text
 
     @staticmethod
@@ -102,7 +114,7 @@ class TextUtils:
         Returns:
             str: The text without special characters.
         """
-        return re.sub(r'[^ -~]', '', text)
+        return Regex.sub('remove_special_characters', r'[^ -~]', '', text)
 
     @staticmethod
     def remove_separators(text):
@@ -115,8 +127,8 @@ class TextUtils:
         Returns:
             str: The text without separators.
         """
-        text = re.sub(r'-{4,}', '', text)
-        text = re.sub(r'--+', '', text)
+        text = Regex.sub('remove_separators', r'-{4,}', '', text)
+        text = Regex.sub('remove_separators', r'--+', '', text)
         return text
 
     @staticmethod
@@ -130,7 +142,7 @@ class TextUtils:
         Returns:
             str: The text without extra whitespace.
         """
-        text = re.sub(r'\s+', ' ', text)
+        text = Regex.sub('remove_whitespace', r'\s+', ' ', text)
         return text.strip()
 
     @staticmethod
@@ -144,7 +156,7 @@ class TextUtils:
         Returns:
             str: The text with normalized numbers.
         """
-        return re.sub(r'(\D)(\d)', r'\1 \2', text)
+        return Regex.sub('normalize_numbers', r'(\D)(\d)', r'\1 \2', text)
 
     @staticmethod
     def normalize_spaced_characters(text):
@@ -157,8 +169,9 @@ class TextUtils:
         Returns:
             str: The text with normalized spaced characters.
         """
-        return re.sub(r'(\b\w\s(?:\w\s)*\w\b)',
-                      lambda m: m.group(0).replace(' ', ''), text)
+        return Regex.sub('normalize_spaced_characters',
+                         r'(\b\w\s(?:\w\s)*\w\b)',
+                         lambda m: m.group(0).replace(' ', ''), text)
 
     @staticmethod
     def remove_partial_extract_intro(text):
@@ -171,12 +184,11 @@ class TextUtils:
         Returns:
             str: The text without partial extract intro.
         """
-        return re.sub(
-            r'^this record is a partial extract of the original cable\.\s*'
-            r'the full text of the original cable is not available\.\s*',
-            '',
-            text,
-            flags=re.IGNORECASE)
+        return Regex.sub('remove_partial_extract_intro',
+                         TextUtils.PARTIAL_EXTRACT_INTRO,
+                         '',
+                         text,
+                         flags=re.IGNORECASE)
 
     @staticmethod
     def remove_section_headers(text):
@@ -189,7 +201,11 @@ class TextUtils:
         Returns:
             str: The text without section headers.
         """
-        return re.sub(r'\d+\.\s*\([a-z]\)\s*', '', text, flags=re.IGNORECASE)
+        return Regex.sub('remove_section_headers',
+                         r'\d+\.\s*\([a-z]\)\s*',
+                         '',
+                         text,
+                         flags=re.IGNORECASE)
 
     @staticmethod
     def remove_signoff(text):
@@ -202,7 +218,7 @@ class TextUtils:
         Returns:
             str: The text without signoff.
         """
-        return re.sub(r'\.\s*\w*$', '.', text).strip()
+        return Regex.sub('remove_signoff', r'\.\s*\w*$', '.', text).strip()
 
     @staticmethod
     def remove_initial_pattern(text):
@@ -215,7 +231,11 @@ class TextUtils:
         Returns:
             str: The text without initial pattern.
         """
-        return re.sub(r'^r\s\d+z\s\w+\s\d{2}\s', '', text, flags=re.IGNORECASE)
+        return Regex.sub('remove_initial_pattern',
+                         r'^r\s\d+z\s\w+\s\d{2}\s',
+                         '',
+                         text,
+                         flags=re.IGNORECASE)
 
     @staticmethod
     def remove_period_patterns(text):
@@ -228,7 +248,7 @@ class TextUtils:
         Returns:
             str: The text without period patterns.
         """
-        return re.sub(r'(\.\s)+', '', text)
+        return Regex.sub('remove_period_patterns', r'(\.\s)+', '', text)
 
     @staticmethod
     def remove_header(text):
@@ -241,8 +261,11 @@ class TextUtils:
         Returns:
             str: The text without header.
         """
-        return re.sub(r'^.*?(subject:)', r'\1', text,
-                      flags=re.IGNORECASE).strip()
+        return Regex.sub('remove_header',
+                         r'^.*?(subject:)',
+                         r'\1',
+                         text,
+                         flags=re.IGNORECASE).strip()
 
     @staticmethod
     def expand_terms(text, terms):
@@ -257,9 +280,11 @@ class TextUtils:
             str: The text with expanded terms.
         """
         for abbr, full in terms.items():
-            pattern = re.compile(r'(?<!\w)' + re.escape(abbr) + r'(?!\w)',
-                                 re.IGNORECASE)
-            text = pattern.sub(' ' + full + ' ', text)
+            text = Regex.sub('expand_terms',
+                             r'(?<!\w)' + re.escape(abbr) + r'(?!\w)',
+                             ' ' + full + ' ',
+                             text,
+                             flags=re.IGNORECASE)
         return text
 
     @staticmethod
@@ -273,7 +298,8 @@ class TextUtils:
         Returns:
             str: The text without tiny parentheses content.
         """
-        return re.sub(r'\(\w{1,5}\)', '', text)
+        return Regex.sub('remove_tiny_parentheses_content', r'\(\w{1,5}\)', '',
+                         text)
 
     @staticmethod
     def remove_weird_ids(text):
@@ -286,7 +312,7 @@ class TextUtils:
         Returns:
             str: The text without weird IDs.
         """
-        return re.sub(r'\b\d{3,6}[a-z]+\b', '', text)
+        return Regex.sub('remove_weird_ids', r'\b\d{3,6}[a-z]+\b', '', text)
 
     @staticmethod
     def remove_weird_dates(text):
@@ -299,7 +325,8 @@ class TextUtils:
         Returns:
             str: The text without weird dates.
         """
-        return re.sub(r'\b\d{2}/\s?\d{2}/\s?\d{2}\b', '', text)
+        return Regex.sub('remove_weird_dates', r'\b\d{2}/\s?\d{2}/\s?\d{2}\b',
+                         '', text)
 
     @staticmethod
     def shorten_path(path: str, max_length: int) -> str: